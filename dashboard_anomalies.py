@@ -0,0 +1,295 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Anomaly Detection
+Objective: Flag unusual days in every region, category, segment and rep series at once
+
+Usage:
+    python dashboard_anomalies.py
+    python dashboard_anomalies.py --rows 500000 --top 20
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+import dashboard_rollups as time_rollups
+from dashboard_profiling import profiled
+
+ANOMALY_MEASURES = ['Net_Sales', 'Profit', 'Orders']
+
+# EWMA baseline with a 28-day span
+ALPHA = 2 / (28 + 1)
+
+# |z| at or above this flags a day; values are also clipped to this many deviations before
+# they update the baseline, so one spike does not mask the next (robust EWMA)
+THRESHOLD = 3.5
+
+# Days of history a series needs before it can be flagged
+WARMUP = 14
+
+# Deviation floor as a fraction of the baseline (sparse series can have near-zero variance)
+MIN_SCALE = 0.05
+
+# Series expecting fewer orders a day than this are too sparse to score (one big order is not an anomaly)
+MIN_ORDERS = 2
+
+# Up to this many missing days in a row between scored days count as zero (no orders); a longer gap
+# (e.g. from the history to a live feed) is missing data, and the baseline restarts after it
+MAX_GAP_DAYS = 7
+
+# =============================================================================
+# DETECTOR (ONE STEP = ONE DAY FOR EVERY SERIES)
+# =============================================================================
+
+class EWMADetector:
+    def __init__(self, shape, alpha=ALPHA, threshold=THRESHOLD, warmup=WARMUP):
+        """Running EWMA mean and variance for an array of series (e.g. series x measures)"""
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.mean = np.zeros(shape)
+        self.var = np.zeros(shape)
+        self.count = np.zeros(shape, dtype=np.int64)
+
+    def update(self, x):
+        """Score one new day for every series, then fold it in: O(1) per point
+
+        Returns (z-scores, expected values) against the baseline before this day.
+        """
+        x = np.asarray(x, dtype=float)
+        scale = np.maximum(np.sqrt(self.var), MIN_SCALE * np.abs(self.mean))
+        scale = np.maximum(scale, 1e-9)
+        ready = self.count >= self.warmup
+        first = self.count == 0
+
+        z = np.where(ready, (x - self.mean) / scale, 0.0)
+        expected = np.where(first, x, self.mean)
+
+        # Winsorize before updating so an anomaly does not drag the baseline with it
+        limit = self.threshold * scale
+        clipped = np.where(ready, np.clip(x, self.mean - limit, self.mean + limit), x)
+        delta = clipped - self.mean
+        self.mean = np.where(first, x, self.mean + self.alpha * delta)
+        self.var = np.where(first, 0.0, (1 - self.alpha) * (self.var + self.alpha * delta ** 2))
+        self.count += 1
+        return z, expected
+
+# =============================================================================
+# SERIES MATRIX
+# =============================================================================
+
+def series_matrix(daily, date_bounds=None):
+    """(labels, dates, values[series, day, measure]) for the overall series and every dimension value
+
+    daily is the daily rollup (dashboard_rollups.daily_rollup); missing days are zero.
+    """
+    start, end = date_bounds or (daily['Date'].min(), daily['Date'].max())
+    dates = pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq='D')
+
+    labels = [('All', 'All')]
+    blocks = [daily.groupby('Date')[ANOMALY_MEASURES].sum().reindex(dates, fill_value=0).to_numpy()[None]]
+    for dimension in time_rollups.ROLLUP_DIMENSIONS:
+        wide = daily.groupby(['Date', dimension])[ANOMALY_MEASURES].sum().unstack(dimension, fill_value=0)
+        wide = wide.reindex(dates, fill_value=0)
+        values = wide.columns.get_level_values(1).unique()
+        labels += [(dimension, value) for value in values]
+        # (measure, value) columns -> [value, day, measure]
+        blocks.append(np.stack([wide[m][values].to_numpy().T for m in ANOMALY_MEASURES], axis=-1))
+
+    return pd.DataFrame(labels, columns=['Dimension', 'Value']), dates, np.concatenate(blocks).astype(float)
+
+class SeriesAnomalies:
+    @profiled('detect_anomalies')
+    def __init__(self, labels, dates, values, **detector_options):
+        """Score every series and measure day by day; keeps the detector for incremental days"""
+        self.labels = labels
+        self.lookup = {tuple(label): i for i, label in enumerate(labels.itertuples(index=False))}
+        self.label_index = pd.MultiIndex.from_frame(labels)
+        self.detector_options = detector_options
+        self.detector = EWMADetector(values.shape[::2], **detector_options)
+        # Shared by every session; days appended from the live feed are scored under this lock
+        self._lock = threading.Lock()
+        self.last_date = None
+        # Last day of the initial build; later days were appended (live feed)
+        self.history_end = pd.Timestamp(dates[-1]) if len(dates) else None
+        # Flagged points only, one chunk per day with flags (merged into one chunk by table())
+        self.flags = []
+        for day, day_values in zip(dates, values.transpose(1, 0, 2)):
+            self.append_day(day, day_values)
+
+    def append_day(self, date, day_values):
+        """Score a newly arrived day ([series, measure] totals, zero where no orders) in O(1) per point"""
+        z, expected = self.detector.update(day_values)
+        sparse = expected[:, ANOMALY_MEASURES.index('Orders')] < MIN_ORDERS
+        z = np.where(sparse[:, None], 0.0, z)
+        self.last_date = pd.Timestamp(date)
+        row, measure = np.nonzero(np.abs(z) >= self.detector.threshold)
+        if len(row):
+            self.flags.append((np.full(len(row), self.last_date.to_datetime64()), row, measure,
+                               np.asarray(day_values, dtype=float)[row, measure], expected[row, measure],
+                               z[row, measure]))
+        return z
+
+    def rollup_values(self, daily, dates):
+        """[day, series, measure] totals of daily-rollup rows over dates (zero where a series has no orders)"""
+        dates = pd.DatetimeIndex(dates)
+        values = np.zeros((len(dates), len(self.labels), len(ANOMALY_MEASURES)))
+        day = dates.get_indexer(daily['Date'])
+        measures = daily[ANOMALY_MEASURES].to_numpy(dtype=float)
+
+        in_range = day >= 0
+        np.add.at(values, (day[in_range], self.lookup['All', 'All']), measures[in_range])
+        for dimension in time_rollups.ROLLUP_DIMENSIONS:
+            keys = pd.MultiIndex.from_arrays([np.full(len(daily), dimension, dtype=object), daily[dimension]])
+            series = self.label_index.get_indexer(keys)
+            # Values first seen after the model was built have no series yet; they count in 'All' only
+            known = in_range & (series >= 0)
+            np.add.at(values, (day[known], series[known]), measures[known])
+        return values
+
+    def extend(self, daily, through=None):
+        """Score the days of a daily rollup after the last scored day; returns the number appended
+
+        Days from the last scored day to the rollup's last (or through) are appended in order, a day
+        without rows counting as zero. After a gap of more than MAX_GAP_DAYS the detector restarts at
+        the first new day instead (the old baseline is stale), so the series warm up again.
+        """
+        with self._lock:
+            if self.last_date is not None:
+                daily = daily[daily['Date'] > self.last_date]
+            if through is not None:
+                daily = daily[daily['Date'] <= pd.Timestamp(through)]
+            if daily.empty:
+                return 0
+            start = daily['Date'].min()
+            if self.last_date is not None and (start - self.last_date).days - 1 <= MAX_GAP_DAYS:
+                start = self.last_date + pd.Timedelta(days=1)
+            elif self.last_date is not None:
+                self.detector = EWMADetector(self.detector.mean.shape, **self.detector_options)
+            dates = pd.date_range(start, daily['Date'].max(), freq='D')
+            for date, day_values in zip(dates, self.rollup_values(daily, dates)):
+                self.append_day(date, day_values)
+            return len(dates)
+
+    def series_index(self, filter_selections):
+        """Series shown for a selection: overall, or a single slicer value (None for combinations)"""
+        filters = dict(engine.normalize_filters(filter_selections))
+        if filters['customers'] is not None:
+            return None
+        active = [(engine.FILTER_COLUMNS[name], filters[name]) for name in ['regions', 'categories', 'segments']
+                  if filters[name]]
+        if filters['sales_rep'] != 'All':
+            active.append(('Sales_Rep', (filters['sales_rep'],)))
+        if not active:
+            return self.lookup['All', 'All']
+        if len(active) == 1 and len(active[0][1]) == 1:
+            return self.lookup.get((active[0][0], active[0][1][0]))
+        return None
+
+    def series_mask(self, filter_selections):
+        """Series inside a selection: overall, plus every dimension value the slicers keep"""
+        filters = dict(engine.normalize_filters(filter_selections))
+        selected = {engine.FILTER_COLUMNS[name]: filters[name] for name in ['regions', 'categories', 'segments']}
+        selected['Sales_Rep'] = () if filters['sales_rep'] == 'All' else (filters['sales_rep'],)
+        return np.array([dimension == 'All' or not selected[dimension] or value in selected[dimension]
+                         for dimension, value in self.lookup])
+
+    def table(self, date_range=None, series=None, include_appended=False):
+        """Flagged days (most extreme first): Date, Dimension, Value, Measure, Actual, Expected, Z
+
+        series is a series index or a boolean mask over the series. include_appended: a date range
+        reaching the last day of the initial build also covers the days appended since.
+        """
+        with self._lock:
+            if len(self.flags) > 1:
+                self.flags[:] = [tuple(np.concatenate(field) for field in zip(*self.flags))]
+            if self.flags:
+                dates, row, measure, actual, expected, z = self.flags[0]
+            else:
+                dates, row, measure = np.zeros(0, dtype='datetime64[ns]'), np.zeros(0, int), np.zeros(0, int)
+                actual = expected = z = np.zeros(0)
+            last_date = self.last_date
+
+        keep = np.ones(len(z), dtype=bool)
+        if date_range:
+            start, end = (pd.Timestamp(d) for d in date_range)
+            if include_appended and self.history_end is not None and end >= self.history_end:
+                end = max(end, last_date)
+            keep &= (dates >= start.to_datetime64()) & (dates <= end.to_datetime64())
+        if series is not None:
+            selected = np.zeros(len(self.labels), dtype=bool)
+            selected[series] = True
+            keep &= selected[row]
+
+        row, measure = row[keep], measure[keep]
+        table = pd.DataFrame({
+            'Date': pd.DatetimeIndex(dates[keep]),
+            'Dimension': self.labels['Dimension'].to_numpy()[row],
+            'Value': self.labels['Value'].to_numpy()[row],
+            'Measure': np.array(ANOMALY_MEASURES)[measure],
+            'Actual': actual[keep],
+            'Expected': expected[keep],
+            'Z': z[keep]
+        })
+        return table.reindex(table['Z'].abs().sort_values(ascending=False).index).reset_index(drop=True)
+
+@profiled()
+def build_series_anomalies(daily, date_bounds=None):
+    """Anomaly scores for every dimension series of a daily rollup"""
+    return SeriesAnomalies(*series_matrix(daily, date_bounds))
+
+@profiled()
+def daily_anomalies(daily_sales):
+    """Flagged days of a single daily series (e.g. a multi-slicer selection) with the same detector"""
+    if daily_sales.empty:
+        return SeriesAnomalies(pd.DataFrame([('All', 'All')], columns=['Dimension', 'Value']), [],
+                               np.zeros((1, 0, len(ANOMALY_MEASURES)))).table()
+    dates = pd.date_range(daily_sales['Date'].min(), daily_sales['Date'].max(), freq='D')
+    values = daily_sales.set_index('Date')[ANOMALY_MEASURES].reindex(dates, fill_value=0).to_numpy(dtype=float)
+    labels = pd.DataFrame([('All', 'All')], columns=['Dimension', 'Value'])
+    return SeriesAnomalies(labels, dates, values[None]).table()
+
+def chart_anomalies(model, daily_sales, filter_selections):
+    """Flagged days of the series a chart shows: precomputed when it is one series, else detected on it"""
+    series = model.series_index(filter_selections) if model is not None else None
+    if series is None:
+        return daily_anomalies(daily_sales)
+    return model.table(dict(engine.normalize_filters(filter_selections))['date_range'], series=series)
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """List the most extreme anomalies and time the batch and incremental paths"""
+
+    parser = argparse.ArgumentParser(description="Anomaly detection over every dimension time series")
+    parser.add_argument('--rows', type=int, default=None, help="Generate this many rows (default: 5,000-row dataset)")
+    parser.add_argument('--top', type=int, default=10, help="Anomalies to list")
+    args = parser.parse_args()
+
+    df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+    daily = time_rollups.daily_rollup(df)
+
+    labels, dates, values = series_matrix(daily)
+    start = time.perf_counter()
+    model = SeriesAnomalies(labels, dates[:-1], values[:, :-1])
+    elapsed = time.perf_counter() - start
+
+    # The last day arrives incrementally, as a completed live-feed day would
+    start = time.perf_counter()
+    model.extend(daily)
+    incremental = time.perf_counter() - start
+
+    table = model.table()
+    print(f"Series: {len(labels)} x {len(ANOMALY_MEASURES)} measures x {len(dates) - 1:,} days "
+          f"scored in {elapsed * 1000:.0f}ms ({elapsed / (len(dates) - 1) * 1e6:.0f}µs per day for all series)")
+    print(f"➕ One new day appended in {incremental * 1000:.1f}ms")
+    print(f"🚨 {len(table):,} anomalies (|z| >= {THRESHOLD})")
+    print(table.head(args.top).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
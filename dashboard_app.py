@@ -1,700 +1,1151 @@
-"""
-DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
-Professional Sales & Financial Dashboard
-Objective: Create interactive business dashboard for data-driven decision 
-"""
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import datetime as dt
-from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
-
-# =============================================================================
-# PAGE CONFIGURATION
-# =============================================================================
-
-st.set_page_config(
-    page_title="Sales Performance Dashboard",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main {
-        padding-top: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-    }
-    .dashboard-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .sidebar .sidebar-content {
-        background-color: #f8f9fa;
-    }
-    .stSelectbox > div > div > select {
-        background-color: white;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# =============================================================================
-# DATA GENERATION FUNCTION
-# =============================================================================
-
-@st.cache_data
-def load_sales_data():
-    """Generate comprehensive sales dataset for dashboard"""
-    
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    
-    # Define parameters
-    n_records = 5000
-    start_date = datetime(2022, 1, 1)
-    end_date = datetime(2024, 8, 31)
-    
-    # Generate date range
-    date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-    
-    # Product categories and products
-    categories = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books', 'Health & Beauty']
-    products = {
-        'Electronics': ['Smartphone', 'Laptop', 'Tablet', 'Headphones', 'Smart Watch'],
-        'Clothing': ['T-Shirt', 'Jeans', 'Dress', 'Jacket', 'Shoes'],
-        'Home & Garden': ['Furniture', 'Kitchen Appliance', 'Garden Tools', 'Home Decor', 'Lighting'],
-        'Sports': ['Running Shoes', 'Gym Equipment', 'Sports Apparel', 'Outdoor Gear', 'Fitness Tracker'],
-        'Books': ['Fiction', 'Non-Fiction', 'Educational', 'Children Books', 'E-Books'],
-        'Health & Beauty': ['Skincare', 'Makeup', 'Supplements', 'Personal Care', 'Fragrances']
-    }
-    
-    # Regions and sales reps
-    regions = ['North', 'South', 'East', 'West', 'Central']
-    sales_reps = ['Alice Johnson', 'Bob Smith', 'Carol Davis', 'David Brown', 'Eva Wilson',
-                  'Frank Miller', 'Grace Lee', 'Henry Taylor', 'Iris Chen', 'Jack Wilson']
-    
-    # Customer segments
-    segments = ['Enterprise', 'Small Business', 'Individual']
-    
-    # Generate synthetic data
-    records = []
-    
-    for i in range(n_records):
-        # Random date with seasonal patterns
-        date = np.random.choice(date_range)
-        month = date.month
-        
-        # Seasonal multiplier
-        seasonal_multiplier = 1.0
-        if month in [11, 12]:  # Holiday season
-            seasonal_multiplier = 1.4
-        elif month in [6, 7, 8]:  # Summer
-            seasonal_multiplier = 1.2
-        elif month in [1, 2]:  # Post-holiday
-            seasonal_multiplier = 0.8
-        
-        # Select category and product
-        category = np.random.choice(categories)
-        product = np.random.choice(products[category])
-        
-        # Generate sales data with realistic patterns
-        base_price = {
-            'Electronics': np.random.normal(300, 100),
-            'Clothing': np.random.normal(50, 20),
-            'Home & Garden': np.random.normal(150, 50),
-            'Sports': np.random.normal(80, 30),
-            'Books': np.random.normal(25, 10),
-            'Health & Beauty': np.random.normal(40, 15)
-        }[category]
-        
-        unit_price = max(10, base_price * seasonal_multiplier)
-        quantity = np.random.randint(1, 10)
-        gross_sales = unit_price * quantity
-        
-        # Calculate costs and profit
-        cost_rate = np.random.uniform(0.4, 0.7)
-        cost = gross_sales * cost_rate
-        profit = gross_sales - cost
-        discount = np.random.uniform(0, 0.15) if np.random.random() > 0.7 else 0
-        net_sales = gross_sales * (1 - discount)
-        
-        # Customer and order details
-        customer_id = f"CUST_{np.random.randint(1000, 9999)}"
-        order_id = f"ORD_{i+1:05d}"
-        
-        record = {
-            'Order_ID': order_id,
-            'Date': date,
-            'Year': date.year,
-            'Month': date.month,
-            'Month_Name': date.strftime('%B'),
-            'Quarter': f"Q{(date.month-1)//3 + 1}",
-            'Day_of_Week': date.strftime('%A'),
-            'Customer_ID': customer_id,
-            'Customer_Segment': np.random.choice(segments, p=[0.3, 0.4, 0.3]),
-            'Product_Category': category,
-            'Product_Name': product,
-            'Region': np.random.choice(regions),
-            'Sales_Rep': np.random.choice(sales_reps),
-            'Unit_Price': round(unit_price, 2),
-            'Quantity': quantity,
-            'Gross_Sales': round(gross_sales, 2),
-            'Discount': round(discount, 3),
-            'Net_Sales': round(net_sales, 2),
-            'Cost': round(cost, 2),
-            'Profit': round(profit, 2),
-            'Profit_Margin': round((profit / gross_sales) * 100, 2)
-        }
-        
-        records.append(record)
-    
-    # Create DataFrame
-    df = pd.DataFrame(records)
-    
-    # Add some calculated fields
-    df['Sales_Target'] = df['Net_Sales'] * np.random.uniform(0.8, 1.2, len(df))
-    df['Target_Achievement'] = (df['Net_Sales'] / df['Sales_Target']) * 100
-    df['Customer_Lifetime_Value'] = df.groupby('Customer_ID')['Net_Sales'].transform('sum')
-    
-    return df
-
-# =============================================================================
-# DASHBOARD FUNCTIONS
-# =============================================================================
-
-def create_kpi_metrics(df, filtered_df):
-    """Create KPI metrics cards"""
-    
-    # Current period metrics
-    total_sales = filtered_df['Net_Sales'].sum()
-    total_profit = filtered_df['Profit'].sum()
-    avg_profit_margin = filtered_df['Profit_Margin'].mean()
-    total_orders = len(filtered_df)
-    avg_order_value = filtered_df['Net_Sales'].mean()
-    unique_customers = filtered_df['Customer_ID'].nunique()
-    
-    # Previous period comparison (for growth calculation)
-    if len(filtered_df) > 0:
-        min_date = filtered_df['Date'].min()
-        max_date = filtered_df['Date'].max()
-        period_days = (max_date - min_date).days
-        
-        if period_days > 30:  # If more than 30 days, compare with previous period
-            prev_start = min_date - timedelta(days=period_days)
-            prev_end = min_date
-            prev_df = df[(df['Date'] >= prev_start) & (df['Date'] < prev_end)]
-            
-            prev_sales = prev_df['Net_Sales'].sum() if len(prev_df) > 0 else 1
-            sales_growth = ((total_sales - prev_sales) / prev_sales) * 100 if prev_sales > 0 else 0
-        else:
-            sales_growth = 0
-    else:
-        sales_growth = 0
-    
-    return {
-        'total_sales': total_sales,
-        'total_profit': total_profit,
-        'avg_profit_margin': avg_profit_margin,
-        'total_orders': total_orders,
-        'avg_order_value': avg_order_value,
-        'unique_customers': unique_customers,
-        'sales_growth': sales_growth
-    }
-
-def create_time_series_chart(df):
-    """Create time series sales chart"""
-    
-    # Group by date for time series
-    daily_sales = df.groupby('Date').agg({
-        'Net_Sales': 'sum',
-        'Profit': 'sum',
-        'Order_ID': 'count'
-    }).reset_index()
-    daily_sales.columns = ['Date', 'Net_Sales', 'Profit', 'Orders']
-    
-    # Create subplot
-    fig = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=['Daily Sales Trend', 'Daily Orders Count'],
-        vertical_spacing=0.1,
-        row_heights=[0.7, 0.3]
-    )
-    
-    # Sales trend
-    fig.add_trace(
-        go.Scatter(
-            x=daily_sales['Date'],
-            y=daily_sales['Net_Sales'],
-            mode='lines',
-            name='Net Sales',
-            line=dict(color='#1f77b4', width=2),
-            hovertemplate='<b>Date:</b> %{x}<br><b>Sales:</b> $%{y:,.0f}<extra></extra>'
-        ),
-        row=1, col=1
-    )
-    
-    # Orders count
-    fig.add_trace(
-        go.Scatter(
-            x=daily_sales['Date'],
-            y=daily_sales['Orders'],
-            mode='lines',
-            name='Orders',
-            line=dict(color='#ff7f0e', width=2),
-            hovertemplate='<b>Date:</b> %{x}<br><b>Orders:</b> %{y}<extra></extra>'
-        ),
-        row=2, col=1
-    )
-    
-    fig.update_layout(
-        height=500,
-        title_text="Sales Performance Over Time",
-        title_x=0.5,
-        showlegend=True,
-        template='plotly_white'
-    )
-    
-    return fig
-
-def create_category_analysis(df):
-    """Create category performance analysis"""
-    
-    # Group by category
-    category_metrics = df.groupby('Product_Category').agg({
-        'Net_Sales': 'sum',
-        'Profit': 'sum',
-        'Order_ID': 'count',
-        'Profit_Margin': 'mean'
-    }).reset_index()
-    
-    category_metrics.columns = ['Category', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin']
-    category_metrics = category_metrics.sort_values('Net_Sales', ascending=True)
-    
-    # Create horizontal bar chart
-    fig = go.Figure()
-    
-    fig.add_trace(
-        go.Bar(
-            y=category_metrics['Category'],
-            x=category_metrics['Net_Sales'],
-            orientation='h',
-            name='Net Sales',
-            marker_color='lightblue',
-            hovertemplate='<b>%{y}</b><br>Sales: $%{x:,.0f}<extra></extra>'
-        )
-    )
-    
-    fig.update_layout(
-        title="Sales by Product Category",
-        title_x=0.5,
-        xaxis_title="Net Sales ($)",
-        yaxis_title="Product Category",
-        height=400,
-        template='plotly_white'
-    )
-    
-    return fig
-
-def create_regional_performance(df):
-    """Create regional performance analysis"""
-    
-    # Group by region
-    regional_metrics = df.groupby('Region').agg({
-        'Net_Sales': 'sum',
-        'Profit': 'sum',
-        'Order_ID': 'count',
-        'Customer_ID': 'nunique'
-    }).reset_index()
-    
-    regional_metrics.columns = ['Region', 'Net_Sales', 'Profit', 'Orders', 'Customers']
-    
-    # Create pie chart for sales distribution
-    fig = px.pie(
-        regional_metrics,
-        values='Net_Sales',
-        names='Region',
-        title='Sales Distribution by Region',
-        color_discrete_sequence=px.colors.qualitative.Set3,
-        hover_data=['Orders', 'Customers']
-    )
-    
-    fig.update_traces(
-        textposition='inside',
-        textinfo='percent+label',
-        hovertemplate='<b>%{label}</b><br>Sales: $%{value:,.0f}<br>Orders: %{customdata[0]}<br>Customers: %{customdata[1]}<extra></extra>'
-    )
-    
-    fig.update_layout(
-        height=400,
-        title_x=0.5,
-        template='plotly_white'
-    )
-    
-    return fig
-
-def create_sales_rep_performance(df):
-    """Create sales rep performance analysis"""
-    
-    # Group by sales rep
-    rep_metrics = df.groupby('Sales_Rep').agg({
-        'Net_Sales': 'sum',
-        'Profit': 'sum',
-        'Order_ID': 'count',
-        'Customer_ID': 'nunique',
-        'Target_Achievement': 'mean'
-    }).reset_index()
-    
-    rep_metrics.columns = ['Sales_Rep', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_Target_Achievement']
-    rep_metrics = rep_metrics.sort_values('Net_Sales', ascending=False).head(10)
-    
-    # Create bar chart
-    fig = px.bar(
-        rep_metrics,
-        x='Sales_Rep',
-        y='Net_Sales',
-        title='Top 10 Sales Representatives Performance',
-        color='Avg_Target_Achievement',
-        color_continuous_scale='RdYlGn',
-        hover_data=['Profit', 'Orders', 'Customers']
-    )
-    
-    fig.update_layout(
-        height=400,
-        title_x=0.5,
-        xaxis_title="Sales Representative",
-        yaxis_title="Net Sales ($)",
-        xaxis_tickangle=-45,
-        template='plotly_white'
-    )
-    
-    return fig
-
-def create_customer_analysis(df):
-    """Create customer segment analysis"""
-    
-    # Group by customer segment
-    segment_metrics = df.groupby('Customer_Segment').agg({
-        'Net_Sales': 'sum',
-        'Profit': 'sum',
-        'Order_ID': 'count',
-        'Customer_ID': 'nunique',
-        'Customer_Lifetime_Value': 'mean'
-    }).reset_index()
-    
-    segment_metrics.columns = ['Segment', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_CLV']
-    
-    # Create subplot with multiple metrics
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=['Revenue by Segment', 'Customer Count by Segment'],
-        specs=[[{"type": "bar"}, {"type": "pie"}]]
-    )
-    
-    # Revenue bar chart
-    fig.add_trace(
-        go.Bar(
-            x=segment_metrics['Segment'],
-            y=segment_metrics['Net_Sales'],
-            name='Revenue',
-            marker_color='lightcoral',
-            hovertemplate='<b>%{x}</b><br>Revenue: $%{y:,.0f}<extra></extra>'
-        ),
-        row=1, col=1
-    )
-    
-    # Customer count pie chart
-    fig.add_trace(
-        go.Pie(
-            labels=segment_metrics['Segment'],
-            values=segment_metrics['Customers'],
-            name='Customers',
-            hovertemplate='<b>%{label}</b><br>Customers: %{value}<br>Percentage: %{percent}<extra></extra>'
-        ),
-        row=1, col=2
-    )
-    
-    fig.update_layout(
-        height=400,
-        title_text="Customer Segment Analysis",
-        title_x=0.5,
-        template='plotly_white'
-    )
-    
-    return fig
-
-def create_profitability_analysis(df):
-    """Create profitability analysis chart"""
-    
-    # Create scatter plot of sales vs profit
-    fig = px.scatter(
-        df,
-        x='Net_Sales',
-        y='Profit',
-        color='Product_Category',
-        size='Quantity',
-        hover_data=['Product_Name', 'Region', 'Profit_Margin'],
-        title='Sales vs Profit Analysis'
-    )
-    
-    fig.update_layout(
-        height=500,
-        title_x=0.5,
-        xaxis_title="Net Sales ($)",
-        yaxis_title="Profit ($)",
-        template='plotly_white'
-    )
-    
-    return fig
-
-# =============================================================================
-# MAIN DASHBOARD LAYOUT
-# =============================================================================
-
-def main():
-    """Main dashboard function"""
-    
-    # Header
-    st.markdown("""
-    <div class="dashboard-header">
-        <h1>🏢 Sales Performance Dashboard</h1>
-        <p>Interactive Business Intelligence Dashboard for Data-Driven Decision Making</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Load data
-    with st.spinner('Loading sales data...'):
-        df = load_sales_data()
-    
-    # Sidebar filters
-    st.sidebar.header("🔍 Dashboard Filters")
-    st.sidebar.markdown("---")
-    
-    # Date range filter
-    date_range = st.sidebar.date_input(
-        "Select Date Range",
-        value=(df['Date'].min(), df['Date'].max()),
-        min_value=df['Date'].min(),
-        max_value=df['Date'].max()
-    )
-    
-    # Region filter
-    regions = ['All'] + sorted(df['Region'].unique().tolist())
-    selected_regions = st.sidebar.multiselect(
-        "Select Region(s)",
-        options=regions,
-        default=['All']
-    )
-    
-    # Product Category filter
-    categories = ['All'] + sorted(df['Product_Category'].unique().tolist())
-    selected_categories = st.sidebar.multiselect(
-        "Select Product Category",
-        options=categories,
-        default=['All']
-    )
-    
-    # Customer Segment filter
-    segments = ['All'] + sorted(df['Customer_Segment'].unique().tolist())
-    selected_segments = st.sidebar.multiselect(
-        "Select Customer Segment",
-        options=segments,
-        default=['All']
-    )
-    
-    # Sales Rep filter
-    reps = ['All'] + sorted(df['Sales_Rep'].unique().tolist())
-    selected_reps = st.sidebar.selectbox(
-        "Select Sales Representative",
-        options=reps
-    )
-    
-    # Apply filters
-    filtered_df = df.copy()
-    
-    # Date filter
-    if len(date_range) == 2:
-        start_date, end_date = date_range
-        filtered_df = filtered_df[
-            (filtered_df['Date'] >= pd.Timestamp(start_date)) &
-            (filtered_df['Date'] <= pd.Timestamp(end_date))
-        ]
-    
-    # Region filter
-    if 'All' not in selected_regions and len(selected_regions) > 0:
-        filtered_df = filtered_df[filtered_df['Region'].isin(selected_regions)]
-    
-    # Category filter
-    if 'All' not in selected_categories and len(selected_categories) > 0:
-        filtered_df = filtered_df[filtered_df['Product_Category'].isin(selected_categories)]
-    
-    # Segment filter
-    if 'All' not in selected_segments and len(selected_segments) > 0:
-        filtered_df = filtered_df[filtered_df['Customer_Segment'].isin(selected_segments)]
-    
-    # Sales Rep filter
-    if selected_reps != 'All':
-        filtered_df = filtered_df[filtered_df['Sales_Rep'] == selected_reps]
-    
-    # Display filter summary
-    st.sidebar.markdown("---")
-    st.sidebar.write(f"**Filtered Records:** {len(filtered_df):,}")
-    st.sidebar.write(f"**Total Records:** {len(df):,}")
-    
-    # Main dashboard content
-    if len(filtered_df) == 0:
-        st.warning("⚠️ No data available for the selected filters. Please adjust your selection.")
-        return
-    
-    # KPI Metrics Row
-    st.markdown("## 📊 Key Performance Indicators")
-    kpi_metrics = create_kpi_metrics(df, filtered_df)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="💰 Total Sales",
-            value=f"${kpi_metrics['total_sales']:,.0f}",
-            delta=f"{kpi_metrics['sales_growth']:+.1f}%" if kpi_metrics['sales_growth'] != 0 else None
-        )
-        
-    with col2:
-        st.metric(
-            label="💵 Total Profit",
-            value=f"${kpi_metrics['total_profit']:,.0f}"
-        )
-        
-    with col3:
-        st.metric(
-            label="📈 Profit Margin",
-            value=f"{kpi_metrics['avg_profit_margin']:.1f}%"
-        )
-        
-    with col4:
-        st.metric(
-            label="📋 Total Orders",
-            value=f"{kpi_metrics['total_orders']:,}"
-        )
-    
-    # Second row of KPIs
-    col5, col6, col7, col8 = st.columns(4)
-    
-    with col5:
-        st.metric(
-            label="🛒 Avg Order Value",
-            value=f"${kpi_metrics['avg_order_value']:.0f}"
-        )
-        
-    with col6:
-        st.metric(
-            label="👥 Unique Customers",
-            value=f"{kpi_metrics['unique_customers']:,}"
-        )
-        
-    with col7:
-        st.metric(
-            label="🎯 Revenue per Customer",
-            value=f"${kpi_metrics['total_sales']/kpi_metrics['unique_customers']:.0f}"
-        )
-        
-    with col8:
-        st.metric(
-            label="📦 Orders per Customer",
-            value=f"{kpi_metrics['total_orders']/kpi_metrics['unique_customers']:.1f}"
-        )
-    
-    # Charts Row 1
-    st.markdown("---")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.plotly_chart(create_time_series_chart(filtered_df), use_container_width=True)
-        
-    with col2:
-        st.plotly_chart(create_regional_performance(filtered_df), use_container_width=True)
-    
-    # Charts Row 2
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        st.plotly_chart(create_category_analysis(filtered_df), use_container_width=True)
-        
-    with col4:
-        st.plotly_chart(create_customer_analysis(filtered_df), use_container_width=True)
-    
-    # Charts Row 3
-    st.plotly_chart(create_sales_rep_performance(filtered_df), use_container_width=True)
-    
-    # Profitability Analysis
-    st.plotly_chart(create_profitability_analysis(filtered_df), use_container_width=True)
-    
-    # Data Table
-    st.markdown("---")
-    st.markdown("## 📋 Detailed Data View")
-    
-    # Show summary statistics
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### Top 10 Products by Sales")
-        top_products = filtered_df.groupby('Product_Name')['Net_Sales'].sum().sort_values(ascending=False).head(10)
-        st.dataframe(top_products.reset_index())
-    
-    with col2:
-        st.markdown("### Top 10 Customers by Revenue")
-        top_customers = filtered_df.groupby('Customer_ID')['Net_Sales'].sum().sort_values(ascending=False).head(10)
-        st.dataframe(top_customers.reset_index())
-    
-    # Raw data view
-    with st.expander("🔍 View Raw Data"):
-        st.dataframe(
-            filtered_df[['Date', 'Order_ID', 'Customer_Segment', 'Product_Category', 
-                        'Product_Name', 'Region', 'Sales_Rep', 'Net_Sales', 'Profit', 'Profit_Margin']],
-            use_container_width=True
-        )
-    
-    # Download functionality
-    st.markdown("---")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        csv = filtered_df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Filtered Data (CSV)",
-            data=csv,
-            file_name=f"sales_data_filtered_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv"
-        )
-    
-    # Footer
-    st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: gray; font-size: 12px;">
-        📊 Sales Performance Dashboard | Data Analytics Internship - Task 5<br>
-        Built with Streamlit & Plotly | © 2025 Skillytixs Analytics
-    </div>
-    """, unsafe_allow_html=True)
-
-# =============================================================================
-# RUN APPLICATION
-# =============================================================================
-
-if __name__ == "__main__":
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Professional Sales & Financial Dashboard
+Objective: Create interactive business dashboard for data-driven decision 
+"""
+import streamlit as st
+from datetime import datetime
+import os
+import warnings
+
+import dashboard_anomalies as anomalies
+import dashboard_basket as basket
+import dashboard_cohorts as cohorts
+import dashboard_crossfilter as crossfilter
+import dashboard_engine as engine
+import dashboard_forecast as forecasting
+import dashboard_prewarm as prewarm
+import dashboard_profiling as profiling
+import dashboard_rfm as rfm
+import dashboard_rollups as time_rollups
+import dashboard_scenarios as scenarios
+import dashboard_security as security
+from dashboard_prefix import PrefixSums
+from dashboard_charts import (
+    plot_time_series_chart,
+    plot_category_analysis,
+    plot_regional_performance,
+    plot_sales_rep_performance,
+    plot_customer_analysis,
+    plot_product_breakdown,
+    plot_histogram,
+    plot_live_orders,
+    plot_cohort_heatmap,
+    plot_rfm_segments,
+    plot_product_affinity,
+    plot_scenarios,
+    HISTOGRAM_LABELS,
+    create_profitability_analysis,
+    create_period_comparison_chart
+)
+warnings.filterwarnings('ignore')
+
+# =============================================================================
+# PAGE CONFIGURATION
+# =============================================================================
+
+st.set_page_config(
+    page_title="Sales Performance Dashboard",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling
+st.markdown("""
+<style>
+    .main {
+        padding-top: 2rem;
+    }
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        margin-bottom: 1rem;
+    }
+    .dashboard-header {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 1rem;
+        border-radius: 10px;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .sidebar .sidebar-content {
+        background-color: #f8f9fa;
+    }
+    .stSelectbox > div > div > select {
+        background-color: white;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# =============================================================================
+# DATA LOADING
+# =============================================================================
+
+# Year/Month partitioned Parquet dataset (dashboard_storage.py) to read instead of generating data
+DATA_PATH = os.environ.get('DASHBOARD_DATA_PATH')
+
+# Execution backend for filters and aggregations: 'pandas' (default), 'duckdb' or
+# 'streaming' (out-of-core, needs DASHBOARD_DATA_PATH)
+BACKEND = os.environ.get('DASHBOARD_BACKEND', 'pandas')
+
+# Rows per streamed batch; sets the streaming backend's peak memory
+BATCH_SIZE = int(os.environ.get('DASHBOARD_BATCH_SIZE', 65_536))
+
+# Append-only order file (JSONL or CSV, see dashboard_live.py) shown as a live panel when set
+LIVE_PATH = os.environ.get('DASHBOARD_LIVE_PATH')
+
+# Seconds between live panel refreshes
+LIVE_REFRESH = float(os.environ.get('DASHBOARD_LIVE_REFRESH', 5))
+
+# Roles file (see dashboard_security.py); when set, each user only sees the rows of their role
+ROLES_PATH = os.environ.get('DASHBOARD_ROLES')
+
+# Request header carrying the signed-in user (set by the authenticating proxy); DASHBOARD_USER otherwise
+USER_HEADER = os.environ.get('DASHBOARD_USER_HEADER')
+
+# Usage log of the filter states sessions open (see dashboard_prewarm.py); when set, the most used
+# states are pre-warmed in the background after startup and after every dataset reload
+USAGE_LOG = os.environ.get('DASHBOARD_USAGE_LOG')
+
+# Pre-warm budget: states per run, seconds, and MB of cached results
+PREWARM_TOP = int(os.environ.get('DASHBOARD_PREWARM_TOP', prewarm.PREWARM_TOP))
+PREWARM_SECONDS = float(os.environ.get('DASHBOARD_PREWARM_SECONDS', prewarm.PREWARM_SECONDS))
+PREWARM_MB = float(os.environ.get('DASHBOARD_PREWARM_MB', prewarm.PREWARM_MB))
+
+@st.cache_data
+def load_sales_data():
+    """Load the cached sales dataset for the dashboard"""
+    profiling.mark_cache_miss()
+    if DATA_PATH:
+        from dashboard_storage import read_partitioned_dataset
+        return read_partitioned_dataset(DATA_PATH)
+    return engine.load_sales_data()
+
+@st.cache_data
+def load_dataset_info():
+    """Date bounds, row count and slicer options (read from the partition metadata when available)"""
+    profiling.mark_cache_miss()
+    if DATA_PATH:
+        from dashboard_storage import read_dataset_info
+        return read_dataset_info(DATA_PATH)
+    return engine.dataset_info(load_sales_data())
+
+@st.cache_resource
+def load_time_rollups():
+    """Build the multi-grain time rollups once per dataset (shared, read-only)"""
+    profiling.mark_cache_miss()
+    if DATA_PATH and BACKEND == 'streaming':
+        from dashboard_streaming import stream_time_rollups
+        return stream_time_rollups(DATA_PATH, BATCH_SIZE)
+    return time_rollups.build_time_rollups(load_sales_data())
+
+@st.cache_resource
+def load_series_anomalies():
+    """Anomaly scores of every dimension series from the daily rollup (completed live days extend it in O(1) per point)"""
+    profiling.mark_cache_miss()
+    rollups = load_time_rollups()
+    return anomalies.build_series_anomalies(rollups['daily'], rollups['date_bounds'])
+
+@st.cache_resource(max_entries=2)
+def load_forecast_model(dataset_version):
+    """Seasonal fit of every rep, region and category series, once per dataset version"""
+    profiling.mark_cache_miss()
+    rollups = load_time_rollups()
+    return forecasting.build_forecast_model(rollups['daily'], rollups['date_bounds'])
+
+@st.cache_resource(max_entries=2)
+def load_rfm_scores(dataset_version):
+    """RFM scores of every customer, once per dataset version (live orders are folded in place)"""
+    profiling.mark_cache_miss()
+    if DATA_PATH and BACKEND == 'streaming':
+        from dashboard_storage import iter_batches
+        columns = ['Customer_ID', 'Date', 'Order_ID', 'Net_Sales']
+        return rfm.RFMScores(rfm.fold_summaries(iter_batches(DATA_PATH, columns=columns, batch_size=BATCH_SIZE)))
+    return rfm.build_rfm_scores(load_sales_data())
+
+@st.cache_resource(max_entries=2)
+def load_rfm_feed(dataset_version):
+    """Reader of the live order file for the RFM scores (one per dataset version)"""
+    from dashboard_live import OrderFileTail
+    return OrderFileTail(LIVE_PATH)
+
+def current_rfm_scores(dataset_version):
+    """Cached RFM scores with new live orders folded in (only the customers they touch are rescored)"""
+    scores = load_rfm_scores(dataset_version)
+    if LIVE_PATH:
+        try:
+            scores.refresh(load_rfm_feed(dataset_version))
+        except EOFError:
+            # The feed restarted: rebuild from the dataset and read the new feed from its start
+            load_rfm_scores.clear()
+            load_rfm_feed.clear()
+            scores = load_rfm_scores(dataset_version)
+            scores.refresh(load_rfm_feed(dataset_version))
+    return scores
+
+@st.cache_resource
+def load_prefix_sums():
+    """Cumulative daily sums (overall and per slicer dimension) for range lookups"""
+    profiling.mark_cache_miss()
+    return PrefixSums(load_sales_data(), dimensions=list(engine.FILTER_COLUMNS.values()))
+
+@st.cache_resource
+def load_quantile_sketches():
+    """Per-cell t-digests of order value and margin (quantiles of any selection are a merge)"""
+    profiling.mark_cache_miss()
+    from dashboard_sketches import QuantileSketches
+    return QuantileSketches(load_sales_data())
+
+@st.cache_resource
+def load_binned_histograms():
+    """Linear and log bin counts per dimension cell (histograms of any selection are a sum)"""
+    profiling.mark_cache_miss()
+    from dashboard_histograms import BinnedHistograms
+    return BinnedHistograms(load_sales_data(), load_dataset_info().get('value_ranges'))
+
+@st.cache_resource
+def load_backend():
+    """Create the configured execution backend once per dataset (shared across sessions)"""
+    profiling.mark_cache_miss()
+    if DATA_PATH and BACKEND == 'duckdb':
+        # Query the partitions in place; Year/Month predicates skip files outside the range
+        return engine.get_backend(DATA_PATH, BACKEND)
+    if DATA_PATH and BACKEND == 'streaming':
+        return engine.get_backend(DATA_PATH, BACKEND, batch_size=BATCH_SIZE)
+    if BACKEND == 'pandas':
+        return engine.get_backend(load_sales_data(), BACKEND, prefix_sums=load_prefix_sums(),
+                                  sketches=load_quantile_sketches(), histograms=load_binned_histograms())
+    return engine.get_backend(load_sales_data(), BACKEND, prefix_sums=load_prefix_sums())
+
+@st.cache_resource(max_entries=16)
+def load_window_backend(window):
+    """Pandas backend over only the partitions a date window touches"""
+    profiling.mark_cache_miss()
+    from dashboard_storage import read_partitioned_dataset
+    return engine.get_backend(read_partitioned_dataset(DATA_PATH, window), 'pandas',
+                              value_ranges=load_dataset_info().get('value_ranges'))
+
+@st.cache_resource
+def load_roles():
+    """User -> entitlement from the roles file"""
+    return security.load_roles(ROLES_PATH)
+
+def current_entitlement():
+    """Entitlement of the signed-in user (None: not in the roles file, so no access)"""
+    if not ROLES_PATH:
+        return security.UNRESTRICTED
+    user = st.context.headers.get(USER_HEADER) if USER_HEADER else os.environ.get('DASHBOARD_USER')
+    return load_roles().get(user)
+
+@st.cache_resource(max_entries=16)
+def load_entitled_backend(entitled):
+    """Pandas backend over one entitlement's rows, compiled once and shared by every user holding it"""
+    profiling.mark_cache_miss()
+    # Quantile and histogram cells are per dimension value, so they answer the narrowed selections as is
+    return security.entitled_backend(load_sales_data(), entitled, sketches=load_quantile_sketches(),
+                                     histograms=load_binned_histograms())
+
+def get_backend(date_range, entitled=security.UNRESTRICTED):
+    """Backend for this rerun: a date-window slice of the partitions, or the shared full backend
+
+    Restricted users get the backend narrowed to their entitlement (in-memory pandas: only their rows).
+    """
+    if DATA_PATH and BACKEND == 'pandas' and len(date_range) == 2:
+        backend = load_window_backend(engine.kpi_data_window(date_range))
+    elif BACKEND == 'pandas' and entitled:
+        return load_entitled_backend(entitled)
+    else:
+        backend = load_backend()
+    return security.SecuredBackend(backend, entitled) if entitled else backend
+
+# Append every rerun's stage timings to this JSON-lines file when set
+PROFILE_LOG = os.environ.get('DASHBOARD_PROFILE_LOG')
+
+# =============================================================================
+# MAIN DASHBOARD LAYOUT
+# =============================================================================
+
+def show_chart(builder, *args, key=None):
+    """Build a figure and send it to the browser, timing each step (a key makes points clickable)"""
+    fig = builder(*args)
+    with profiling.stage(f"render:{builder.__name__}"):
+        if key is None:
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.plotly_chart(fig, use_container_width=True, key=key, on_select='rerun', selection_mode='points')
+
+# Cross-filter -> (chart widget key, selection point fields holding the clicked value)
+CROSSFILTER_CHARTS = {
+    'regions': ('xf_regions', ['label']),
+    'categories': ('xf_categories', ['y']),
+    'segments': ('xf_segments', ['x', 'label'])
+}
+
+def get_crossfilters():
+    """Values clicked on the region pie, category bars and segment chart"""
+    crossfilters = {}
+    for name, (key, fields) in CROSSFILTER_CHARTS.items():
+        event = st.session_state.get(key)
+        values = sorted({v for field in fields for v in crossfilter.selection_values(event, field)})
+        if values:
+            crossfilters[name] = values
+    return crossfilters
+
+def clear_crossfilters():
+    """Drop every chart selection"""
+    for key, _ in CROSSFILTER_CHARTS.values():
+        st.session_state.pop(key, None)
+
+@st.cache_resource(max_entries=8)
+def load_crossfilter_cube(filter_key, entitled, _backend, _filter_selections):
+    """Cross-filter cube for one sidebar selection (built on the first click, then reused)"""
+    profiling.mark_cache_miss()
+    date_range = dict(filter_key)['date_range']
+    window = {'date_range': engine.kpi_data_window(date_range)} if date_range else {}
+    return crossfilter.CrossFilterCube(
+        _backend.fetch_rows(_filter_selections), _backend.daily_sales(window), _backend.value_ranges
+    )
+
+@st.cache_data(max_entries=16)
+def load_selection_metrics(filter_key, crossfilter_key, entitled, _backend, _filter_selections):
+    """KPIs, quantiles and chart aggregates of a selection, computed together and cached per selection"""
+    profiling.mark_cache_miss()
+    category_quantiles = _backend.quantile_metrics(_filter_selections, 'Product_Category')
+    return {
+        'kpis': _backend.kpi_metrics(_filter_selections),
+        'quantiles': _backend.quantile_metrics(_filter_selections),
+        'daily_sales': _backend.daily_sales(_filter_selections),
+        'regions': _backend.regional_metrics(_filter_selections).merge(
+            _backend.quantile_metrics(_filter_selections, 'Region'), on='Region', how='left'
+        ),
+        'categories': _backend.category_metrics(_filter_selections).merge(
+            category_quantiles.rename(columns={'Product_Category': 'Category'}), on='Category', how='left'
+        ),
+        'segments': _backend.segment_metrics(_filter_selections),
+        'sales_reps': _backend.sales_rep_metrics(_filter_selections),
+        'top_products': _backend.top_products(_filter_selections),
+        'top_customers': _backend.top_customers(_filter_selections)
+    }
+
+def render_time_comparison(filter_selections):
+    """Time comparison section driven by the precomputed rollups"""
+    
+    st.markdown("## 📅 Time Comparison")
+    
+    with profiling.stage('load_time_rollups', cache='hit'):
+        rollups = load_time_rollups()
+    
+    measures = {'Net_Sales': 'Net Sales ($)', 'Profit': 'Profit ($)', 'Orders': 'Orders'}
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        grain = st.selectbox(
+            "Time Grain",
+            options=list(time_rollups.ROLLUP_GRAINS),
+            index=2,
+            format_func=str.title
+        )
+        
+    with col2:
+        mode = st.selectbox(
+            "Compare With",
+            options=list(time_rollups.COMPARISON_MODES),
+            index=1,
+            format_func=time_rollups.COMPARISON_MODES.get
+        )
+        
+    with col3:
+        measure = st.selectbox(
+            "Measure",
+            options=list(measures),
+            format_func=measures.get
+        )
+    
+    try:
+        with profiling.stage('period_comparison'):
+            comparison = time_rollups.period_comparison(rollups, grain, mode, filter_selections, measure)
+    except ValueError as exc:
+        st.info(f"ℹ️ {exc}")
+        return
+    
+    show_chart(create_period_comparison_chart, comparison, measures[measure], time_rollups.COMPARISON_MODES[mode])
+
+def render_forecast(model, horizon, entitled=security.UNRESTRICTED):
+    """Next-horizon Net_Sales projections for every rep, region or category (restricted users: their own)"""
+    
+    st.markdown("## 🔮 Sales Forecast")
+    
+    dimensions = {'Sales_Rep': 'Sales Rep', 'Region': 'Region', 'Product_Category': 'Category'}
+    if entitled:
+        dimensions = {column: dimensions[column] for column, _ in entitled}
+    dimension = st.selectbox("Project By", options=list(dimensions), format_func=dimensions.get)
+    
+    with profiling.stage('projection_table'):
+        table = model.projection_table((dimension,), horizon)
+    table = table[security.permitted_labels([dimension] * len(table), table[dimension], entitled)]
+    
+    st.caption(f"Next {horizon} days after {model.dates[-1]:%Y-%m-%d} from a trend + weekday"
+               f"{' + month' if model.seasonal else ''} fit; range is about 95%")
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            **{column: st.column_config.NumberColumn(format="$%.0f")
+               for column in [f'Last_{horizon}_Days', 'Forecast', 'Lower', 'Upper']},
+            'Change_Pct': st.column_config.NumberColumn(format="%+.1f%%")
+        }
+    )
+
+def render_exceptions(filter_selections, entitled=security.UNRESTRICTED):
+    """Most unusual days across every series inside the selection (restricted users: their own series)"""
+    
+    st.markdown("## 🚨 Exceptions")
+    
+    with profiling.stage('load_series_anomalies', cache='hit'):
+        model = load_series_anomalies()
+    
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range']
+    with profiling.stage('anomaly_table'):
+        series = model.series_mask(filter_selections)
+        series &= security.permitted_labels(model.labels['Dimension'], model.labels['Value'], entitled)
+        table = model.table(date_range, series=series, include_appended=True)
+    
+    if table.empty:
+        st.info("ℹ️ No unusual days in the selected period")
+        return
+    
+    st.caption(f"{len(table):,} flagged series-days (|z| ≥ {anomalies.THRESHOLD}) against a robust "
+               f"{round(2 / anomalies.ALPHA - 1)}-day EWMA baseline")
+    st.dataframe(
+        table.head(20).assign(Date=lambda t: t['Date'].dt.date),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Actual': st.column_config.NumberColumn(format="%.0f"),
+            'Expected': st.column_config.NumberColumn(format="%.0f"),
+            'Z': st.column_config.NumberColumn(format="%+.1f")
+        }
+    )
+
+@st.cache_data(max_entries=64)
+def load_drilldown(filter_key, crossfilter_key, path, _backend, _filter_selections):
+    """One drill-down level, computed only when its path is expanded and cached per path"""
+    profiling.mark_cache_miss()
+    if len(path) == 1:
+        return _backend.product_metrics(_filter_selections, path[0])
+    return _backend.product_orders(_filter_selections, *path)
+
+@st.cache_data(max_entries=16)
+def load_customer_months(filter_key, crossfilter_key, _backend, _filter_selections):
+    """Customer x month activity of a selection (shared by the cohort and RFM views)"""
+    profiling.mark_cache_miss()
+    return _backend.customer_months(_filter_selections)
+
+@st.cache_data(max_entries=16)
+def load_cohorts(filter_key, crossfilter_key, _backend, _filter_selections):
+    """Cohort matrices of a selection (customer-month activity pivoted with integer codes)"""
+    profiling.mark_cache_miss()
+    return cohorts.cohort_matrix(load_customer_months(filter_key, crossfilter_key, _backend, _filter_selections))
+
+def render_cohorts(backend, filter_selections, crossfilters):
+    """Retention, active customers or revenue by first-order month"""
+    
+    st.markdown("## 👥 Cohort Retention")
+    metric = st.radio(
+        "Cohort Metric",
+        options=list(cohorts.COHORT_METRICS),
+        format_func=cohorts.COHORT_METRICS.get,
+        horizontal=True
+    )
+    
+    filter_key = engine.normalize_filters(filter_selections)
+    crossfilter_key = tuple((name, tuple(values)) for name, values in sorted(crossfilters.items()))
+    with profiling.stage('load_cohorts', cache='hit'):
+        cohort_matrices = load_cohorts(filter_key, crossfilter_key, backend, filter_selections)
+    
+    if cohort_matrices['sizes'].empty:
+        st.info("ℹ️ No customers in the selection")
+        return
+    st.caption("Cohorts are customers' first order month within the selected filters and dates")
+    show_chart(plot_cohort_heatmap, cohort_matrices, metric)
+
+def render_rfm(scores, backend, filter_selections, crossfilters):
+    """Revenue and customers of the selection per RFM segment"""
+    
+    st.markdown("## 🧮 RFM Segments")
+    
+    filter_key = engine.normalize_filters(filter_selections)
+    crossfilter_key = tuple((name, tuple(values)) for name, values in sorted(crossfilters.items()))
+    with profiling.stage('load_customer_months', cache='hit'):
+        activity = load_customer_months(filter_key, crossfilter_key, backend, filter_selections)
+    with profiling.stage('rfm_segment_metrics'):
+        rfm_metrics = rfm.segment_metrics(scores, activity)
+    
+    st.caption(f"Recency, frequency and monetary quintiles over each customer's full history "
+               f"(as of {scores.as_of:%Y-%m-%d})")
+    show_chart(plot_rfm_segments, rfm_metrics)
+
+@st.cache_data(max_entries=16)
+def load_co_purchases(filter_key, crossfilter_key, _backend, _filter_selections):
+    """Product co-purchase counts of a selection (customer x product incidence from the backend)"""
+    profiling.mark_cache_miss()
+    return basket.co_purchase_matrix(_backend.customer_products(_filter_selections))
+
+def render_co_purchases(backend, filter_selections, crossfilters):
+    """Products bought by the same customers: affinity heatmap and strongest pairs"""
+    
+    st.markdown("## 🛒 Product Affinity")
+    metric = st.radio(
+        "Affinity Metric",
+        options=list(basket.BASKET_METRICS),
+        format_func=basket.BASKET_METRICS.get,
+        horizontal=True
+    )
+    
+    filter_key = engine.normalize_filters(filter_selections)
+    crossfilter_key = tuple((name, tuple(values)) for name, values in sorted(crossfilters.items()))
+    with profiling.stage('load_co_purchases', cache='hit'):
+        co_purchases = load_co_purchases(filter_key, crossfilter_key, backend, filter_selections)
+    
+    if co_purchases['pairs'].empty:
+        st.info("ℹ️ No customers in the selection")
+        return
+    st.caption(f"Products bought by the same customer within the selected filters and dates "
+               f"({co_purchases['customers']:,} customers)")
+    show_chart(plot_product_affinity, co_purchases, metric)
+    st.markdown("### Strongest Product Pairs")
+    st.dataframe(
+        basket.affinity_table(co_purchases).head(20),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Support': st.column_config.NumberColumn(format="%.2f%%"),
+            'Confidence': st.column_config.NumberColumn(format="%.1f%%"),
+            'Lift': st.column_config.NumberColumn(format="%.2f")
+        }
+    )
+
+@st.cache_data(max_entries=16)
+def load_scenario_cells(filter_key, crossfilter_key, _backend, _filter_selections):
+    """Category x region x discount totals of a selection (every scenario is evaluated on these)"""
+    profiling.mark_cache_miss()
+    return _backend.scenario_cells(_filter_selections)
+
+def render_scenarios(backend, filter_selections, crossfilters, filter_options):
+    """Editable discount-cap / cost-change scenarios, evaluated together against the selection"""
+    
+    st.markdown("## 🧪 What-If Scenarios")
+    st.caption("One row per rule; rows sharing a scenario name combine. A blank max discount leaves "
+               "discounts unchanged; cost changes are in percent. Profit is net sales minus cost here, "
+               "so discounts count against it (unlike the dataset's gross-based Profit).")
+    rules = st.data_editor(
+        scenarios.DEFAULT_SCENARIOS,
+        num_rows='dynamic',
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Product_Category': st.column_config.SelectboxColumn(options=filter_options['categories'],
+                                                                 default='All', required=True),
+            'Region': st.column_config.SelectboxColumn(options=filter_options['regions'], default='All',
+                                                       required=True),
+            'Max_Discount_Pct': st.column_config.NumberColumn(min_value=0.0, max_value=100.0, format="%.1f%%"),
+            'Cost_Change_Pct': st.column_config.NumberColumn(format="%+.1f%%", default=0.0)
+        },
+        key='scenario_rules'
+    )
+    
+    filter_key = engine.normalize_filters(filter_selections)
+    crossfilter_key = tuple((name, tuple(values)) for name, values in sorted(crossfilters.items()))
+    with profiling.stage('load_scenario_cells', cache='hit'):
+        cells = load_scenario_cells(filter_key, crossfilter_key, backend, filter_selections)
+    with profiling.stage('evaluate_scenarios'):
+        results = scenarios.evaluate_scenarios(cells, rules)
+    
+    if len(results) > 1:
+        show_chart(plot_scenarios, results)
+    st.dataframe(
+        results,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            **{column: st.column_config.NumberColumn(format="$%.0f") for column in ['Net_Sales', 'Profit']},
+            **{column: st.column_config.NumberColumn(format="$%+.0f")
+               for column in ['Net_Sales_Change', 'Profit_Change']},
+            'Margin': st.column_config.NumberColumn(format="%.1f%%")
+        }
+    )
+
+def render_drilldown(backend, filter_selections, crossfilters):
+    """Category -> product -> order drill-down for the category clicked in the category chart"""
+    
+    categories = crossfilters.get('categories', [])
+    if len(categories) != 1:
+        st.caption("🔎 Click a single category bar to drill down into its products and orders.")
+        return
+    
+    filter_key = engine.normalize_filters(filter_selections)
+    crossfilter_key = tuple((name, tuple(values)) for name, values in sorted(crossfilters.items()))
+    path = (categories[0],)
+    
+    st.markdown(f"## 🔎 Drill-down: {path[0]}")
+    with profiling.stage('load_drilldown:products', cache='hit'):
+        product_metrics = load_drilldown(filter_key, crossfilter_key, path, backend, filter_selections)
+    show_chart(plot_product_breakdown, product_metrics, path[0], key='drill_product')
+    
+    # Second level: only a product clicked in this category's breakdown expands
+    products = crossfilter.selection_values(st.session_state.get('drill_product'), 'x')
+    products = [p for p in products if p in set(product_metrics['Product_Name'])]
+    if len(products) != 1:
+        st.caption("Click a product bar to list its orders.")
+        return
+    
+    path = path + (products[0],)
+    with profiling.stage('load_drilldown:orders', cache='hit'):
+        orders = load_drilldown(filter_key, crossfilter_key, path, backend, filter_selections)
+    st.markdown(f"### Orders: {path[1]} ({len(orders):,})")
+    st.dataframe(orders, use_container_width=True)
+
+@st.cache_resource(max_entries=16)
+def load_live_view(filter_key, _filter_selections):
+    """Running live aggregates for one slicer selection (shared, folded once per new micro-batch)"""
+    profiling.mark_cache_miss()
+    from dashboard_live import LiveView
+    return LiveView(LIVE_PATH, _filter_selections)
+
+@st.cache_resource
+def load_live_days():
+    """Daily rollup of the whole live feed, shared by every session"""
+    from dashboard_live import LiveDays
+    return LiveDays(LIVE_PATH)
+
+def live_fragment(render):
+    """Rerun only the live panel every LIVE_REFRESH seconds (Streamlit 1.37+; a static section before)"""
+    if hasattr(st, 'fragment'):
+        return st.fragment(run_every=LIVE_REFRESH)(render)
+    return render
+
+@live_fragment
+def render_live_panel(filter_selections):
+    """Live KPIs of the order feed: each refresh folds only the orders appended since the last one"""
+    
+    live_selections = {**filter_selections, 'date_range': ()}
+    view = load_live_view(engine.normalize_filters(live_selections), live_selections)
+    with profiling.stage('live_poll'):
+        view.poll()
+    snapshot = view.snapshot()
+    
+    # Days the feed has moved past are scored by the shared anomaly model (skipped once scored)
+    with profiling.stage('live_anomalies'):
+        live_days = load_live_days()
+        live_days.poll()
+        load_series_anomalies().extend(live_days.completed_days())
+    
+    st.markdown("## 🔴 Live Orders")
+    if snapshot['orders'] == 0:
+        st.info(f"⏳ Waiting for orders in '{LIVE_PATH}'...")
+        return
+    
+    kpis = snapshot['kpis']
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(
+            label="📡 Live Orders",
+            value=f"{kpis['total_orders']:,}",
+            delta=f"+{snapshot['last_batch']:,}" if snapshot['last_batch'] else None
+        )
+    with col2:
+        st.metric(label="💰 Live Sales", value=f"${kpis['total_sales']:,.0f}")
+    with col3:
+        st.metric(label="💵 Live Profit", value=f"${kpis['total_profit']:,.0f}")
+    with col4:
+        st.metric(label="🛒 Live Avg Order Value", value=f"${kpis['avg_order_value']:.0f}")
+    
+    col5, col6 = st.columns(2)
+    with col5:
+        show_chart(plot_live_orders, snapshot['minutes'])
+    with col6:
+        st.markdown("### Latest Orders")
+        recent = snapshot['recent']
+        st.dataframe(recent[[c for c in ['Order_Time', 'Order_ID', 'Region', 'Product_Name', 'Net_Sales']
+                             if c in recent]], use_container_width=True, hide_index=True)
+    st.caption(f"Updated {snapshot['last_update']:%H:%M:%S} · refreshes every {LIVE_REFRESH:g}s")
+
+@st.cache_resource
+def load_usage_log():
+    """Filter state usage log shared by every session"""
+    return prewarm.UsageLog(USAGE_LOG)
+
+def record_usage(state):
+    """Log a session's filter state when it changes (reruns of the same selection count once)"""
+    if st.session_state.get('usage_state') != state:
+        load_usage_log().record(state)
+        st.session_state['usage_state'] = state
+
+def warm_state(dataset_version, state):
+    """Fill the per-selection caches a rerun of one logged state reads (runs on the pre-warm thread)"""
+    info = load_dataset_info()
+    filter_selections, rfm_segments, entitled = prewarm.state_selection(state, (info['min_date'], info['max_date']))
+    if rfm_segments:
+        filter_selections['customers'] = load_rfm_scores(dataset_version).customers(rfm_segments)
+    if entitled:
+        filter_selections = security.restrict_filters(filter_selections, entitled)
+    backend = get_backend(filter_selections['date_range'], entitled)
+    if backend.count_rows(filter_selections) == 0:
+        return []
+
+    filter_key = engine.normalize_filters(filter_selections)
+    return [
+        load_selection_metrics(filter_key, (), entitled, backend, filter_selections),
+        load_cohorts(filter_key, (), backend, filter_selections),
+        load_co_purchases(filter_key, (), backend, filter_selections),
+        load_scenario_cells(filter_key, (), backend, filter_selections)
+    ]
+
+@st.cache_resource(max_entries=2)
+def start_prewarm(dataset_version):
+    """Background pre-warm of the default and most used states, once per dataset version"""
+    entitlements = sorted(set(load_roles().values())) if ROLES_PATH else [security.UNRESTRICTED]
+    states = prewarm.candidate_states(load_usage_log(), load_dataset_info()['filter_options'], entitlements,
+                                      PREWARM_TOP)
+    return prewarm.Prewarmer(states, lambda state: warm_state(dataset_version, state),
+                             PREWARM_SECONDS, PREWARM_MB).start()
+
+def render_performance_panel(profiler):
+    """Sidebar breakdown of this rerun's stage timings"""
+    
+    history = st.session_state.setdefault('perf_history', [])
+    history.append(profiler.to_jsonl())
+    del history[:-50]
+    
+    with st.sidebar.expander("⏱️ Performance (this rerun)", expanded=True):
+        st.write(f"**Total:** {profiler.total_seconds() * 1000:,.0f} ms")
+        st.dataframe([
+            {
+                'Stage': '· ' * r['depth'] + r['stage'],
+                'ms': round(r['seconds'] * 1000, 1),
+                'Rows': r['rows_scanned'],
+                'Cache': r['cache'],
+                'Peak MB': round(r['peak_memory_mb'], 2) if r['peak_memory_mb'] is not None else None
+            }
+            for r in profiler.to_rows()
+        ], use_container_width=True)
+        st.caption("Peak MB is memory traced above the stage's start; blank when another session was "
+                   "profiled at the same time (tracing is process-wide).")
+        st.download_button(
+            label="📥 Download profile (JSONL)",
+            data=''.join(history),
+            file_name=f"dashboard_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+            mime="application/x-ndjson"
+        )
+
+def main():
+    """Main dashboard function"""
+    
+    show_panel = st.session_state.get('show_perf_panel', False)
+    
+    if show_panel or PROFILE_LOG:
+        profiler = profiling.StageProfiler(track_memory=show_panel)
+        with profiler.activate():
+            render_dashboard()
+        if PROFILE_LOG:
+            profiler.export_jsonl(PROFILE_LOG)
+    else:
+        render_dashboard()
+    
+    st.sidebar.markdown("---")
+    st.sidebar.checkbox("🛠️ Show performance panel", key='show_perf_panel')
+    if show_panel:
+        render_performance_panel(profiler)
+
+def render_dashboard():
+    """Render the dashboard page"""
+    
+    # Header
+    st.markdown("""
+    <div class="dashboard-header">
+        <h1>🏢 Sales Performance Dashboard</h1>
+        <p>Interactive Business Intelligence Dashboard for Data-Driven Decision Making</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Load data
+    with st.spinner('Loading sales data...'), profiling.stage('load_dataset_info', cache='hit'):
+        info = load_dataset_info()
+    min_date, max_date = (datetime.strptime(info[key], '%Y-%m-%d').date() for key in ['min_date', 'max_date'])
+    
+    # Row-level security: the signed-in user's entitlement narrows every slicer and backend request
+    entitled = current_entitlement()
+    if entitled is None:
+        st.error("🔒 You do not have access to this dashboard. Ask an administrator to add you to the roles file.")
+        st.stop()
+    
+    # Sidebar filters
+    st.sidebar.header("🔍 Dashboard Filters")
+    st.sidebar.markdown("---")
+    
+    # Date range filter
+    date_range = st.sidebar.date_input(
+        "Select Date Range",
+        value=(min_date, max_date),
+        min_value=min_date,
+        max_value=max_date
+    )
+    
+    filter_options = security.restrict_options(info['filter_options'], entitled)
+    
+    # Region filter
+    regions = filter_options['regions']
+    selected_regions = st.sidebar.multiselect(
+        "Select Region(s)",
+        options=regions,
+        default=['All']
+    )
+    
+    # Product Category filter
+    categories = filter_options['categories']
+    selected_categories = st.sidebar.multiselect(
+        "Select Product Category",
+        options=categories,
+        default=['All']
+    )
+    
+    # Customer Segment filter
+    segments = filter_options['segments']
+    selected_segments = st.sidebar.multiselect(
+        "Select Customer Segment",
+        options=segments,
+        default=['All']
+    )
+    
+    # Sales Rep filter
+    reps = filter_options['sales_rep']
+    selected_reps = st.sidebar.selectbox(
+        "Select Sales Representative",
+        options=reps
+    )
+    
+    # RFM segment filter (a customer-level slicer: resolved to the segment's Customer_IDs)
+    with profiling.stage('load_rfm_scores', cache='hit'):
+        rfm_scores = current_rfm_scores(engine.dataset_version(info))
+    selected_rfm = st.sidebar.multiselect(
+        "Select RFM Segment",
+        options=['All'] + rfm.RFM_SEGMENTS,
+        default=['All']
+    )
+    rfm_customers = None
+    if selected_rfm and 'All' not in selected_rfm:
+        rfm_customers = rfm_scores.customers(selected_rfm)
+    
+    # Apply filters
+    filter_selections = {
+        'date_range': date_range,
+        'regions': selected_regions,
+        'categories': selected_categories,
+        'segments': selected_segments,
+        'sales_rep': selected_reps,
+        'customers': rfm_customers
+    }
+    if entitled:
+        filter_selections = security.restrict_filters(filter_selections, entitled)
+    if USAGE_LOG:
+        record_usage(prewarm.usage_state(filter_selections, entitled, selected_rfm, (min_date, max_date)))
+    with profiling.stage('load_backend', cache='hit'):
+        backend = get_backend(date_range, entitled)
+    filtered_count = backend.count_rows(filter_selections)
+    
+    # Chart clicks act as extra filters, answered from the selection's pre-aggregated cube
+    crossfilters = get_crossfilters()
+    if crossfilters and filtered_count > 0:
+        if len(backend.fetch_rows(filter_selections)) < filtered_count:
+            st.sidebar.info("ℹ️ Cross-filtering needs every matching row; narrow the filters to enable it.")
+            crossfilters = {}
+        else:
+            with profiling.stage('load_crossfilter_cube', cache='hit'):
+                cube = load_crossfilter_cube(engine.normalize_filters(filter_selections), entitled, backend,
+                                             filter_selections)
+            backend = cube.view(crossfilters)
+            filtered_count = backend.count_rows(filter_selections)
+    
+    # Selection the precomputed series and rollups see (chart clicks included, still within the entitlement)
+    chart_selections = security.restrict_filters({**filter_selections, **crossfilters}, entitled)
+    
+    # Moving average overlay for the sales trend
+    ma_options = {0: 'None', 7: '7 days', 30: '30 days', 90: '90 days'}
+    ma_window = st.sidebar.selectbox(
+        "Trend Moving Average",
+        options=list(ma_options),
+        index=1,
+        format_func=ma_options.get
+    )
+    
+    # Forecast band appended to the sales trend
+    forecast_options = {0: 'None', 30: '30 days', 90: '90 days'}
+    forecast_days = st.sidebar.selectbox(
+        "Sales Forecast",
+        options=list(forecast_options),
+        index=1,
+        format_func=forecast_options.get
+    )
+    
+    # Display filter summary
+    st.sidebar.markdown("---")
+    st.sidebar.write(f"**Filtered Records:** {filtered_count:,}")
+    if entitled:
+        st.sidebar.write("**Access:** " + "; ".join(f"{column.replace('_', ' ')}: {', '.join(values)}"
+                                                    for column, values in entitled))
+    else:
+        st.sidebar.write(f"**Total Records:** {info['rows']:,}")
+    if crossfilters:
+        for name, values in crossfilters.items():
+            st.sidebar.write(f"**Chart filter ({name}):** {', '.join(values)}")
+        st.sidebar.button("✖️ Clear chart filters", on_click=clear_crossfilters)
+    
+    # Live feed (refreshes on its own interval, independently of the historical view)
+    if LIVE_PATH:
+        render_live_panel(filter_selections)
+    
+    # Main dashboard content
+    if filtered_count == 0:
+        st.warning("⚠️ No data available for the selected filters. Please adjust your selection.")
+        return
+    
+    # Every aggregate below comes from one cached bundle per selection (what pre-warming fills)
+    crossfilter_key = tuple((name, tuple(values)) for name, values in sorted(crossfilters.items()))
+    with profiling.stage('load_selection_metrics', cache='hit'):
+        selection_metrics = load_selection_metrics(engine.normalize_filters(filter_selections), crossfilter_key,
+                                                   entitled, backend, filter_selections)
+    
+    # KPI Metrics Row
+    st.markdown("## 📊 Key Performance Indicators")
+    kpi_metrics = selection_metrics['kpis']
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="💰 Total Sales",
+            value=f"${kpi_metrics['total_sales']:,.0f}",
+            delta=f"{kpi_metrics['sales_growth']:+.1f}%" if kpi_metrics['sales_growth'] != 0 else None
+        )
+        
+    with col2:
+        st.metric(
+            label="💵 Total Profit",
+            value=f"${kpi_metrics['total_profit']:,.0f}"
+        )
+        
+    with col3:
+        st.metric(
+            label="📈 Profit Margin",
+            value=f"{kpi_metrics['avg_profit_margin']:.1f}%"
+        )
+        
+    with col4:
+        st.metric(
+            label="📋 Total Orders",
+            value=f"{kpi_metrics['total_orders']:,}"
+        )
+    
+    # Second row of KPIs
+    col5, col6, col7, col8 = st.columns(4)
+    
+    with col5:
+        st.metric(
+            label="🛒 Avg Order Value",
+            value=f"${kpi_metrics['avg_order_value']:.0f}"
+        )
+        
+    with col6:
+        st.metric(
+            label="👥 Unique Customers",
+            value=f"{kpi_metrics['unique_customers']:,}"
+        )
+        
+    with col7:
+        st.metric(
+            label="🎯 Revenue per Customer",
+            value=f"${kpi_metrics['total_sales']/kpi_metrics['unique_customers']:.0f}"
+        )
+        
+    with col8:
+        st.metric(
+            label="📦 Orders per Customer",
+            value=f"{kpi_metrics['total_orders']/kpi_metrics['unique_customers']:.1f}"
+        )
+    
+    # Third row: order value and margin distribution (t-digest quantiles)
+    quantiles = selection_metrics['quantiles'].iloc[0]
+    col9, col10, col11, col12 = st.columns(4)
+    
+    with col9:
+        st.metric(
+            label="🧾 Median Order Value",
+            value=f"${quantiles['Net_Sales_P50']:,.0f}"
+        )
+        
+    with col10:
+        st.metric(
+            label="🔝 P90 / P99 Order Value",
+            value=f"${quantiles['Net_Sales_P90']:,.0f} / ${quantiles['Net_Sales_P99']:,.0f}"
+        )
+        
+    with col11:
+        st.metric(
+            label="📐 Median Margin",
+            value=f"{quantiles['Profit_Margin_P50']:.1f}%"
+        )
+        
+    with col12:
+        st.metric(
+            label="📐 P90 / P99 Margin",
+            value=f"{quantiles['Profit_Margin_P90']:.1f}% / {quantiles['Profit_Margin_P99']:.1f}%"
+        )
+    
+    # Charts Row 1
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        daily_sales = selection_metrics['daily_sales']
+        with profiling.stage('chart_anomalies'):
+            chart_anomalies = anomalies.chart_anomalies(
+                load_series_anomalies(), daily_sales, chart_selections
+            )
+        
+        # The band continues the history, so it is drawn only when the range reaches the last day
+        chart_forecast = None
+        if forecast_days and (len(date_range) != 2 or date_range[1] >= max_date):
+            with profiling.stage('load_forecast_model', cache='hit'):
+                forecast_model = load_forecast_model(engine.dataset_version(info))
+            with profiling.stage('chart_forecast'):
+                chart_forecast = forecasting.chart_forecast(
+                    forecast_model, load_time_rollups(), chart_selections, forecast_days,
+                    daily_sales
+                )
+        # The shared prefix sums answer unfiltered and single-slicer averages without a new cumsum
+        chart_moving_average = None
+        if ma_window and BACKEND == 'pandas' and not DATA_PATH:
+            with profiling.stage('chart_moving_average'):
+                chart_moving_average = load_prefix_sums().moving_average('Net_Sales', ma_window, chart_selections)
+        show_chart(plot_time_series_chart, daily_sales, ma_window, chart_anomalies, chart_forecast,
+                   chart_moving_average)
+        
+    with col2:
+        show_chart(plot_regional_performance, selection_metrics['regions'], key='xf_regions')
+    
+    # Time Comparison
+    render_time_comparison(chart_selections)
+    render_exceptions(chart_selections, entitled)
+    if forecast_days:
+        render_forecast(load_forecast_model(engine.dataset_version(info)), forecast_days, entitled)
+    
+    # Charts Row 2
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        show_chart(plot_category_analysis, selection_metrics['categories'], key='xf_categories')
+        
+    with col4:
+        show_chart(plot_customer_analysis, selection_metrics['segments'], key='xf_segments')
+    
+    # Drill-down (lazy: deeper levels are only computed for the clicked path)
+    render_drilldown(backend, filter_selections, crossfilters)
+    
+    # Charts Row 3
+    show_chart(plot_sales_rep_performance, selection_metrics['sales_reps'])
+    
+    # Distributions (bins computed on the server: a fixed number of bars at any row count)
+    st.markdown("## 📊 Distributions")
+    col5, col6 = st.columns(2)
+    with col5:
+        histogram_measure = st.radio(
+            "Measure",
+            options=engine.HISTOGRAM_MEASURES,
+            format_func=HISTOGRAM_LABELS.get,
+            horizontal=True
+        )
+    with col6:
+        histogram_scale = st.radio("Bins", options=['linear', 'log'], format_func=str.title, horizontal=True)
+    show_chart(
+        plot_histogram, backend.histogram(filter_selections, histogram_measure, histogram_scale),
+        histogram_measure, histogram_scale
+    )
+    
+    # Cohort retention and RFM segments (customer-month activity, not raw rows)
+    render_cohorts(backend, filter_selections, crossfilters)
+    render_rfm(rfm_scores, backend, filter_selections, crossfilters)
+    
+    # Products bought together (customer x product incidence, not raw rows)
+    render_co_purchases(backend, filter_selections, crossfilters)
+    
+    # Profitability Analysis (row-level)
+    filtered_df = backend.fetch_rows(filter_selections)
+    show_chart(create_profitability_analysis, filtered_df)
+    if len(filtered_df) < filtered_count:
+        st.caption(f"Row-level views show the first {len(filtered_df):,} of {filtered_count:,} matching orders.")
+    
+    # What-if scenarios (category x region x discount totals, not raw rows)
+    render_scenarios(backend, filter_selections, crossfilters, filter_options)
+    
+    # Data Table
+    st.markdown("---")
+    st.markdown("## 📋 Detailed Data View")
+    
+    # Show summary statistics
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Top 10 Products by Sales")
+        st.dataframe(selection_metrics['top_products'])
+    
+    with col2:
+        st.markdown("### Top 10 Customers by Revenue")
+        st.dataframe(selection_metrics['top_customers'])
+    
+    # Raw data view
+    with st.expander("🔍 View Raw Data"):
+        with profiling.stage('render:raw_data', rows_scanned=len(filtered_df)):
+            st.dataframe(
+                filtered_df[['Date', 'Order_ID', 'Customer_Segment', 'Product_Category', 
+                            'Product_Name', 'Region', 'Sales_Rep', 'Net_Sales', 'Profit', 'Profit_Margin']],
+                use_container_width=True
+            )
+    
+    # Download functionality
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        with profiling.stage('serialize:csv_export', rows_scanned=len(filtered_df)):
+            csv = filtered_df.to_csv(index=False)
+        st.download_button(
+            label="📥 Download Filtered Data (CSV)",
+            data=csv,
+            file_name=f"sales_data_filtered_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
+    
+    # Footer
+    st.markdown("---")
+    st.markdown("""
+    <div style="text-align: center; color: gray; font-size: 12px;">
+        📊 Sales Performance Dashboard | Data Analytics Internship - Task 5<br>
+        Built with Streamlit & Plotly | © 2025 Skillytixs Analytics
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Once this page is out, pre-warm the most used selections in the background (once per dataset version)
+    if USAGE_LOG:
+        start_prewarm(engine.dataset_version(info))
+
+# =============================================================================
+# RUN APPLICATION
+# =============================================================================
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Batch Report Renderer
+Objective: Render a static dashboard snapshot for every rep, region and category slice
+
+Usage:
+    python dashboard_batch.py --output-dir reports --workers 4
+    python dashboard_batch.py --slices rep region --list
+"""
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+
+# Slice type -> filter names that vary within it
+SLICE_TYPES = {
+    'rep': ['sales_rep'],
+    'region': ['regions'],
+    'category': ['categories'],
+    'rep_region': ['sales_rep', 'regions']
+}
+
+# Dataset shared by every task in a worker process (set once by _init_worker)
+_WORKER_DF = None
+
+# =============================================================================
+# SLICE ENUMERATION
+# =============================================================================
+
+def list_slices(df, slice_types=('rep', 'region', 'category', 'rep_region')):
+    """List the filter combinations to render, one dict per slice"""
+
+    options = engine.get_filter_options(df)
+    slices = []
+
+    for slice_type in slice_types:
+        names = SLICE_TYPES[slice_type]
+        # Cartesian product of the non-'All' options for each varying filter
+        combos = [{}]
+        for name in names:
+            combos = [
+                {**combo, name: value}
+                for combo in combos
+                for value in options[name][1:]
+            ]
+
+        for combo in combos:
+            filters = {
+                name: (value if name == 'sales_rep' else [value])
+                for name, value in combo.items()
+            }
+            slug = '__'.join(_slugify(combo[name]) for name in names)
+            slices.append({
+                'slice_id': f"{slice_type}__{slug}",
+                'slice_type': slice_type,
+                'filters': filters
+            })
+
+    return slices
+
+def _slugify(value):
+    """Filesystem-safe lowercase name for a filter value"""
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+
+# =============================================================================
+# SLICE RENDERING
+# =============================================================================
+
+def _init_worker(df):
+    """Receive the shared dataset once per worker process"""
+    global _WORKER_DF
+    _WORKER_DF = df
+
+def _json_default(value):
+    """Serialize numpy/pandas scalars found in aggregates"""
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (np.floating,)):
+        return float(value)
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    return str(value)
+
+def render_slice(slice_spec, output_dir, include_plotlyjs='cdn', df=None):
+    """Compute one slice's metrics and write its HTML + JSON files"""
+
+    # Plotly is only needed when rendering, keep it out of the parent import
+    from dashboard_charts import create_dashboard_figures
+
+    df = _WORKER_DF if df is None else df
+    filtered_df = engine.apply_filters(df, slice_spec['filters'])
+    aggregates = engine.compute_dashboard_aggregates(df, filtered_df)
+
+    metrics = {
+        'slice_id': slice_spec['slice_id'],
+        'slice_type': slice_spec['slice_type'],
+        'filters': slice_spec['filters'],
+        'rows': len(filtered_df),
+        'kpis': aggregates['kpis'],
+        'aggregates': {
+            name: table.to_dict(orient='records')
+            for name, table in aggregates.items()
+            if name != 'kpis'
+        }
+    }
+
+    base_path = os.path.join(output_dir, slice_spec['slice_id'])
+    with open(base_path + '.json', 'w') as f:
+        json.dump(metrics, f, indent=2, default=_json_default)
+
+    html_parts = [f"<h1>Sales Performance Dashboard - {slice_spec['slice_id']}</h1>"]
+    if len(filtered_df) == 0:
+        html_parts.append("<p>No data available for this slice.</p>")
+    else:
+        for i, fig in enumerate(create_dashboard_figures(filtered_df).values()):
+            html_parts.append(fig.to_html(
+                full_html=False,
+                include_plotlyjs=include_plotlyjs if i == 0 else False
+            ))
+
+    with open(base_path + '.html', 'w', encoding='utf-8') as f:
+        f.write("<html><head><meta charset=\"utf-8\"></head><body>\n")
+        f.write("\n".join(html_parts))
+        f.write("\n</body></html>\n")
+
+    return slice_spec['slice_id'], len(filtered_df)
+
+def render_all_slices(df, slices, output_dir, workers=None, include_plotlyjs='cdn'):
+    """Render every slice across a process pool sharing one loaded dataset"""
+
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(df,)) as pool:
+        futures = [
+            pool.submit(render_slice, slice_spec, output_dir, include_plotlyjs)
+            for slice_spec in slices
+        ]
+        results = [future.result() for future in futures]
+
+    elapsed = time.perf_counter() - start
+
+    return {
+        'slices': len(results),
+        'elapsed_seconds': elapsed,
+        'slices_per_second': len(results) / elapsed if elapsed > 0 else float('inf'),
+        'results': results
+    }
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Render nightly dashboard snapshots"""
+
+    parser = argparse.ArgumentParser(description="Render static dashboard snapshots for every filter slice")
+    parser.add_argument('--output-dir', default='reports', help="Directory for the HTML and JSON files")
+    parser.add_argument('--slices', nargs='+', choices=list(SLICE_TYPES), default=list(SLICE_TYPES),
+                        help="Slice types to render")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument('--plotlyjs', choices=['cdn', 'inline'], default='cdn',
+                        help="Link plotly.js from the CDN or inline it for fully offline files")
+    parser.add_argument('--list', action='store_true', help="Only list the slices that would be rendered")
+    args = parser.parse_args()
+
+    print("📋 Loading sales data...")
+    df = engine.load_sales_data()
+    slices = list_slices(df, args.slices)
+
+    if args.list:
+        for slice_spec in slices:
+            print(f"{slice_spec['slice_id']}: {slice_spec['filters']}")
+        print(f"\n{len(slices)} slices")
+        return
+
+    print(f"📊 Rendering {len(slices)} slices to '{args.output_dir}'...")
+    summary = render_all_slices(
+        df, slices, args.output_dir,
+        workers=args.workers,
+        include_plotlyjs=True if args.plotlyjs == 'inline' else 'cdn'
+    )
+
+    print(f"✅ Rendered {summary['slices']} slices in {summary['elapsed_seconds']:.2f}s "
+          f"({summary['slices_per_second']:.1f} slices/sec)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Dashboard Benchmark Suite
+Objective: Measure load, filter, KPI and chart-builder cost across data scales and filter selectivities
+
+Usage:
+    python dashboard_benchmark.py --output benchmark_results.json
+    python dashboard_benchmark.py --scales 5000 500000 --baseline benchmark_baseline.json
+    python dashboard_benchmark.py --save-baseline benchmark_baseline.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+
+DEFAULT_SCALES = [5_000, 500_000, 5_000_000]
+
+CHART_BUILDERS = [
+    'create_time_series_chart',
+    'create_regional_performance',
+    'create_category_analysis',
+    'create_customer_analysis',
+    'create_sales_rep_performance',
+    'create_profitability_analysis'
+]
+
+# =============================================================================
+# FILTER SELECTIVITIES
+# =============================================================================
+
+def build_selectivities(df):
+    """Filter selections from 'no filter' down to a narrow drill-in"""
+
+    max_date = df['Date'].max()
+
+    return {
+        'all': {},
+        'last_year': {'date_range': (max_date - timedelta(days=365), max_date)},
+        'region': {'regions': ['North']},
+        'rep_region': {'sales_rep': 'Alice Johnson', 'regions': ['North']},
+        'narrow': {
+            'date_range': (max_date - timedelta(days=30), max_date),
+            'regions': ['North'],
+            'categories': ['Electronics'],
+            'sales_rep': 'Alice Johnson'
+        }
+    }
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def measure(func, repeats=3):
+    """Median wall time over `repeats` runs plus peak traced memory of one extra run"""
+
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run so tracemalloc overhead stays out of the timings
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'wall_seconds': statistics.median(timings),
+        'min_seconds': min(timings),
+        'peak_memory_mb': peak / 1024 ** 2
+    }, result
+
+def run_benchmarks(scales=DEFAULT_SCALES, selectivities=None, stages=None, repeats=3, log=print):
+    """Run every stage at every scale/selectivity and return result records"""
+
+    # Plotly is only needed for the chart stages, keep it out of the module import
+    import dashboard_charts
+
+    results = []
+
+    def wanted(stage):
+        return stages is None or stage in stages
+
+    def record(stage, scale, selectivity, rows_in, rows_out, stats):
+        entry = {
+            'stage': stage,
+            'scale': scale,
+            'selectivity': selectivity,
+            'rows_in': rows_in,
+            'rows_out': rows_out,
+            **stats
+        }
+        results.append(entry)
+        log(f"  {stage:<32} {scale:>10,} {selectivity or '-':<12} "
+            f"{stats['wall_seconds'] * 1000:>10.2f} ms {stats['peak_memory_mb']:>9.1f} MB")
+
+    for scale in scales:
+        log(f"\n📊 Scale: {scale:,} rows")
+
+        # Reference loader only produces its fixed 5,000-row dataset
+        if scale == 5_000 and wanted('load_sales_data'):
+            stats, _ = measure(engine.load_sales_data, repeats=1)
+            record('load_sales_data', scale, None, 0, scale, stats)
+
+        stats, df = measure(lambda: engine.generate_sales_data(scale), repeats=1)
+        if wanted('generate_sales_data'):
+            record('generate_sales_data', scale, None, 0, len(df), stats)
+
+        for name, filters in build_selectivities(df).items():
+            if selectivities is not None and name not in selectivities:
+                continue
+
+            stats, filtered_df = measure(lambda: engine.apply_filters(df, filters), repeats)
+            if wanted('apply_filters'):
+                record('apply_filters', scale, name, len(df), len(filtered_df), stats)
+
+            if len(filtered_df) == 0:
+                continue
+
+            if wanted('create_kpi_metrics'):
+                stats, _ = measure(lambda: engine.create_kpi_metrics(df, filtered_df), repeats)
+                record('create_kpi_metrics', scale, name, len(filtered_df), 1, stats)
+
+            for builder_name in CHART_BUILDERS:
+                if not wanted(builder_name):
+                    continue
+                builder = getattr(dashboard_charts, builder_name)
+                stats, _ = measure(lambda: builder(filtered_df), repeats)
+                record(builder_name, scale, name, len(filtered_df), None, stats)
+
+        del df
+
+    return results
+
+# =============================================================================
+# BASELINE COMPARISON
+# =============================================================================
+
+def _result_key(entry):
+    return (entry['stage'], entry['scale'], entry['selectivity'])
+
+def compare_to_baseline(results, baseline, tolerance=0.2, min_delta_seconds=0.001):
+    """Return the entries slower than baseline by more than `tolerance` (relative)"""
+
+    baseline_index = {_result_key(entry): entry for entry in baseline['results']}
+    regressions = []
+
+    for entry in results:
+        base = baseline_index.get(_result_key(entry))
+        if base is None:
+            continue
+
+        delta = entry['wall_seconds'] - base['wall_seconds']
+        ratio = entry['wall_seconds'] / base['wall_seconds'] if base['wall_seconds'] > 0 else float('inf')
+        if ratio > 1 + tolerance and delta > min_delta_seconds:
+            regressions.append({
+                'stage': entry['stage'],
+                'scale': entry['scale'],
+                'selectivity': entry['selectivity'],
+                'baseline_seconds': base['wall_seconds'],
+                'current_seconds': entry['wall_seconds'],
+                'ratio': ratio
+            })
+
+    return regressions
+
+def environment_info():
+    """Interpreter and library versions recorded alongside results"""
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__
+    }
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Run the benchmark suite and optionally check it against a baseline"""
+
+    parser = argparse.ArgumentParser(description="Benchmark dashboard load, filter, KPI and chart stages")
+    parser.add_argument('--scales', nargs='+', type=int, default=DEFAULT_SCALES, help="Row counts to benchmark")
+    parser.add_argument('--selectivities', nargs='+', default=None, help="Subset of filter selectivities")
+    parser.add_argument('--stages', nargs='+', default=None, help="Subset of stages to run")
+    parser.add_argument('--repeats', type=int, default=3, help="Timed runs per measurement")
+    parser.add_argument('--output', default='benchmark_results.json', help="Where to write the results")
+    parser.add_argument('--baseline', default=None, help="Baseline results to compare against")
+    parser.add_argument('--save-baseline', default=None, help="Also write the results as a new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown vs baseline")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("DASHBOARD BENCHMARK SUITE")
+    print("="*80)
+
+    results = run_benchmarks(args.scales, args.selectivities, args.stages, args.repeats)
+    payload = {'environment': environment_info(), 'results': results}
+
+    with open(args.output, 'w') as f:
+        json.dump(payload, f, indent=2)
+    print(f"\n✅ Results saved as '{args.output}'")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(payload, f, indent=2)
+        print(f"✅ Baseline saved as '{args.save_baseline}'")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} regression(s) vs '{args.baseline}':")
+            for item in regressions:
+                print(f"  {item['stage']} @ {item['scale']:,} / {item['selectivity'] or '-'}: "
+                      f"{item['baseline_seconds'] * 1000:.2f} ms → {item['current_seconds'] * 1000:.2f} ms "
+                      f"(x{item['ratio']:.2f})")
+            sys.exit(1)
+        print(f"\n✅ No regressions vs '{args.baseline}' (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
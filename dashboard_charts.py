@@ -0,0 +1,702 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Dashboard Chart Builders
+Objective: Build the dashboard's Plotly figures from engine aggregates (no Streamlit required)
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+import dashboard_engine as engine
+from dashboard_anomalies import daily_anomalies
+from dashboard_basket import BASKET_METRICS, affinity_matrix, heatmap_products
+from dashboard_cohorts import COHORT_METRICS
+from dashboard_forecast import daily_forecast
+from dashboard_prefix import daily_moving_average
+from dashboard_profiling import profiled
+
+# float32 holds every integer up to 2**24 exactly (about 7 significant digits)
+FLOAT32_EXACT = 2 ** 24
+
+# Category colours of the profitability scatter (Plotly Express's default sequence)
+CATEGORY_COLORS = px.colors.qualitative.Plotly
+
+# =============================================================================
+# COMPACT PAYLOADS
+# =============================================================================
+
+def typed_array(values, decimals=0):
+    """Numbers rounded to display precision, as float32 when that keeps every shown digit
+
+    Plotly sends numpy arrays as base64 buffers of their own dtype (integers already narrowed),
+    so float32 halves the bytes of a float64 column; hovers must then format the values.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'iub':
+        return values
+    values = np.round(values.astype(float), decimals)
+    finite = np.abs(values[np.isfinite(values)])
+    if finite.size == 0 or finite.max() * 10 ** decimals < FLOAT32_EXACT:
+        return values.astype(np.float32)
+    return values
+
+def day_labels(dates):
+    """Dates as 'YYYY-MM-DD' strings (a date axis reads them; shorter than full timestamps)"""
+    return np.datetime_as_string(np.asarray(dates, dtype='datetime64[D]'))
+
+# =============================================================================
+# DASHBOARD FUNCTIONS
+# =============================================================================
+
+def quantile_hover(metrics, offset=0):
+    """customdata columns and hover lines for order-value quantiles merged into a chart frame (if present)"""
+    columns = [engine.quantile_column('Net_Sales', q) for q in engine.QUANTILES]
+    if not set(columns) <= set(metrics.columns):
+        return [], ''
+    lines = ''.join(
+        f'<br>P{int(round(q * 100))} order: $%{{customdata[{offset + i}]:,.0f}}' for i, q in enumerate(engine.QUANTILES)
+    )
+    return columns, lines
+
+def create_time_series_chart(df, ma_window=None, annotate_anomalies=True, forecast_days=0):
+    """Create time series sales chart (optional N-day moving average and forecast, anomalous days marked)"""
+    daily_sales = engine.aggregate_daily_sales(df)
+    anomalies = daily_anomalies(daily_sales) if annotate_anomalies else None
+    forecast = None
+    if forecast_days and not daily_sales.empty:
+        series = daily_sales.set_index('Date')['Net_Sales'].asfreq('D', fill_value=0)
+        forecast = daily_forecast(series, forecast_days)
+    return plot_time_series_chart(daily_sales, ma_window, anomalies, forecast)
+
+def anomaly_markers(anomalies, measure, label, value_format):
+    """Scatter of flagged days for one measure (actual value, expected value and z in the hover)"""
+    flagged = anomalies[anomalies['Measure'] == measure]
+    return go.Scatter(
+        x=day_labels(flagged['Date']),
+        y=typed_array(flagged['Actual']),
+        customdata=typed_array(flagged[['Expected', 'Z']], 1),
+        mode='markers',
+        name=f'{label} Anomaly',
+        marker=dict(color='#d62728', size=9, symbol='x'),
+        hovertemplate=f'<b>Date:</b> %{{x}}<br><b>{label}:</b> {value_format}<br>'
+                      f'<b>Expected:</b> {value_format.replace("y", "customdata[0]")}<br>'
+                      '<b>z:</b> %{customdata[1]:+.1f}<extra></extra>'
+    )
+
+@profiled()
+def plot_time_series_chart(daily_sales, ma_window=None, anomalies=None, forecast=None, moving_average=None):
+    """Plot time series sales chart from daily totals (optional moving average, anomalies and forecast band)
+
+    moving_average: the ma_window-day Net_Sales average when already known (PrefixSums.moving_average);
+    otherwise it is computed from daily_sales.
+    """
+    
+    # Create subplot
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=['Daily Sales Trend', 'Daily Orders Count'],
+        vertical_spacing=0.1,
+        row_heights=[0.7, 0.3]
+    )
+    
+    # Sales trend
+    days = day_labels(daily_sales['Date'])
+    fig.add_trace(
+        go.Scatter(
+            x=days,
+            y=typed_array(daily_sales['Net_Sales']),
+            mode='lines',
+            name='Net Sales',
+            line=dict(color='#1f77b4', width=2),
+            hovertemplate='<b>Date:</b> %{x}<br><b>Sales:</b> $%{y:,.0f}<extra></extra>'
+        ),
+        row=1, col=1
+    )
+    
+    # Moving average from prefix sums of the daily totals
+    if ma_window:
+        if moving_average is None:
+            moving_average = daily_moving_average(daily_sales, 'Net_Sales', ma_window)
+        fig.add_trace(
+            go.Scatter(
+                x=day_labels(moving_average.index),
+                y=typed_array(moving_average.values),
+                mode='lines',
+                name=f'{ma_window}-Day Average',
+                line=dict(color='#d62728', width=2, dash='dash'),
+                hovertemplate=f'<b>Date:</b> %{{x}}<br><b>{ma_window}-Day Avg:</b> $%{{y:,.0f}}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+    
+    # Orders count
+    fig.add_trace(
+        go.Scatter(
+            x=days,
+            y=daily_sales['Orders'].to_numpy(),
+            mode='lines',
+            name='Orders',
+            line=dict(color='#ff7f0e', width=2),
+            hovertemplate='<b>Date:</b> %{x}<br><b>Orders:</b> %{y}<extra></extra>'
+        ),
+        row=2, col=1
+    )
+    
+    # Forecast band (dashboard_forecast frame: Date, Forecast, Lower, Upper)
+    if forecast is not None and not forecast.empty:
+        forecast_days = day_labels(forecast['Date'])
+        fig.add_trace(
+            go.Scatter(
+                x=np.concatenate([forecast_days, forecast_days[::-1]]),
+                y=typed_array(np.concatenate([forecast['Upper'], forecast['Lower'].to_numpy()[::-1]])),
+                fill='toself',
+                fillcolor='rgba(44, 160, 44, 0.15)',
+                line=dict(width=0),
+                name='Forecast Range',
+                hoverinfo='skip'
+            ),
+            row=1, col=1
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=forecast_days,
+                y=typed_array(forecast['Forecast']),
+                customdata=typed_array(forecast[['Lower', 'Upper']]),
+                mode='lines',
+                name='Forecast',
+                line=dict(color='#2ca02c', width=2, dash='dot'),
+                hovertemplate='<b>Date:</b> %{x}<br><b>Forecast:</b> $%{y:,.0f}<br>'
+                              '<b>Range:</b> $%{customdata[0]:,.0f} - $%{customdata[1]:,.0f}<extra></extra>'
+            ),
+            row=1, col=1
+        )
+    
+    # Anomalous days (dashboard_anomalies table: Date, Measure, Actual, Expected, Z)
+    if anomalies is not None and not anomalies.empty:
+        fig.add_trace(anomaly_markers(anomalies, 'Net_Sales', 'Sales', '$%{y:,.0f}'), row=1, col=1)
+        fig.add_trace(anomaly_markers(anomalies, 'Orders', 'Orders', '%{y:,.0f}'), row=2, col=1)
+    
+    fig.update_layout(
+        height=500,
+        title_text="Sales Performance Over Time",
+        title_x=0.5,
+        showlegend=True,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def create_category_analysis(df):
+    """Create category performance analysis"""
+    return plot_category_analysis(engine.aggregate_category_metrics(df))
+
+@profiled()
+def plot_category_analysis(category_metrics):
+    """Plot category performance analysis from aggregated metrics"""
+    
+    # Create horizontal bar chart
+    fig = go.Figure()
+    quantile_columns, quantile_lines = quantile_hover(category_metrics)
+    
+    fig.add_trace(
+        go.Bar(
+            y=category_metrics['Category'],
+            x=category_metrics['Net_Sales'],
+            orientation='h',
+            name='Net Sales',
+            marker_color='lightblue',
+            customdata=category_metrics[quantile_columns] if quantile_columns else None,
+            hovertemplate=f'<b>%{{y}}</b><br>Sales: $%{{x:,.0f}}{quantile_lines}<extra></extra>'
+        )
+    )
+    
+    fig.update_layout(
+        title="Sales by Product Category",
+        title_x=0.5,
+        xaxis_title="Net Sales ($)",
+        yaxis_title="Product Category",
+        height=400,
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def plot_product_breakdown(product_metrics, category):
+    """Plot the products of one category (drill-down level 2)"""
+    
+    fig = go.Figure()
+    
+    fig.add_trace(
+        go.Bar(
+            x=product_metrics['Product_Name'],
+            y=product_metrics['Net_Sales'],
+            name='Net Sales',
+            marker_color='steelblue',
+            customdata=product_metrics[['Profit', 'Orders', 'Avg_Profit_Margin']],
+            hovertemplate='<b>%{x}</b><br>Sales: $%{y:,.0f}<br>Profit: $%{customdata[0]:,.0f}'
+                          '<br>Orders: %{customdata[1]}<br>Margin: %{customdata[2]:.1f}%<extra></extra>'
+        )
+    )
+    
+    fig.update_layout(
+        title=f"{category}: Sales by Product",
+        title_x=0.5,
+        xaxis_title="Product",
+        yaxis_title="Net Sales ($)",
+        height=400,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def create_regional_performance(df):
+    """Create regional performance analysis"""
+    return plot_regional_performance(engine.aggregate_regional_metrics(df))
+
+@profiled()
+def plot_regional_performance(regional_metrics):
+    """Plot regional performance analysis from aggregated metrics"""
+    
+    # Create pie chart for sales distribution
+    quantile_columns, quantile_lines = quantile_hover(regional_metrics, offset=2)
+    fig = px.pie(
+        regional_metrics,
+        values='Net_Sales',
+        names='Region',
+        title='Sales Distribution by Region',
+        color_discrete_sequence=px.colors.qualitative.Set3,
+        hover_data=['Orders', 'Customers'] + quantile_columns
+    )
+    
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Sales: $%{value:,.0f}<br>Orders: %{customdata[0]}<br>Customers: %{customdata[1]}'
+                      f'{quantile_lines}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        height=400,
+        title_x=0.5,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def create_sales_rep_performance(df):
+    """Create sales rep performance analysis"""
+    return plot_sales_rep_performance(engine.aggregate_sales_rep_metrics(df, top_n=10))
+
+@profiled()
+def plot_sales_rep_performance(rep_metrics):
+    """Plot sales rep performance analysis from aggregated metrics"""
+    
+    # Create bar chart
+    fig = px.bar(
+        rep_metrics,
+        x='Sales_Rep',
+        y='Net_Sales',
+        title='Top 10 Sales Representatives Performance',
+        color='Avg_Target_Achievement',
+        color_continuous_scale='RdYlGn',
+        hover_data=['Profit', 'Orders', 'Customers']
+    )
+    
+    fig.update_layout(
+        height=400,
+        title_x=0.5,
+        xaxis_title="Sales Representative",
+        yaxis_title="Net Sales ($)",
+        xaxis_tickangle=-45,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def create_customer_analysis(df):
+    """Create customer segment analysis"""
+    return plot_customer_analysis(engine.aggregate_segment_metrics(df))
+
+@profiled()
+def plot_customer_analysis(segment_metrics):
+    """Plot customer segment analysis from aggregated metrics"""
+    
+    # Create subplot with multiple metrics
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=['Revenue by Segment', 'Customer Count by Segment'],
+        specs=[[{"type": "bar"}, {"type": "pie"}]]
+    )
+    
+    # Revenue bar chart
+    fig.add_trace(
+        go.Bar(
+            x=segment_metrics['Segment'],
+            y=segment_metrics['Net_Sales'],
+            name='Revenue',
+            marker_color='lightcoral',
+            hovertemplate='<b>%{x}</b><br>Revenue: $%{y:,.0f}<extra></extra>'
+        ),
+        row=1, col=1
+    )
+    
+    # Customer count pie chart
+    fig.add_trace(
+        go.Pie(
+            labels=segment_metrics['Segment'],
+            values=segment_metrics['Customers'],
+            name='Customers',
+            hovertemplate='<b>%{label}</b><br>Customers: %{value}<br>Percentage: %{percent}<extra></extra>'
+        ),
+        row=1, col=2
+    )
+    
+    fig.update_layout(
+        height=400,
+        title_text="Customer Segment Analysis",
+        title_x=0.5,
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def plot_rfm_segments(rfm_metrics):
+    """Plot revenue and customers per RFM segment (dashboard_rfm.segment_metrics)"""
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=['Revenue by RFM Segment', 'Customers by RFM Segment'],
+        specs=[[{"type": "bar"}, {"type": "bar"}]]
+    )
+    
+    fig.add_trace(
+        go.Bar(
+            x=rfm_metrics['Segment'],
+            y=rfm_metrics['Net_Sales'],
+            name='Revenue',
+            marker_color='teal',
+            customdata=rfm_metrics[['Share']],
+            hovertemplate='<b>%{x}</b><br>Revenue: $%{y:,.0f}<br>Share: %{customdata[0]:.1f}%<extra></extra>'
+        ),
+        row=1, col=1
+    )
+    
+    fig.add_trace(
+        go.Bar(
+            x=rfm_metrics['Segment'],
+            y=rfm_metrics['Customers'],
+            name='Customers',
+            marker_color='lightseagreen',
+            hovertemplate='<b>%{x}</b><br>Customers: %{y:,}<extra></extra>'
+        ),
+        row=1, col=2
+    )
+    
+    fig.update_layout(
+        height=400,
+        title_text="RFM Customer Segments",
+        title_x=0.5,
+        showlegend=False,
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def create_profitability_analysis(df):
+    """Create profitability analysis chart
+
+    One trace per category. Points carry typed sales, profit, quantity and margin arrays, plus
+    their product and region as hover text built from one label per product/region pair.
+    """
+    
+    # Per-point values as compact typed arrays, rounded to what the hover shows
+    net_sales = typed_array(df['Net_Sales'])
+    profit = typed_array(df['Profit'])
+    margin = typed_array(df['Profit_Margin'], 1)
+    quantity = df['Quantity'].to_numpy()
+    
+    # 'Product (Region)' formatted once per pair, then looked up per point
+    product_codes, products = df['Product_Name'].factorize()
+    region_codes, regions = df['Region'].factorize()
+    labels = np.array([f'{product} ({region})' for product in products for region in regions], dtype=object)
+    hover_text = labels[product_codes * len(regions) + region_codes]
+    
+    trace_type = go.Scattergl if len(df) > 1000 else go.Scatter
+    sizeref = 2.0 * max(quantity.max(initial=0), 1) / 20 ** 2
+    
+    # Create scatter plot of sales vs profit (one trace, legend entry and colour per category)
+    fig = go.Figure()
+    for i, (category, rows) in enumerate(df.groupby('Product_Category', observed=True, sort=False).indices.items()):
+        fig.add_trace(trace_type(
+            x=net_sales[rows],
+            y=profit[rows],
+            customdata=margin[rows],
+            text=hover_text[rows],
+            name=category,
+            mode='markers',
+            # Marker area follows Quantity as in Plotly Express (largest 20px)
+            marker=dict(color=CATEGORY_COLORS[i % len(CATEGORY_COLORS)], size=quantity[rows],
+                        sizemode='area', sizeref=sizeref),
+            hovertemplate='<b>%{text}</b><br>Category: %{fullData.name}<br>Net Sales: $%{x:,.0f}<br>'
+                          'Profit: $%{y:,.0f}<br>Margin: %{customdata:.1f}%<br>Quantity: %{marker.size}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title='Sales vs Profit Analysis',
+        legend_title_text='Product Category',
+        template='plotly_white',
+        height=500,
+        title_x=0.5,
+        xaxis_title="Net Sales ($)",
+        yaxis_title="Profit ($)"
+    )
+    
+    return fig
+
+# Axis labels of the histogram measures
+HISTOGRAM_LABELS = {
+    'Net_Sales': 'Order Value ($)',
+    'Profit_Margin': 'Profit Margin (%)',
+    'Discount': 'Discount Rate'
+}
+
+@profiled()
+def plot_histogram(histogram, measure, scale='linear'):
+    """Plot server-side bin counts (one bar per bin, never the raw values)"""
+    
+    label = HISTOGRAM_LABELS.get(measure, measure)
+    title = f"{label} Distribution"
+    
+    # A log axis cannot show the bin of zero/negative values: report it in the title instead
+    if scale == 'log' and len(histogram) and histogram['Bin_Start'].iloc[0] <= 0:
+        title += f" ({histogram['Orders'].iloc[0]:,} orders at or below 0 not shown)"
+        histogram = histogram.iloc[1:]
+    
+    if scale == 'log':
+        centres = (histogram['Bin_Start'] * histogram['Bin_End']) ** 0.5
+    else:
+        centres = (histogram['Bin_Start'] + histogram['Bin_End']) / 2
+    
+    fig = go.Figure()
+    
+    fig.add_trace(
+        go.Bar(
+            x=centres,
+            y=histogram['Orders'],
+            name='Orders',
+            marker_color='mediumpurple',
+            customdata=histogram[['Bin_Start', 'Bin_End']],
+            hovertemplate='%{customdata[0]:,.3~f} – %{customdata[1]:,.3~f}<br>Orders: %{y:,}<extra></extra>'
+        )
+    )
+    
+    fig.update_layout(
+        title=title,
+        title_x=0.5,
+        xaxis_title=label,
+        yaxis_title="Orders",
+        xaxis_type='log' if scale == 'log' else 'linear',
+        bargap=0.02,
+        height=400,
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def plot_cohort_heatmap(cohorts, metric='retention'):
+    """Plot a cohort x months-since heatmap (dashboard_cohorts.cohort_matrix)"""
+    
+    matrix = cohorts[metric]
+    value_format = {'retention': '%{z:.1f}%', 'customers': '%{z:,.0f}', 'revenue': '$%{z:,.0f}'}[metric]
+    
+    fig = go.Figure(
+        go.Heatmap(
+            z=typed_array(matrix.to_numpy(), 1),
+            x=list(matrix.columns),
+            y=list(matrix.index),
+            colorscale='Blues',
+            # Month 0 is 100% by definition; capping the colour scale keeps later months readable
+            zmax=matrix.iloc[:, 1:].max().max() if metric == 'retention' and matrix.shape[1] > 1 else None,
+            customdata=np.repeat(cohorts['sizes'].to_numpy()[:, None], matrix.shape[1], axis=1),
+            hovertemplate=f'<b>Cohort:</b> %{{y}} (%{{customdata:,}} customers)<br>'
+                          f'<b>Months since first order:</b> %{{x}}<br><b>Value:</b> {value_format}<extra></extra>'
+        )
+    )
+    
+    fig.update_layout(
+        title=f"Cohort {COHORT_METRICS[metric]} by Months Since First Order",
+        title_x=0.5,
+        xaxis_title="Months Since First Order",
+        yaxis_title="First-Order Month",
+        yaxis_autorange='reversed',
+        height=max(400, 18 * len(matrix)),
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def plot_product_affinity(basket, metric='lift'):
+    """Plot a product x product affinity heatmap (dashboard_basket.co_purchase_matrix)"""
+    
+    products = heatmap_products(basket)
+    matrix = affinity_matrix(basket, metric).loc[products, products]
+    value_format = {'lift': '%{z:.2f}', 'confidence': '%{z:.1f}%', 'support': '%{z:.2f}%'}[metric]
+    
+    fig = go.Figure(
+        go.Heatmap(
+            z=typed_array(matrix.to_numpy(), 2),
+            x=products,
+            y=products,
+            # Lift is centred on 1 (independent purchases): above is affinity, below is substitution
+            colorscale='RdBu_r' if metric == 'lift' else 'Blues',
+            zmid=1 if metric == 'lift' else None,
+            customdata=basket['pairs'].loc[products, products].to_numpy(),
+            hovertemplate=f'<b>%{{y}}</b> -> <b>%{{x}}</b><br>Customers: %{{customdata:,}}<br>'
+                          f'{BASKET_METRICS[metric]}: {value_format}<extra></extra>'
+        )
+    )
+    
+    fig.update_layout(
+        title=f"Product Co-Purchase {BASKET_METRICS[metric]}",
+        title_x=0.5,
+        xaxis_title="Also Bought",
+        yaxis_title="Product",
+        yaxis_autorange='reversed',
+        height=max(450, 20 * len(products)),
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def plot_scenarios(scenario_results):
+    """Plot net sales and profit change vs the baseline per what-if scenario (dashboard_scenarios)"""
+    
+    scenarios = scenario_results.iloc[1:]
+    fig = go.Figure()
+    for measure, label, color in [('Net_Sales_Change', 'Net Sales', 'steelblue'), ('Profit_Change', 'Profit', 'teal')]:
+        fig.add_trace(
+            go.Bar(
+                x=scenarios['Scenario'],
+                y=scenarios[measure],
+                name=label,
+                marker_color=color,
+                customdata=scenarios[['Margin']],
+                hovertemplate=f'<b>%{{x}}</b><br>{label} change: $%{{y:+,.0f}}<br>'
+                              f'Margin: %{{customdata[0]:.1f}}%<extra></extra>'
+            )
+        )
+    
+    fig.add_hline(y=0, line_color='gray', line_width=1)
+    fig.update_layout(
+        title=f"What-If Scenarios vs Baseline (margin {scenario_results['Margin'].iloc[0]:.1f}%)",
+        title_x=0.5,
+        barmode='group',
+        yaxis_title="Change ($)",
+        height=450,
+        template='plotly_white'
+    )
+    
+    return fig
+
+@profiled()
+def plot_live_orders(minutes):
+    """Plot live sales per minute (the feed's most recent minutes)"""
+    
+    fig = go.Figure()
+    
+    fig.add_trace(
+        go.Bar(
+            x=minutes['Minute'],
+            y=minutes['Net_Sales'],
+            name='Net Sales',
+            marker_color='crimson',
+            customdata=minutes[['Orders']],
+            hovertemplate='%{x|%H:%M}<br>Sales: $%{y:,.0f}<br>Orders: %{customdata[0]:,.0f}<extra></extra>'
+        )
+    )
+    
+    fig.update_layout(
+        title="Live Sales per Minute",
+        title_x=0.5,
+        xaxis_title="Time",
+        yaxis_title="Net Sales ($)",
+        height=350,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def create_dashboard_figures(df):
+    """Build every dashboard figure for a filtered dataset, in page order"""
+    
+    return {
+        'time_series': create_time_series_chart(df),
+        'regional_performance': create_regional_performance(df),
+        'category_analysis': create_category_analysis(df),
+        'customer_analysis': create_customer_analysis(df),
+        'sales_rep_performance': create_sales_rep_performance(df),
+        'profitability_analysis': create_profitability_analysis(df)
+    }
+
+@profiled()
+def create_period_comparison_chart(comparison, measure_label, mode_label):
+    """Create current vs comparison chart with percentage change"""
+    
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    # Current period values
+    fig.add_trace(
+        go.Bar(
+            x=comparison['Period'],
+            y=comparison['Current'],
+            name='Current',
+            marker_color='#1f77b4',
+            hovertemplate='<b>%{x}</b><br>Current: %{y:,.0f}<extra></extra>'
+        ),
+        secondary_y=False
+    )
+    
+    # Comparison values
+    fig.add_trace(
+        go.Scatter(
+            x=comparison['Period'],
+            y=comparison['Comparison'],
+            mode='lines+markers',
+            name=mode_label,
+            line=dict(color='#ff7f0e', width=2),
+            hovertemplate='<b>%{x}</b><br>Comparison: %{y:,.0f}<extra></extra>'
+        ),
+        secondary_y=False
+    )
+    
+    # Change percentage
+    fig.add_trace(
+        go.Scatter(
+            x=comparison['Period'],
+            y=comparison['Change_Pct'],
+            mode='lines',
+            name='Change %',
+            line=dict(color='#2ca02c', width=1, dash='dot'),
+            hovertemplate='<b>%{x}</b><br>Change: %{y:+.1f}%<extra></extra>'
+        ),
+        secondary_y=True
+    )
+    
+    fig.update_layout(
+        height=450,
+        title_text=f"{measure_label}: {mode_label}",
+        title_x=0.5,
+        template='plotly_white',
+        legend=dict(orientation='h', y=-0.15)
+    )
+    fig.update_yaxes(title_text=measure_label, secondary_y=False)
+    fig.update_yaxes(title_text="Change (%)", secondary_y=True)
+    
+    return fig
@@ -0,0 +1,104 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Cohort Retention
+Objective: Active customers and revenue by first-order month x months since, in one vectorized pass
+
+Usage:
+    python dashboard_cohorts.py
+    python dashboard_cohorts.py --rows 5000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+from dashboard_profiling import profiled
+
+COHORT_METRICS = {
+    'retention': 'Retention (%)',
+    'customers': 'Active Customers',
+    'revenue': 'Revenue ($)'
+}
+
+# =============================================================================
+# COHORT MATRIX
+# =============================================================================
+
+@profiled()
+def cohort_matrix(customer_months):
+    """Cohort (first-order month) x months-since matrices from customer-month activity
+
+    customer_months has one row per active customer and month (engine.aggregate_customer_months).
+    Returns 'customers', 'revenue' and 'retention' frames indexed by cohort month (columns 0..N),
+    plus 'sizes' (new customers per cohort).
+    """
+    if customer_months.empty:
+        index = pd.Index([], name='Cohort')
+        return {**{metric: pd.DataFrame(index=index) for metric in COHORT_METRICS},
+                'sizes': pd.Series([], index=index, dtype='int64', name='Customers')}
+
+    # Integer codes for customers and months, so the pivot is a bincount instead of a groupby-apply
+    customers = pd.factorize(customer_months['Customer_ID'])[0]
+    months = customer_months['Month_Index'].to_numpy(dtype=np.int64)
+    first_month, n_months = months.min(), months.max() - months.min() + 1
+    months = months - first_month
+
+    first_order = np.full(customers.max() + 1, n_months, dtype=np.int64)
+    order = np.lexsort((months, customers))
+    starts = np.flatnonzero(np.r_[True, customers[order][1:] != customers[order][:-1]])
+    first_order[customers[order][starts]] = months[order][starts]
+
+    cohort = first_order[customers]
+    cell = cohort * n_months + (months - cohort)
+    shape = (n_months, n_months)
+    active = np.bincount(cell, minlength=n_months * n_months).reshape(shape)
+    revenue = np.bincount(cell, weights=customer_months['Net_Sales'].to_numpy(dtype=float),
+                          minlength=n_months * n_months).reshape(shape)
+
+    # Cohorts with no new customers are dropped; ages past the end of the data stay NaN
+    keep = active[:, 0] > 0
+    observed = np.arange(n_months)[None, :] < (n_months - np.arange(n_months))[:, None]
+    index = pd.Index([
+        f"{(first_month + m) // 12}-{(first_month + m) % 12 + 1:02d}" for m in np.flatnonzero(keep)
+    ], name='Cohort')
+    columns = pd.Index(range(n_months), name='Months_Since')
+
+    def frame(values):
+        return pd.DataFrame(np.where(observed, values, np.nan)[keep], index=index, columns=columns)
+
+    sizes = np.maximum(active[:, :1], 1)
+    return {
+        'customers': frame(active),
+        'revenue': frame(revenue),
+        'retention': frame(active / sizes * 100),
+        'sizes': pd.Series(active[keep, 0], index=index, name='Customers')
+    }
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Build the cohort matrix of a dataset and print its first months of retention"""
+
+    parser = argparse.ArgumentParser(description="Cohort retention matrix")
+    parser.add_argument('--rows', type=int, default=None, help="Generate this many rows (default: 5,000-row dataset)")
+    parser.add_argument('--months', type=int, default=6, help="Months since first order to print")
+    args = parser.parse_args()
+
+    df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+
+    start = time.perf_counter()
+    activity = engine.aggregate_customer_months(df)
+    middle = time.perf_counter()
+    cohorts = cohort_matrix(activity)
+    elapsed = time.perf_counter() - middle
+
+    print(f"👥 {activity['Customer_ID'].nunique():,} customers, {len(activity):,} customer-months "
+          f"(activity {(middle - start) * 1000:.0f}ms, matrix {elapsed * 1000:.0f}ms)")
+    print(cohorts['retention'].iloc[:, :args.months].round(1).to_string())
+
+if __name__ == "__main__":
+    main()
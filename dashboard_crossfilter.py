@@ -0,0 +1,332 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Cross-Filtering from Pre-Aggregates
+Objective: Answer region/category/segment click selections from a dense cube instead of rescanning orders
+"""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+import dashboard_histograms as histograms
+import dashboard_sketches as sketches
+from dashboard_profiling import profiled
+
+# Cross-filter name -> cube axis column (the charts that can be clicked)
+CROSSFILTER_DIMENSIONS = {
+    'regions': 'Region',
+    'categories': 'Product_Category',
+    'segments': 'Customer_Segment'
+}
+
+# Second cube axis -> measures kept for it
+CUBE_KEYS = {
+    'Date': ['Net_Sales', 'Profit', 'Orders'],
+    'Sales_Rep': ['Net_Sales', 'Profit', 'Orders', 'Target_Achievement'],
+    'Product_Name': ['Net_Sales', 'Profit', 'Orders', 'Profit_Margin']
+}
+
+# Rep x customer bitsets per cell are kept up to this size; above it rep customer counts read the rows
+REP_BITSET_BYTES = 16 * 1024 ** 2
+
+# Measures kept per region x category x segment cell
+CELL_MEASURES = ['Net_Sales', 'Profit', 'Orders', 'Profit_Margin', 'Customer_Lifetime_Value']
+
+# =============================================================================
+# CUBE CONSTRUCTION
+# =============================================================================
+
+def _popcount(bitsets):
+    """Set bits per row of a packed uint8 bitset array"""
+    return np.unpackbits(bitsets, axis=-1).sum(axis=-1)
+
+def _packed_bits(rows, members, n_rows, n_members):
+    """Packed bitsets (np.packbits layout) with bit members[i] set in row rows[i], without a dense bool array"""
+    bits = np.zeros((n_rows, (n_members + 7) // 8), dtype=np.uint8)
+    np.bitwise_or.at(bits, (rows, members >> 3), (128 >> (members & 7)).astype(np.uint8))
+    return bits
+
+class CrossFilterCube:
+    @profiled('build_crossfilter_cube')
+    def __init__(self, filtered_df, window_daily, value_ranges=None):
+        """Dense region x category x segment cube of one sidebar selection
+
+        window_daily holds unfiltered daily Net_Sales/Orders over engine.kpi_data_window,
+        so the KPI previous period can be answered for any cross-filter.
+        value_ranges fixes the histogram bins (the whole dataset's, not this selection's).
+        """
+        self.rows = filtered_df
+        self.value_ranges = value_ranges or engine.value_ranges(filtered_df)
+        self.window_daily = window_daily.set_index('Date')[['Net_Sales', 'Orders']]
+
+        # Cell code of every order: (region, category, segment) flattened
+        self.values = {}
+        self.row_cell = np.zeros(len(filtered_df), dtype=np.int64)
+        for column in CROSSFILTER_DIMENSIONS.values():
+            codes, uniques = pd.factorize(filtered_df[column], sort=True)
+            self.values[column] = list(uniques)
+            self.row_cell = self.row_cell * len(uniques) + codes
+        self.shape = tuple(len(v) for v in self.values.values())
+        n_cells = int(np.prod(self.shape))
+
+        measures = {
+            'Net_Sales': filtered_df['Net_Sales'].to_numpy(dtype=float),
+            'Profit': filtered_df['Profit'].to_numpy(dtype=float),
+            'Orders': None,
+            'Profit_Margin': filtered_df['Profit_Margin'].to_numpy(dtype=float),
+            'Target_Achievement': filtered_df['Target_Achievement'].to_numpy(dtype=float),
+            'Customer_Lifetime_Value': filtered_df['Customer_Lifetime_Value'].to_numpy(dtype=float)
+        }
+
+        # Additive measures: cells[measure][cell] and keyed[key][measure][cell, key_value]
+        self.cells = {
+            m: np.bincount(self.row_cell, weights=measures[m], minlength=n_cells) for m in CELL_MEASURES
+        }
+        self.keys = {}
+        self.keyed = {}
+        key_codes = {}
+        for key, key_measures in CUBE_KEYS.items():
+            codes, uniques = pd.factorize(filtered_df[key], sort=True)
+            key_codes[key] = codes
+            self.keys[key] = uniques
+            flat = self.row_cell * len(uniques) + codes
+            self.keyed[key] = {
+                m: np.bincount(flat, weights=measures[m], minlength=n_cells * len(uniques)).reshape(n_cells, -1)
+                for m in key_measures
+            }
+
+        # Quantiles are not additive either: a small t-digest per cell, merged for any cross-filter
+        self.digests = {
+            m: sketches.cell_digests(self.row_cell, measures[m], n_cells) for m in engine.QUANTILE_MEASURES
+        }
+
+        # Histogram bin counts per cell, for every measure and scale
+        self.histograms = {}
+        for m in engine.HISTOGRAM_MEASURES:
+            values = filtered_df[m].to_numpy(dtype=float)
+            for scale in histograms.SCALES:
+                flat = self.row_cell * histograms.N_BINS + histograms.bin_codes(values, self.value_ranges[m], scale)
+                self.histograms[m, scale] = np.bincount(flat, minlength=n_cells * histograms.N_BINS) \
+                    .reshape(n_cells, histograms.N_BINS)
+
+        # Customers are too many for a dense cell x customer axis: sums per (customer, cell) pair
+        # present in the rows, ordered by customer so a selection reduces them per customer
+        customers, self.customer_ids = pd.factorize(filtered_df['Customer_ID'], sort=True)
+        n_customers = len(self.customer_ids)
+        pairs, pair_index = np.unique(customers * n_cells + self.row_cell, return_inverse=True)
+        self.pair_cell = pairs % n_cells
+        pair_customer = pairs // n_cells
+        self.pair_sales = np.bincount(pair_index, weights=measures['Net_Sales'], minlength=len(pairs))
+        self.pair_orders = np.bincount(pair_index, minlength=len(pairs))
+        self.customer_starts = np.flatnonzero(np.diff(pair_customer, prepend=-1))
+
+        # Distinct customers are not additive: packed customer bitsets per cell and per (cell, rep)
+        self.customer_bits = _packed_bits(self.pair_cell, pair_customer, n_cells, n_customers)
+
+        n_reps = len(self.keys['Sales_Rep'])
+        self.rep_customer_bits = None
+        if n_cells * n_reps * self.customer_bits.shape[1] <= REP_BITSET_BYTES:
+            rep_pairs = np.unique((self.row_cell * n_reps + key_codes['Sales_Rep']) * n_customers + customers)
+            self.rep_customer_bits = _packed_bits(
+                rep_pairs // n_customers, rep_pairs % n_customers, n_cells * n_reps, n_customers
+            ).reshape(n_cells, n_reps, -1)
+
+    def cell_mask(self, crossfilters, exclude=None):
+        """Boolean mask over cells for the active cross-filters (a chart ignores its own)"""
+        axes = []
+        for name, column in CROSSFILTER_DIMENSIONS.items():
+            selected = crossfilters.get(name) or []
+            if name == exclude or not selected:
+                axes.append(np.ones(len(self.values[column]), dtype=bool))
+            else:
+                axes.append(np.isin(self.values[column], selected))
+        return (axes[0][:, None, None] & axes[1][None, :, None] & axes[2][None, None, :]).ravel()
+
+    def view(self, crossfilters):
+        """Backend-like view of the cube under a set of cross-filters"""
+        return CrossFilterView(self, crossfilters)
+
+# =============================================================================
+# CROSS-FILTERED VIEW
+# =============================================================================
+
+class CrossFilterView:
+    name = 'crossfilter'
+
+    def __init__(self, cube, crossfilters):
+        """Same methods as the execution backends; the sidebar selection is baked into the cube"""
+        self.cube = cube
+        self.crossfilters = crossfilters
+        self.value_ranges = cube.value_ranges
+
+    def _by_axis(self, axis, exclude):
+        """Cell measures summed onto one cube axis, with distinct customers per axis value"""
+        cube = self.cube
+        mask = cube.cell_mask(self.crossfilters, exclude)
+        others = tuple(i for i in range(3) if i != axis)
+
+        table = pd.DataFrame({
+            m: (cube.cells[m] * mask).reshape(cube.shape).sum(axis=others) for m in CELL_MEASURES
+        })
+        bits = (cube.customer_bits * mask[:, None]).reshape(cube.shape + (-1,))
+        table['Customers'] = _popcount(np.bitwise_or.reduce(bits, axis=others))
+        table.insert(0, 'Value', list(cube.values.values())[axis])
+        table['Orders'] = table['Orders'].astype('int64')
+        return table[table['Orders'] > 0]
+
+    def _keyed(self, key, exclude=None):
+        """Measures for every value of a second axis (dates, reps, products)"""
+        cube = self.cube
+        mask = cube.cell_mask(self.crossfilters, exclude)
+        table = pd.DataFrame({m: values[mask].sum(axis=0) for m, values in cube.keyed[key].items()})
+        table.insert(0, key, cube.keys[key])
+        return table, mask
+
+    def count_rows(self, filter_selections):
+        return int(self.cube.cells['Orders'][self.cube.cell_mask(self.crossfilters)].sum())
+
+    def fetch_rows(self, filter_selections, columns=None):
+        """Sidebar rows whose cell passes the cross-filters (cell codes are precomputed)"""
+        rows = self.cube.rows[self.cube.cell_mask(self.crossfilters)[self.cube.row_cell]]
+        return rows if columns is None else rows[columns]
+
+    def kpi_metrics(self, filter_selections):
+        """Same definitions as engine.create_kpi_metrics"""
+        cube = self.cube
+        mask = cube.cell_mask(self.crossfilters)
+        total_sales = cube.cells['Net_Sales'][mask].sum()
+        total_orders = int(cube.cells['Orders'][mask].sum())
+
+        sales_growth = 0
+        daily, _ = self._keyed('Date')
+        dates = daily.loc[daily['Orders'] > 0, 'Date']
+        if len(dates) > 0:
+            min_date, max_date = dates.min(), dates.max()
+            period_days = (max_date - min_date).days
+            if period_days > 30:
+                prev_start = min_date - timedelta(days=period_days)
+                window = cube.window_daily
+                prev = window[(window.index >= prev_start) & (window.index < min_date)]
+                prev_sales = prev['Net_Sales'].sum() if prev['Orders'].sum() > 0 else 1
+                sales_growth = ((total_sales - prev_sales) / prev_sales) * 100 if prev_sales > 0 else 0
+
+        return {
+            'total_sales': total_sales,
+            'total_profit': cube.cells['Profit'][mask].sum(),
+            'avg_profit_margin': cube.cells['Profit_Margin'][mask].sum() / total_orders if total_orders else np.nan,
+            'total_orders': total_orders,
+            'avg_order_value': total_sales / total_orders if total_orders else np.nan,
+            'unique_customers': int(_popcount(np.bitwise_or.reduce(cube.customer_bits[mask], axis=0))),
+            'sales_growth': sales_growth
+        }
+
+    def daily_sales(self, filter_selections):
+        daily, _ = self._keyed('Date')
+        daily = daily[daily['Orders'] > 0].reset_index(drop=True)
+        daily['Orders'] = daily['Orders'].astype('int64')
+        return daily
+
+    def category_metrics(self, filter_selections):
+        table = self._by_axis(1, exclude='categories')
+        table['Avg_Profit_Margin'] = table['Profit_Margin'] / table['Orders']
+        table = table.rename(columns={'Value': 'Category'})
+        return table[['Category', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin']].sort_values('Net_Sales')
+
+    def regional_metrics(self, filter_selections):
+        table = self._by_axis(0, exclude='regions').rename(columns={'Value': 'Region'})
+        return table[['Region', 'Net_Sales', 'Profit', 'Orders', 'Customers']].reset_index(drop=True)
+
+    def segment_metrics(self, filter_selections):
+        table = self._by_axis(2, exclude='segments')
+        table['Avg_CLV'] = table['Customer_Lifetime_Value'] / table['Orders']
+        table = table.rename(columns={'Value': 'Segment'})
+        return table[['Segment', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_CLV']].reset_index(drop=True)
+
+    def sales_rep_metrics(self, filter_selections, top_n=10):
+        table, mask = self._keyed('Sales_Rep')
+        table['Orders'] = table['Orders'].astype('int64')
+        if self.cube.rep_customer_bits is not None:
+            table['Customers'] = _popcount(np.bitwise_or.reduce(self.cube.rep_customer_bits[mask], axis=0))
+        else:
+            customers = self.fetch_rows(filter_selections).groupby('Sales_Rep', observed=True)['Customer_ID'].nunique()
+            table['Customers'] = customers.reindex(table['Sales_Rep'], fill_value=0).to_numpy()
+        table['Avg_Target_Achievement'] = table.pop('Target_Achievement') / table['Orders']
+        table = table[table['Orders'] > 0]
+        return table[['Sales_Rep', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_Target_Achievement']] \
+            .sort_values('Net_Sales', ascending=False).head(top_n)
+
+    def top_products(self, filter_selections, top_n=10):
+        table, _ = self._keyed('Product_Name')
+        table = table.loc[table['Orders'] > 0, ['Product_Name', 'Net_Sales']]
+        return table.sort_values('Net_Sales', ascending=False).head(top_n).reset_index(drop=True)
+
+    def top_customers(self, filter_selections, top_n=10):
+        """Customer totals reduced from the (customer, cell) pairs of the selected cells"""
+        cube = self.cube
+        if len(cube.customer_starts) == 0:
+            return pd.DataFrame({'Customer_ID': cube.customer_ids, 'Net_Sales': np.zeros(0)})
+        selected = cube.cell_mask(self.crossfilters)[cube.pair_cell]
+        table = pd.DataFrame({
+            'Customer_ID': cube.customer_ids,
+            'Net_Sales': np.add.reduceat(np.where(selected, cube.pair_sales, 0), cube.customer_starts),
+            'Orders': np.add.reduceat(np.where(selected, cube.pair_orders, 0), cube.customer_starts)
+        })
+        table = table.loc[table['Orders'] > 0, ['Customer_ID', 'Net_Sales']]
+        return table.sort_values('Net_Sales', ascending=False).head(top_n).reset_index(drop=True)
+
+    def customer_months(self, filter_selections):
+        return engine.aggregate_customer_months(self.fetch_rows(filter_selections))
+
+    def customer_products(self, filter_selections):
+        return engine.aggregate_customer_products(self.fetch_rows(filter_selections))
+
+    def scenario_cells(self, filter_selections):
+        return engine.aggregate_scenario_cells(self.fetch_rows(filter_selections))
+
+    def product_metrics(self, filter_selections, category):
+        """Drill-down products of one category, within the cross-filters"""
+        cube = self.cube
+        mask = cube.cell_mask(self.crossfilters) & cube.cell_mask({'categories': [category]})
+        table = pd.DataFrame({m: values[mask].sum(axis=0) for m, values in cube.keyed['Product_Name'].items()})
+        table.insert(0, 'Product_Name', cube.keys['Product_Name'])
+        table = table[table['Orders'] > 0]
+        table['Orders'] = table['Orders'].astype('int64')
+        table['Avg_Profit_Margin'] = table.pop('Profit_Margin') / table['Orders']
+        return table.sort_values('Net_Sales', ascending=False)
+
+    def product_orders(self, filter_selections, category, product):
+        return engine.product_orders(self.fetch_rows(filter_selections), category, product)
+
+    def quantile_metrics(self, filter_selections, group_by=None):
+        """Merged cell digests (grouped by a cube axis, which ignores its own cross-filter)"""
+        cube = self.cube
+        exclude = {column: name for name, column in CROSSFILTER_DIMENSIONS.items()}.get(group_by)
+        mask = cube.cell_mask(self.crossfilters, exclude)
+        if group_by is None:
+            group_values, cell_groups = ['All'], np.zeros(len(mask), dtype=np.int64)
+        else:
+            axis = list(CROSSFILTER_DIMENSIONS.values()).index(group_by)
+            group_values, cell_groups = cube.values[group_by], np.unravel_index(np.arange(len(mask)), cube.shape)[axis]
+
+        results = {m: sketches.merged_quantiles(cube.digests[m], mask, cell_groups) for m in engine.QUANTILE_MEASURES}
+        table = sketches.quantile_table(results, group_values, group_by)
+        if group_by is None:
+            return table
+        return table.dropna(subset=table.columns[1:], how='all').reset_index(drop=True)
+
+    def histogram(self, filter_selections, measure, scale='linear'):
+        cube = self.cube
+        counts = cube.histograms[measure, scale][cube.cell_mask(self.crossfilters)].sum(axis=0)
+        return histograms.histogram_table(counts, cube.value_ranges[measure], scale)
+
+# =============================================================================
+# CHART SELECTIONS
+# =============================================================================
+
+def selection_values(event, field):
+    """Distinct values of a Plotly click/box selection (`label` for pies, `x`/`y` for bars)"""
+    if not event:
+        return []
+    points = event.get('selection', {}).get('points', [])
+    return sorted({point[field] for point in points if field in point})
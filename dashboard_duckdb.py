@@ -0,0 +1,310 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Embedded DuckDB Execution Backend
+Objective: Run the dashboard's filter and aggregation requests as SQL in an in-process DuckDB
+"""
+import os
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+import dashboard_histograms as histograms
+import dashboard_profiling as profiling
+
+# =============================================================================
+# DUCKDB BACKEND
+# =============================================================================
+
+class DuckDBBackend:
+    name = 'duckdb'
+
+    def __init__(self, source, memory_limit=None, threads=None, temp_directory=None):
+        """Load a DataFrame into DuckDB, or query Parquet files (path or glob) in place"""
+        self.con = duckdb.connect()
+        self._value_ranges = None
+
+        # Spill to disk instead of failing when a query outgrows the memory limit
+        if memory_limit:
+            self.con.execute(f"SET memory_limit = '{memory_limit}'")
+        if threads:
+            self.con.execute(f"SET threads = {int(threads)}")
+        if temp_directory:
+            self.con.execute(f"SET temp_directory = '{temp_directory}'")
+
+        if isinstance(source, pd.DataFrame):
+            self.con.register('sales_source', source)
+            self.con.execute("CREATE TABLE sales AS SELECT * FROM sales_source")
+            self.con.unregister('sales_source')
+            self.partitioned = False
+        else:
+            # A dataset root written by dashboard_storage: Year=/Month= directories
+            if os.path.isdir(source):
+                source = os.path.join(source, '**', '*.parquet')
+            # DDL cannot take prepared parameters, so quote the path as a literal
+            path = str(source).replace("'", "''")
+            self.con.execute(
+                f"CREATE VIEW sales AS SELECT * FROM read_parquet('{path}', hive_partitioning = true, union_by_name = true)"
+            )
+            self.partitioned = True
+
+    @property
+    def value_ranges(self):
+        """Histogram bin ranges of the dataset (one aggregate query, then reused)"""
+        if self._value_ranges is None:
+            select = ', '.join(
+                f'MIN("{m}"), MIN("{m}") FILTER (WHERE "{m}" > 0), MAX("{m}")' for m in engine.HISTOGRAM_MEASURES
+            )
+            row = self._query('value_ranges', f"SELECT {select} FROM sales").iloc[0].to_numpy(dtype=float)
+            self._value_ranges = {}
+            for i, measure in enumerate(engine.HISTOGRAM_MEASURES):
+                low, low_positive, high = row[3 * i:3 * i + 3]
+                self._value_ranges[measure] = [low, high if np.isnan(low_positive) else low_positive, high]
+        return self._value_ranges
+
+    def _query(self, stage_name, sql, params=()):
+        """Run a query on a per-call cursor (safe across sessions) and return a DataFrame"""
+        with profiling.stage(f'duckdb:{stage_name}'):
+            return self.con.cursor().execute(sql, list(params)).df()
+
+    def _where(self, filter_selections):
+        """SQL WHERE clause and parameters for a sidebar selection"""
+        filters = dict(engine.normalize_filters(filter_selections))
+        clauses = []
+        params = []
+
+        if filters['date_range']:
+            start_date, end_date = filters['date_range']
+            clauses.append('"Date" >= ? AND "Date" <= ?')
+            params += [pd.Timestamp(start_date).to_pydatetime(), pd.Timestamp(end_date).to_pydatetime()]
+            if self.partitioned:
+                # Plain comparisons on the partition columns, so DuckDB skips whole Year/Month files
+                start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+                clauses.append('("Year" > ? OR ("Year" = ? AND "Month" >= ?))')
+                clauses.append('("Year" < ? OR ("Year" = ? AND "Month" <= ?))')
+                params += [start.year, start.year, start.month, end.year, end.year, end.month]
+
+        for name in ['regions', 'categories', 'segments']:
+            values = filters[name]
+            if values:
+                column = engine.FILTER_COLUMNS[name]
+                clauses.append(f'"{column}" IN ({", ".join("?" for _ in values)})')
+                params += list(values)
+
+        if filters['sales_rep'] != 'All':
+            clauses.append('"Sales_Rep" = ?')
+            params.append(filters['sales_rep'])
+
+        if filters['customers'] is not None:
+            # One list parameter instead of thousands of placeholders
+            clauses.append('list_contains(?::VARCHAR[], "Customer_ID")')
+            params.append(list(filters['customers']))
+
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def count_rows(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return int(self._query('count_rows', f"SELECT COUNT(*) AS n FROM sales {where}", params)['n'].iloc[0])
+
+    def fetch_rows(self, filter_selections, columns=None):
+        where, params = self._where(filter_selections)
+        select = ', '.join(f'"{c}"' for c in columns) if columns else '*'
+        return self._query('fetch_rows', f"SELECT {select} FROM sales {where}", params)
+
+    def kpi_metrics(self, filter_selections):
+        """Same definitions as engine.create_kpi_metrics, in two aggregate queries"""
+        where, params = self._where(filter_selections)
+        row = self._query('kpi_metrics', f"""
+            SELECT
+                COALESCE(SUM("Net_Sales"), 0) AS total_sales,
+                COALESCE(SUM("Profit"), 0) AS total_profit,
+                AVG("Profit_Margin") AS avg_profit_margin,
+                COUNT(*) AS total_orders,
+                AVG("Net_Sales") AS avg_order_value,
+                COUNT(DISTINCT "Customer_ID") AS unique_customers,
+                MIN("Date") AS min_date,
+                MAX("Date") AS max_date
+            FROM sales {where}
+        """, params).iloc[0]
+
+        sales_growth = 0
+        if row['total_orders'] > 0:
+            min_date, max_date = pd.Timestamp(row['min_date']), pd.Timestamp(row['max_date'])
+            period_days = (max_date - min_date).days
+
+            # If more than 30 days, compare with previous period (unfiltered, as in the pandas path)
+            if period_days > 30:
+                prev_start = min_date - pd.Timedelta(days=period_days)
+                prev_where, prev_params = self._where({'date_range': (prev_start, min_date)})
+                prev = self._query('kpi_previous_period', f"""
+                    SELECT COALESCE(SUM("Net_Sales"), 0) AS sales, COUNT(*) AS orders
+                    FROM sales {prev_where} AND "Date" < ?
+                """, prev_params + [min_date.to_pydatetime()]).iloc[0]
+
+                prev_sales = prev['sales'] if prev['orders'] > 0 else 1
+                sales_growth = ((row['total_sales'] - prev_sales) / prev_sales) * 100 if prev_sales > 0 else 0
+
+        return {
+            'total_sales': row['total_sales'],
+            'total_profit': row['total_profit'],
+            'avg_profit_margin': np.nan if pd.isna(row['avg_profit_margin']) else row['avg_profit_margin'],
+            'total_orders': int(row['total_orders']),
+            'avg_order_value': np.nan if pd.isna(row['avg_order_value']) else row['avg_order_value'],
+            'unique_customers': int(row['unique_customers']),
+            'sales_growth': sales_growth
+        }
+
+    def daily_sales(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return self._query('daily_sales', f"""
+            SELECT "Date", SUM("Net_Sales") AS Net_Sales, SUM("Profit") AS Profit, COUNT("Order_ID") AS Orders
+            FROM sales {where}
+            GROUP BY "Date" ORDER BY "Date"
+        """, params)
+
+    def category_metrics(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return self._query('category_metrics', f"""
+            SELECT "Product_Category" AS Category, SUM("Net_Sales") AS Net_Sales, SUM("Profit") AS Profit,
+                   COUNT("Order_ID") AS Orders, AVG("Profit_Margin") AS Avg_Profit_Margin
+            FROM sales {where}
+            GROUP BY "Product_Category" ORDER BY Net_Sales ASC
+        """, params)
+
+    def regional_metrics(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return self._query('regional_metrics', f"""
+            SELECT "Region", SUM("Net_Sales") AS Net_Sales, SUM("Profit") AS Profit,
+                   COUNT("Order_ID") AS Orders, COUNT(DISTINCT "Customer_ID") AS Customers
+            FROM sales {where}
+            GROUP BY "Region" ORDER BY "Region"
+        """, params)
+
+    def sales_rep_metrics(self, filter_selections, top_n=10):
+        where, params = self._where(filter_selections)
+        return self._query('sales_rep_metrics', f"""
+            SELECT "Sales_Rep", SUM("Net_Sales") AS Net_Sales, SUM("Profit") AS Profit,
+                   COUNT("Order_ID") AS Orders, COUNT(DISTINCT "Customer_ID") AS Customers,
+                   AVG("Target_Achievement") AS Avg_Target_Achievement
+            FROM sales {where}
+            GROUP BY "Sales_Rep" ORDER BY Net_Sales DESC LIMIT {int(top_n)}
+        """, params)
+
+    def segment_metrics(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return self._query('segment_metrics', f"""
+            SELECT "Customer_Segment" AS Segment, SUM("Net_Sales") AS Net_Sales, SUM("Profit") AS Profit,
+                   COUNT("Order_ID") AS Orders, COUNT(DISTINCT "Customer_ID") AS Customers,
+                   AVG("Customer_Lifetime_Value") AS Avg_CLV
+            FROM sales {where}
+            GROUP BY "Customer_Segment" ORDER BY "Customer_Segment"
+        """, params)
+
+    def top_products(self, filter_selections, top_n=10):
+        where, params = self._where(filter_selections)
+        return self._query('top_products', f"""
+            SELECT "Product_Name", SUM("Net_Sales") AS Net_Sales
+            FROM sales {where}
+            GROUP BY "Product_Name" ORDER BY Net_Sales DESC LIMIT {int(top_n)}
+        """, params)
+
+    def top_customers(self, filter_selections, top_n=10):
+        where, params = self._where(filter_selections)
+        return self._query('top_customers', f"""
+            SELECT "Customer_ID", SUM("Net_Sales") AS Net_Sales
+            FROM sales {where}
+            GROUP BY "Customer_ID" ORDER BY Net_Sales DESC LIMIT {int(top_n)}
+        """, params)
+
+    def customer_months(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return self._query('customer_months', f"""
+            SELECT "Customer_ID", (year("Date") * 12 + month("Date") - 1)::BIGINT AS Month_Index,
+                   SUM("Net_Sales") AS Net_Sales
+            FROM sales {where}
+            GROUP BY ALL
+        """, params)
+
+    def customer_products(self, filter_selections):
+        where, params = self._where(filter_selections)
+        return self._query('customer_products', f"""
+            SELECT "Customer_ID", "Product_Name", COUNT(*) AS Orders
+            FROM sales {where}
+            GROUP BY ALL
+        """, params)
+
+    def scenario_cells(self, filter_selections):
+        where, params = self._where(filter_selections)
+        totals = ', '.join(f'SUM("{m}") AS {m}' for m in engine.SCENARIO_MEASURES)
+        return self._query('scenario_cells', f"""
+            SELECT "Product_Category", "Region", "Discount", {totals}
+            FROM sales {where}
+            GROUP BY ALL
+        """, params)
+
+    def product_metrics(self, filter_selections, category):
+        where, params = self._where(filter_selections)
+        where = f'{where} AND "Product_Category" = ?' if where else 'WHERE "Product_Category" = ?'
+        return self._query('product_metrics', f"""
+            SELECT "Product_Name", SUM("Net_Sales") AS Net_Sales, SUM("Profit") AS Profit,
+                   COUNT("Order_ID") AS Orders, AVG("Profit_Margin") AS Avg_Profit_Margin
+            FROM sales {where}
+            GROUP BY "Product_Name" ORDER BY Net_Sales DESC
+        """, params + [category])
+
+    def product_orders(self, filter_selections, category, product):
+        where, params = self._where(filter_selections)
+        where = f'{where} AND' if where else 'WHERE'
+        columns = ', '.join(f'"{c}"' for c in engine.DRILLDOWN_ORDER_COLUMNS)
+        return self._query('product_orders', f"""
+            SELECT {columns} FROM sales {where} "Product_Category" = ? AND "Product_Name" = ?
+            ORDER BY "Date" DESC, "Order_ID"
+        """, params + [category, product])
+
+    def quantile_metrics(self, filter_selections, group_by=None):
+        """Order value and margin quantiles from DuckDB's t-digest approx_quantile"""
+        where, params = self._where(filter_selections)
+        quantiles = ', '.join(str(q) for q in engine.QUANTILES)
+        select = ', '.join(
+            f'approx_quantile("{m}", [{quantiles}]) AS "{m}"' for m in engine.QUANTILE_MEASURES
+        )
+        if group_by:
+            sql = f'SELECT "{group_by}", {select} FROM sales {where} GROUP BY "{group_by}" ORDER BY "{group_by}"'
+        else:
+            sql = f'SELECT {select} FROM sales {where}'
+        table = self._query('quantile_metrics', sql, params)
+
+        # One list column per measure -> one column per quantile
+        for measure in engine.QUANTILE_MEASURES:
+            lists = table.pop(measure)
+            for i, q in enumerate(engine.QUANTILES):
+                table[engine.quantile_column(measure, q)] = [
+                    np.nan if values is None else values[i] for values in lists
+                ]
+        return table
+
+    def histogram(self, filter_selections, measure, scale='linear'):
+        """Orders per bin, with the bin computed in SQL by the same formula as histograms.bin_codes"""
+        bins = histograms.N_BINS
+        low, low_positive, high = value_range = self.value_ranges[measure]
+        if scale == 'linear':
+            width = (high - low) / bins
+            code = f'FLOOR(("{measure}" - ?) / ?)' if width > 0 else '0'
+            code_params = [low, width] if width > 0 else []
+        else:
+            start = histograms.log_start(value_range)
+            span = np.log(high) - np.log(low_positive)
+            code = f'CASE WHEN "{measure}" < ? THEN 0 ELSE {start} + FLOOR((LN("{measure}") - ?) / ? * {bins - start}) END' \
+                if span > 0 else f'CASE WHEN "{measure}" < ? THEN 0 ELSE {start} END'
+            code_params = [low_positive, np.log(low_positive), span] if span > 0 else [low_positive]
+
+        where, params = self._where(filter_selections)
+        counts = self._query('histogram', f"""
+            SELECT LEAST(GREATEST({code}, 0), {bins - 1})::INTEGER AS bin, COUNT(*) AS orders
+            FROM sales {where}
+            GROUP BY bin
+        """, code_params + params)
+        return histograms.histogram_table(
+            np.bincount(counts['bin'], weights=counts['orders'], minlength=bins), value_range, scale
+        )
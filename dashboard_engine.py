@@ -0,0 +1,686 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Headless Analytics Engine
+Objective: Load, filter and aggregate sales data without a Streamlit or Plotly runtime
+"""
+import hashlib
+import json
+
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+
+from dashboard_profiling import profiled
+
+# =============================================================================
+# FILTER DEFINITIONS
+# =============================================================================
+
+# Sidebar slicer -> dataset column
+FILTER_COLUMNS = {
+    'regions': 'Region',
+    'categories': 'Product_Category',
+    'segments': 'Customer_Segment',
+    'sales_rep': 'Sales_Rep'
+}
+
+DEFAULT_FILTERS = {
+    'date_range': (),
+    'regions': ['All'],
+    'categories': ['All'],
+    'segments': ['All'],
+    'sales_rep': 'All',
+    # Customer_IDs kept by a customer-level slicer such as the RFM segment (None = everyone)
+    'customers': None
+}
+
+# =============================================================================
+# DATASET DIMENSIONS
+# =============================================================================
+
+# Product categories and products
+CATEGORIES = ['Electronics', 'Clothing', 'Home & Garden', 'Sports', 'Books', 'Health & Beauty']
+PRODUCTS = {
+    'Electronics': ['Smartphone', 'Laptop', 'Tablet', 'Headphones', 'Smart Watch'],
+    'Clothing': ['T-Shirt', 'Jeans', 'Dress', 'Jacket', 'Shoes'],
+    'Home & Garden': ['Furniture', 'Kitchen Appliance', 'Garden Tools', 'Home Decor', 'Lighting'],
+    'Sports': ['Running Shoes', 'Gym Equipment', 'Sports Apparel', 'Outdoor Gear', 'Fitness Tracker'],
+    'Books': ['Fiction', 'Non-Fiction', 'Educational', 'Children Books', 'E-Books'],
+    'Health & Beauty': ['Skincare', 'Makeup', 'Supplements', 'Personal Care', 'Fragrances']
+}
+
+# Unit price distribution per category (mean, std)
+CATEGORY_PRICES = {
+    'Electronics': (300, 100),
+    'Clothing': (50, 20),
+    'Home & Garden': (150, 50),
+    'Sports': (80, 30),
+    'Books': (25, 10),
+    'Health & Beauty': (40, 15)
+}
+
+# Regions and sales reps
+REGIONS = ['North', 'South', 'East', 'West', 'Central']
+SALES_REPS = ['Alice Johnson', 'Bob Smith', 'Carol Davis', 'David Brown', 'Eva Wilson',
+              'Frank Miller', 'Grace Lee', 'Henry Taylor', 'Iris Chen', 'Jack Wilson']
+
+# Customer segments
+SEGMENTS = ['Enterprise', 'Small Business', 'Individual']
+SEGMENT_WEIGHTS = [0.3, 0.4, 0.3]
+
+# Seasonal multiplier by month (holiday season, summer, post-holiday)
+SEASONAL_MULTIPLIERS = {11: 1.4, 12: 1.4, 6: 1.2, 7: 1.2, 8: 1.2, 1: 0.8, 2: 0.8}
+
+# =============================================================================
+# DATA GENERATION FUNCTION
+# =============================================================================
+
+def load_sales_data():
+    """Generate comprehensive sales dataset for dashboard (reference 5,000-row dataset)"""
+
+    # Set random seed for reproducibility
+    np.random.seed(42)
+
+    # Define parameters
+    n_records = 5000
+    start_date = datetime(2022, 1, 1)
+    end_date = datetime(2024, 8, 31)
+
+    # Generate date range
+    date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+
+    # Generate synthetic data
+    records = []
+
+    for i in range(n_records):
+        # Random date with seasonal patterns (numpy returns datetime64, which has no .month)
+        date = pd.Timestamp(np.random.choice(date_range))
+        month = date.month
+
+        # Seasonal multiplier
+        seasonal_multiplier = SEASONAL_MULTIPLIERS.get(month, 1.0)
+
+        # Select category and product
+        category = np.random.choice(CATEGORIES)
+        product = np.random.choice(PRODUCTS[category])
+
+        # Generate sales data with realistic patterns
+        base_price = {
+            name: np.random.normal(mean, std)
+            for name, (mean, std) in CATEGORY_PRICES.items()
+        }[category]
+
+        unit_price = max(10, base_price * seasonal_multiplier)
+        quantity = np.random.randint(1, 10)
+        gross_sales = unit_price * quantity
+
+        # Calculate costs and profit
+        cost_rate = np.random.uniform(0.4, 0.7)
+        cost = gross_sales * cost_rate
+        profit = gross_sales - cost
+        discount = np.random.uniform(0, 0.15) if np.random.random() > 0.7 else 0
+        net_sales = gross_sales * (1 - discount)
+
+        # Customer and order details
+        customer_id = f"CUST_{np.random.randint(1000, 9999)}"
+        order_id = f"ORD_{i+1:05d}"
+
+        record = {
+            'Order_ID': order_id,
+            'Date': date,
+            'Year': date.year,
+            'Month': date.month,
+            'Month_Name': date.strftime('%B'),
+            'Quarter': f"Q{(date.month-1)//3 + 1}",
+            'Day_of_Week': date.strftime('%A'),
+            'Customer_ID': customer_id,
+            'Customer_Segment': np.random.choice(SEGMENTS, p=SEGMENT_WEIGHTS),
+            'Product_Category': category,
+            'Product_Name': product,
+            'Region': np.random.choice(REGIONS),
+            'Sales_Rep': np.random.choice(SALES_REPS),
+            'Unit_Price': round(unit_price, 2),
+            'Quantity': quantity,
+            'Gross_Sales': round(gross_sales, 2),
+            'Discount': round(discount, 3),
+            'Net_Sales': round(net_sales, 2),
+            'Cost': round(cost, 2),
+            'Profit': round(profit, 2),
+            'Profit_Margin': round((profit / gross_sales) * 100, 2)
+        }
+
+        records.append(record)
+
+    # Create DataFrame
+    df = pd.DataFrame(records)
+
+    # Add some calculated fields
+    df['Sales_Target'] = df['Net_Sales'] * np.random.uniform(0.8, 1.2, len(df))
+    df['Target_Achievement'] = (df['Net_Sales'] / df['Sales_Target']) * 100
+    df['Customer_Lifetime_Value'] = df.groupby('Customer_ID')['Net_Sales'].transform('sum')
+
+    return df
+
+def generate_sales_data(n_records, seed=42):
+    """Generate a sales dataset of any size with the same schema and distributions, vectorized"""
+
+    rng = np.random.default_rng(seed)
+
+    date_range = pd.date_range(start=datetime(2022, 1, 1), end=datetime(2024, 8, 31), freq='D')
+    dates = pd.DatetimeIndex(date_range.values[rng.integers(0, len(date_range), n_records)])
+    months = dates.month.values.astype('int64')
+
+    # Seasonal multiplier
+    season = np.ones(13)
+    for month, multiplier in SEASONAL_MULTIPLIERS.items():
+        season[month] = multiplier
+    seasonal_multiplier = season[months]
+
+    # Category, product and base price
+    category_idx = rng.integers(0, len(CATEGORIES), n_records)
+    product_idx = rng.integers(0, len(PRODUCTS[CATEGORIES[0]]), n_records)
+    product_names = np.array([PRODUCTS[c] for c in CATEGORIES], dtype=object)
+    price_params = np.array([CATEGORY_PRICES[c] for c in CATEGORIES])
+    base_price = rng.normal(price_params[category_idx, 0], price_params[category_idx, 1])
+
+    unit_price = np.maximum(10, base_price * seasonal_multiplier)
+    quantity = rng.integers(1, 10, n_records)
+    gross_sales = unit_price * quantity
+
+    # Calculate costs and profit
+    cost_rate = rng.uniform(0.4, 0.7, n_records)
+    cost = gross_sales * cost_rate
+    profit = gross_sales - cost
+    discount = np.where(rng.random(n_records) > 0.7, rng.uniform(0, 0.15, n_records), 0.0)
+    net_sales = gross_sales * (1 - discount)
+
+    df = pd.DataFrame({
+        'Order_ID': 'ORD_' + pd.Series(np.arange(1, n_records + 1)).astype(str).str.zfill(5),
+        'Date': dates,
+        'Year': dates.year.values.astype('int64'),
+        'Month': months,
+        'Month_Name': dates.month_name(),
+        'Quarter': 'Q' + pd.Series((months - 1) // 3 + 1).astype(str),
+        'Day_of_Week': dates.day_name(),
+        'Customer_ID': 'CUST_' + pd.Series(rng.integers(1000, 9999, n_records)).astype(str),
+        'Customer_Segment': np.array(SEGMENTS, dtype=object)[rng.choice(len(SEGMENTS), n_records, p=SEGMENT_WEIGHTS)],
+        'Product_Category': np.array(CATEGORIES, dtype=object)[category_idx],
+        'Product_Name': product_names[category_idx, product_idx],
+        'Region': np.array(REGIONS, dtype=object)[rng.integers(0, len(REGIONS), n_records)],
+        'Sales_Rep': np.array(SALES_REPS, dtype=object)[rng.integers(0, len(SALES_REPS), n_records)],
+        'Unit_Price': np.round(unit_price, 2),
+        'Quantity': quantity,
+        'Gross_Sales': np.round(gross_sales, 2),
+        'Discount': np.round(discount, 3),
+        'Net_Sales': np.round(net_sales, 2),
+        'Cost': np.round(cost, 2),
+        'Profit': np.round(profit, 2),
+        'Profit_Margin': np.round((profit / gross_sales) * 100, 2)
+    })
+
+    # Add some calculated fields
+    df['Sales_Target'] = df['Net_Sales'] * rng.uniform(0.8, 1.2, n_records)
+    df['Target_Achievement'] = (df['Net_Sales'] / df['Sales_Target']) * 100
+    df['Customer_Lifetime_Value'] = df.groupby('Customer_ID')['Net_Sales'].transform('sum')
+
+    return df
+
+# =============================================================================
+# FILTERING
+# =============================================================================
+
+# Measures with a server-side binned histogram
+HISTOGRAM_MEASURES = ['Net_Sales', 'Profit_Margin', 'Discount']
+
+def value_ranges(df):
+    """[min, smallest positive, max] of each histogram measure (fixes the bins for every selection)"""
+
+    ranges = {}
+    for measure in HISTOGRAM_MEASURES:
+        values = df[measure]
+        positive = values[values > 0]
+        ranges[measure] = [
+            float(values.min()),
+            float(positive.min()) if len(positive) else float(values.max()),
+            float(values.max())
+        ]
+    return ranges
+
+def dataset_info(df):
+    """Date bounds, row count, column order, slicer options and histogram ranges of a dataset"""
+
+    return {
+        'rows': int(len(df)),
+        'min_date': df['Date'].min().strftime('%Y-%m-%d'),
+        'max_date': df['Date'].max().strftime('%Y-%m-%d'),
+        'columns': list(df.columns),
+        'filter_options': get_filter_options(df),
+        'value_ranges': value_ranges(df)
+    }
+
+def dataset_version(info):
+    """Short fingerprint of a dataset's info (changes whenever rows, dates or values change)"""
+
+    return hashlib.sha1(json.dumps(info, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:12]
+
+def get_filter_options(df):
+    """Return the slicer options ('All' first) for each filter"""
+
+    return {
+        name: ['All'] + sorted(df[column].unique().tolist())
+        for name, column in FILTER_COLUMNS.items()
+    }
+
+def normalize_filters(filter_selections):
+    """Hashable, order-independent form of a filter selection ('All' collapses a slicer)"""
+
+    filters = {**DEFAULT_FILTERS, **filter_selections}
+
+    date_range = filters['date_range']
+    if date_range is not None and len(date_range) == 2:
+        dates = tuple(pd.Timestamp(d).strftime('%Y-%m-%d') for d in date_range)
+    else:
+        dates = ()
+
+    normalized = [('date_range', dates)]
+    for name in ['regions', 'categories', 'segments']:
+        selected = filters[name]
+        values = () if 'All' in selected or len(selected) == 0 else tuple(sorted(selected))
+        normalized.append((name, values))
+    normalized.append(('sales_rep', filters['sales_rep']))
+
+    # A tuple of customers is taken as already sorted (slicers build it once per selection)
+    customers = filters['customers']
+    if customers is not None and not isinstance(customers, tuple):
+        customers = tuple(sorted(customers))
+    normalized.append(('customers', customers))
+
+    return tuple(normalized)
+
+@profiled()
+def apply_filters(df, filter_selections):
+    """Apply sidebar filter selections to the dataset"""
+
+    filters = {**DEFAULT_FILTERS, **filter_selections}
+    filtered_df = df
+
+    # Date filter
+    date_range = filters['date_range']
+    if date_range is not None and len(date_range) == 2:
+        start_date, end_date = date_range
+        filtered_df = filtered_df[
+            (filtered_df['Date'] >= pd.Timestamp(start_date)) &
+            (filtered_df['Date'] <= pd.Timestamp(end_date))
+        ]
+
+    # Multi-select filters (Region, Category, Segment)
+    for name in ['regions', 'categories', 'segments']:
+        selected = filters[name]
+        if 'All' not in selected and len(selected) > 0:
+            filtered_df = filtered_df[filtered_df[FILTER_COLUMNS[name]].isin(selected)]
+
+    # Sales Rep filter
+    if filters['sales_rep'] != 'All':
+        filtered_df = filtered_df[filtered_df['Sales_Rep'] == filters['sales_rep']]
+
+    # Customer-level slicer
+    if filters['customers'] is not None:
+        filtered_df = filtered_df[filtered_df['Customer_ID'].isin(filters['customers'])]
+
+    return filtered_df
+
+# =============================================================================
+# KPI METRICS
+# =============================================================================
+
+def kpi_data_window(date_range):
+    """Dates a KPI calculation reads: the selection plus the equal-length period before it"""
+
+    start, end = (pd.Timestamp(d) for d in date_range)
+    return (start - (end - start), end)
+
+@profiled()
+def create_kpi_metrics(df, filtered_df, prefix_sums=None, totals=None):
+    """Create KPI metrics cards (prefix_sums answers the previous-period window without a scan)
+
+    totals: optional Net_Sales / Profit / Orders totals of filtered_df (PrefixSums.filtered_totals),
+    used instead of summing the filtered rows.
+    """
+
+    # Current period metrics
+    if totals is not None:
+        total_sales = totals['Net_Sales']
+        total_profit = totals['Profit']
+        total_orders = int(totals['Orders'])
+        avg_order_value = total_sales / total_orders if total_orders else np.nan
+    else:
+        total_sales = filtered_df['Net_Sales'].sum()
+        total_profit = filtered_df['Profit'].sum()
+        total_orders = len(filtered_df)
+        avg_order_value = filtered_df['Net_Sales'].mean()
+    avg_profit_margin = filtered_df['Profit_Margin'].mean()
+    unique_customers = filtered_df['Customer_ID'].nunique()
+
+    # Previous period comparison (for growth calculation)
+    if len(filtered_df) > 0:
+        min_date = filtered_df['Date'].min()
+        max_date = filtered_df['Date'].max()
+        period_days = (max_date - min_date).days
+
+        if period_days > 30:  # If more than 30 days, compare with previous period
+            prev_start = min_date - timedelta(days=period_days)
+            prev_end = min_date
+
+            if prefix_sums is not None:
+                last_day = prev_end - timedelta(days=1)
+                prev_orders = prefix_sums.range_total('Orders', prev_start, last_day)
+                prev_sales = prefix_sums.range_total('Net_Sales', prev_start, last_day) if prev_orders > 0 else 1
+            else:
+                prev_df = df[(df['Date'] >= prev_start) & (df['Date'] < prev_end)]
+                prev_sales = prev_df['Net_Sales'].sum() if len(prev_df) > 0 else 1
+            sales_growth = ((total_sales - prev_sales) / prev_sales) * 100 if prev_sales > 0 else 0
+        else:
+            sales_growth = 0
+    else:
+        sales_growth = 0
+
+    return {
+        'total_sales': total_sales,
+        'total_profit': total_profit,
+        'avg_profit_margin': avg_profit_margin,
+        'total_orders': total_orders,
+        'avg_order_value': avg_order_value,
+        'unique_customers': unique_customers,
+        'sales_growth': sales_growth
+    }
+
+# =============================================================================
+# AGGREGATIONS
+# =============================================================================
+
+@profiled()
+def aggregate_daily_sales(df):
+    """Aggregate sales, profit and order count by day"""
+
+    daily_sales = df.groupby('Date').agg({
+        'Net_Sales': 'sum',
+        'Profit': 'sum',
+        'Order_ID': 'count'
+    }).reset_index()
+    daily_sales.columns = ['Date', 'Net_Sales', 'Profit', 'Orders']
+
+    return daily_sales
+
+@profiled()
+def aggregate_category_metrics(df):
+    """Aggregate performance by product category (ascending sales)"""
+
+    category_metrics = df.groupby('Product_Category').agg({
+        'Net_Sales': 'sum',
+        'Profit': 'sum',
+        'Order_ID': 'count',
+        'Profit_Margin': 'mean'
+    }).reset_index()
+
+    category_metrics.columns = ['Category', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin']
+    category_metrics = category_metrics.sort_values('Net_Sales', ascending=True)
+
+    return category_metrics
+
+@profiled()
+def aggregate_regional_metrics(df):
+    """Aggregate performance by region"""
+
+    regional_metrics = df.groupby('Region').agg({
+        'Net_Sales': 'sum',
+        'Profit': 'sum',
+        'Order_ID': 'count',
+        'Customer_ID': 'nunique'
+    }).reset_index()
+
+    regional_metrics.columns = ['Region', 'Net_Sales', 'Profit', 'Orders', 'Customers']
+
+    return regional_metrics
+
+@profiled()
+def aggregate_sales_rep_metrics(df, top_n=10):
+    """Aggregate performance by sales rep (top N by sales)"""
+
+    rep_metrics = df.groupby('Sales_Rep').agg({
+        'Net_Sales': 'sum',
+        'Profit': 'sum',
+        'Order_ID': 'count',
+        'Customer_ID': 'nunique',
+        'Target_Achievement': 'mean'
+    }).reset_index()
+
+    rep_metrics.columns = ['Sales_Rep', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_Target_Achievement']
+    rep_metrics = rep_metrics.sort_values('Net_Sales', ascending=False).head(top_n)
+
+    return rep_metrics
+
+@profiled()
+def aggregate_segment_metrics(df):
+    """Aggregate performance by customer segment"""
+
+    segment_metrics = df.groupby('Customer_Segment').agg({
+        'Net_Sales': 'sum',
+        'Profit': 'sum',
+        'Order_ID': 'count',
+        'Customer_ID': 'nunique',
+        'Customer_Lifetime_Value': 'mean'
+    }).reset_index()
+
+    segment_metrics.columns = ['Segment', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_CLV']
+
+    return segment_metrics
+
+@profiled()
+def top_products(df, top_n=10):
+    """Top N products by net sales"""
+    return df.groupby('Product_Name')['Net_Sales'].sum().sort_values(ascending=False).head(top_n).reset_index()
+
+@profiled()
+def top_customers(df, top_n=10):
+    """Top N customers by net sales"""
+    return df.groupby('Customer_ID')['Net_Sales'].sum().sort_values(ascending=False).head(top_n).reset_index()
+
+@profiled()
+def aggregate_customer_months(df):
+    """Net sales per customer and active calendar month (Month_Index = year * 12 + month - 1)"""
+    month_index = df['Date'].dt.year * 12 + df['Date'].dt.month - 1
+    return df.assign(Month_Index=month_index).groupby(
+        ['Customer_ID', 'Month_Index'], observed=True
+    )['Net_Sales'].sum().reset_index()
+
+@profiled()
+def aggregate_customer_products(df):
+    """Orders per customer and product (the nonzero cells of the customer x product incidence)"""
+    return df.groupby(['Customer_ID', 'Product_Name'], observed=True).size().rename('Orders').reset_index()
+
+# Totals what-if scenarios adjust (dashboard_scenarios), per category, region and discount
+SCENARIO_MEASURES = ['Gross_Sales', 'Net_Sales', 'Cost', 'Profit']
+
+@profiled()
+def aggregate_scenario_cells(df):
+    """Gross sales, net sales, cost and profit per category, region and discount rate"""
+    return df.groupby(['Product_Category', 'Region', 'Discount'], observed=True)[SCENARIO_MEASURES].sum().reset_index()
+
+# Columns of the order level of the category -> product -> order drill-down
+DRILLDOWN_ORDER_COLUMNS = [
+    'Date', 'Order_ID', 'Customer_ID', 'Customer_Segment', 'Region', 'Sales_Rep',
+    'Quantity', 'Net_Sales', 'Profit', 'Profit_Margin'
+]
+
+@profiled()
+def aggregate_product_metrics(df, category):
+    """Drill-down level 2: performance of each product in one category (descending sales)"""
+
+    product_metrics = df[df['Product_Category'] == category].groupby('Product_Name').agg({
+        'Net_Sales': 'sum',
+        'Profit': 'sum',
+        'Order_ID': 'count',
+        'Profit_Margin': 'mean'
+    }).reset_index()
+
+    product_metrics.columns = ['Product_Name', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin']
+    return product_metrics.sort_values('Net_Sales', ascending=False)
+
+@profiled()
+def product_orders(df, category, product):
+    """Drill-down level 3: the orders of one product (newest first)"""
+
+    orders = df[(df['Product_Category'] == category) & (df['Product_Name'] == product)]
+    return orders[DRILLDOWN_ORDER_COLUMNS].sort_values(['Date', 'Order_ID'], ascending=[False, True])
+
+# Distribution measures reported as quantiles (KPI cards and chart hover data)
+QUANTILE_MEASURES = ['Net_Sales', 'Profit_Margin']
+QUANTILES = [0.5, 0.9, 0.99]
+
+def quantile_column(measure, q):
+    """Column name of a quantile result, e.g. Net_Sales_P90"""
+    return f"{measure}_P{int(round(q * 100))}"
+
+@profiled()
+def aggregate_quantile_metrics(df, group_by=None):
+    """Exact quantiles of order value and margin, overall (one row) or per group"""
+
+    grouped = df.groupby(group_by) if group_by else df.assign(_all='All').groupby('_all')
+    table = pd.DataFrame({
+        quantile_column(measure, q): grouped[measure].quantile(q)
+        for measure in QUANTILE_MEASURES
+        for q in QUANTILES
+    }).reset_index()
+    return table.drop(columns='_all') if group_by is None else table
+
+def compute_dashboard_aggregates(df, filtered_df):
+    """Compute KPIs and every chart/table aggregate for one filtered view"""
+
+    return {
+        'kpis': create_kpi_metrics(df, filtered_df),
+        'daily_sales': aggregate_daily_sales(filtered_df),
+        'category_metrics': aggregate_category_metrics(filtered_df),
+        'regional_metrics': aggregate_regional_metrics(filtered_df),
+        'sales_rep_metrics': aggregate_sales_rep_metrics(filtered_df),
+        'segment_metrics': aggregate_segment_metrics(filtered_df),
+        'top_products': top_products(filtered_df),
+        'top_customers': top_customers(filtered_df)
+    }
+
+# =============================================================================
+# EXECUTION BACKENDS
+# =============================================================================
+
+# Columns the row-level views (scatter, raw table, CSV export) read
+ROW_COLUMNS = [
+    'Date', 'Order_ID', 'Customer_ID', 'Customer_Segment', 'Product_Category', 'Product_Name',
+    'Region', 'Sales_Rep', 'Quantity', 'Net_Sales', 'Profit', 'Profit_Margin'
+]
+
+class PandasBackend:
+    name = 'pandas'
+
+    def __init__(self, df, prefix_sums=None, sketches=None, histograms=None, value_ranges=None):
+        """In-memory pandas execution of filter and aggregation requests
+
+        sketches: optional dashboard_sketches.QuantileSketches over df for merged-digest quantiles.
+        histograms: optional dashboard_histograms.BinnedHistograms over df for pre-binned cell counts.
+        value_ranges: histogram bin ranges when df is a slice of a larger dataset.
+        """
+        self.df = df
+        self.prefix_sums = prefix_sums
+        self.sketches = sketches
+        self.histograms = histograms
+        self._value_ranges = value_ranges
+        self._last = None
+
+    @property
+    def value_ranges(self):
+        """Histogram bin ranges of the dataset"""
+        if self._value_ranges is None:
+            self._value_ranges = self.histograms.value_ranges if self.histograms else value_ranges(self.df)
+        return self._value_ranges
+
+    def filter(self, filter_selections):
+        """Filtered frame, reused while the selection is unchanged"""
+        key = normalize_filters(filter_selections)
+        # Single (key, frame) tuple so concurrent sessions never pair a key with another's frame
+        last = self._last
+        if last is None or last[0] != key:
+            last = (key, apply_filters(self.df, filter_selections))
+            self._last = last
+        return last[1]
+
+    def count_rows(self, filter_selections):
+        return len(self.filter(filter_selections))
+
+    def fetch_rows(self, filter_selections, columns=None):
+        filtered_df = self.filter(filter_selections)
+        return filtered_df if columns is None else filtered_df[columns]
+
+    def kpi_metrics(self, filter_selections):
+        totals = self.prefix_sums.filtered_totals(filter_selections) if self.prefix_sums is not None else None
+        return create_kpi_metrics(self.df, self.filter(filter_selections), self.prefix_sums, totals)
+
+    def daily_sales(self, filter_selections):
+        return aggregate_daily_sales(self.filter(filter_selections))
+
+    def category_metrics(self, filter_selections):
+        return aggregate_category_metrics(self.filter(filter_selections))
+
+    def regional_metrics(self, filter_selections):
+        return aggregate_regional_metrics(self.filter(filter_selections))
+
+    def sales_rep_metrics(self, filter_selections, top_n=10):
+        return aggregate_sales_rep_metrics(self.filter(filter_selections), top_n)
+
+    def segment_metrics(self, filter_selections):
+        return aggregate_segment_metrics(self.filter(filter_selections))
+
+    def top_products(self, filter_selections, top_n=10):
+        return top_products(self.filter(filter_selections), top_n)
+
+    def top_customers(self, filter_selections, top_n=10):
+        return top_customers(self.filter(filter_selections), top_n)
+
+    def customer_months(self, filter_selections):
+        return aggregate_customer_months(self.filter(filter_selections))
+
+    def customer_products(self, filter_selections):
+        return aggregate_customer_products(self.filter(filter_selections))
+
+    def scenario_cells(self, filter_selections):
+        return aggregate_scenario_cells(self.filter(filter_selections))
+
+    def product_metrics(self, filter_selections, category):
+        return aggregate_product_metrics(self.filter(filter_selections), category)
+
+    def product_orders(self, filter_selections, category, product):
+        return product_orders(self.filter(filter_selections), category, product)
+
+    def quantile_metrics(self, filter_selections, group_by=None):
+        if self.sketches is not None:
+            return self.sketches.quantile_metrics(filter_selections, self.filter(filter_selections), group_by)
+        return aggregate_quantile_metrics(self.filter(filter_selections), group_by)
+
+    def histogram(self, filter_selections, measure, scale='linear'):
+        from dashboard_histograms import aggregate_histogram
+        if self.histograms is not None:
+            return self.histograms.histogram(filter_selections, self.filter(filter_selections), measure, scale)
+        return aggregate_histogram(self.filter(filter_selections), measure, scale, self.value_ranges[measure])
+
+BACKENDS = ['pandas', 'duckdb', 'streaming']
+
+def get_backend(df, name='pandas', prefix_sums=None, sketches=None, **options):
+    """Create the configured execution backend over the dataset (a DataFrame, or a Parquet path)"""
+
+    if name == 'pandas':
+        return PandasBackend(df, prefix_sums, sketches, **options)
+    if name == 'duckdb':
+        # Optional dependency: only imported when selected
+        from dashboard_duckdb import DuckDBBackend
+        return DuckDBBackend(df, **options)
+    if name == 'streaming':
+        from dashboard_streaming import StreamingBackend
+        return StreamingBackend(df, **options)
+    raise ValueError(f"Unknown backend '{name}' (expected one of: {', '.join(BACKENDS)})")
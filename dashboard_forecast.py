@@ -0,0 +1,201 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Batched Sales Forecasting
+Objective: Project Net_Sales for every rep, region and category with one seasonal least-squares fit
+
+Usage:
+    python dashboard_forecast.py
+    python dashboard_forecast.py --rows 1000000 --horizon 30 --dimension Sales_Rep
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+import dashboard_rollups as time_rollups
+from dashboard_profiling import profiled
+
+# Series fitted up front: overall, one per dimension value, and rep x category pairs
+FORECAST_GROUPINGS = [(), ('Sales_Rep',), ('Region',), ('Product_Category',), ('Sales_Rep', 'Product_Category')]
+
+HORIZON = 90
+
+# Band half-width in residual standard deviations (about 95%)
+BAND_Z = 1.96
+
+# Month-of-year terms need at least one full year of history
+SEASONAL_MIN_DAYS = 365
+
+# =============================================================================
+# MODEL: TREND + DAY OF WEEK + MONTH OF YEAR
+# =============================================================================
+
+def design_matrix(dates, start, seasonal=True):
+    """Regressors of each date: intercept, trend (years since start), weekday and month dummies"""
+    dates = pd.DatetimeIndex(dates)
+    columns = [np.ones(len(dates)), (dates - pd.Timestamp(start)).days.to_numpy() / 365.25]
+    columns += [(dates.dayofweek == d).astype(float) for d in range(1, 7)]
+    if seasonal:
+        columns += [(dates.month == m).astype(float) for m in range(2, 13)]
+    return np.column_stack(columns)
+
+def fit_series(dates, values):
+    """Least-squares coefficients of every row of values[series, day] in one solve
+
+    Returns (coefficients[regressor, series], residual std per series, seasonal flag).
+    """
+    seasonal = len(dates) >= SEASONAL_MIN_DAYS
+    X = design_matrix(dates, dates[0], seasonal)
+    coef, *_ = np.linalg.lstsq(X, values.T, rcond=None)
+    residuals = values.T - X @ coef
+    dof = max(len(dates) - X.shape[1], 1)
+    return coef, np.sqrt((residuals ** 2).sum(axis=0) / dof), seasonal
+
+def forecast_frame(dates, forecast, sigma, horizon_days=None):
+    """Date, Forecast, Lower, Upper for one series (sales cannot go below zero)"""
+    band = BAND_Z * sigma * (np.sqrt(horizon_days) if horizon_days is not None else 1)
+    return pd.DataFrame({
+        'Date': dates,
+        'Forecast': np.maximum(forecast, 0),
+        'Lower': np.maximum(forecast - band, 0),
+        'Upper': np.maximum(forecast + band, 0)
+    })
+
+# =============================================================================
+# STACKED SERIES
+# =============================================================================
+
+def series_panel(daily, groupings=FORECAST_GROUPINGS, measure='Net_Sales', date_bounds=None):
+    """(labels, dates, values[series, day]) for every grouping, built with integer codes
+
+    daily is the daily rollup (or raw orders); days without orders are zero.
+    """
+    start, end = date_bounds or (daily['Date'].min(), daily['Date'].max())
+    dates = pd.date_range(pd.Timestamp(start), pd.Timestamp(end), freq='D')
+    day = (daily['Date'] - dates[0]).dt.days.to_numpy()
+    values = daily[measure].to_numpy(dtype=float)
+
+    labels, blocks = [], []
+    for keys in groupings:
+        if keys:
+            codes = daily.groupby(list(keys), sort=True, observed=True).ngroup().to_numpy()
+            key_values = daily[list(keys)].drop_duplicates().sort_values(list(keys))
+            labels += [(keys, tuple(row)) for row in key_values.itertuples(index=False)]
+        else:
+            codes = np.zeros(len(daily), dtype=np.int64)
+            labels.append(((), ()))
+        n_series = codes.max() + 1 if len(codes) else 1
+        flat = np.bincount(codes * len(dates) + day, weights=values, minlength=n_series * len(dates))
+        blocks.append(flat.reshape(n_series, len(dates)))
+
+    return labels, dates, np.concatenate(blocks)
+
+class ForecastModel:
+    @profiled('fit_forecasts')
+    def __init__(self, labels, dates, values):
+        """One seasonal fit for all stacked series (a single multi-target least-squares solve)"""
+        self.labels = labels
+        self.lookup = {label: i for i, label in enumerate(labels)}
+        self.dates = dates
+        self.values = values
+        self.coef, self.sigma, self.seasonal = fit_series(dates, values)
+
+    def future_dates(self, horizon=HORIZON):
+        """The horizon days after the last observed day"""
+        return pd.date_range(self.dates[-1] + pd.Timedelta(days=1), periods=horizon, freq='D')
+
+    def forecasts(self, horizon=HORIZON):
+        """Daily forecasts of every series: array[series, day]"""
+        X = design_matrix(self.future_dates(horizon), self.dates[0], self.seasonal)
+        return (X @ self.coef).T
+
+    def series_index(self, filter_selections):
+        """Fitted series of a selection: overall, one rep/region/category, or one rep x category pair"""
+        filters = dict(engine.normalize_filters(filter_selections))
+        if filters['segments'] or filters['customers'] is not None:
+            return None
+        selected = {}
+        for name, column in [('regions', 'Region'), ('categories', 'Product_Category')]:
+            if len(filters[name]) > 1:
+                return None
+            if filters[name]:
+                selected[column] = filters[name][0]
+        if filters['sales_rep'] != 'All':
+            selected['Sales_Rep'] = filters['sales_rep']
+        keys = tuple(k for k in ['Sales_Rep', 'Region', 'Product_Category'] if k in selected)
+        return self.lookup.get((keys, tuple(selected[k] for k in keys)))
+
+    def series_forecast(self, series, horizon=HORIZON):
+        """Daily Date, Forecast, Lower, Upper of one fitted series"""
+        X = design_matrix(self.future_dates(horizon), self.dates[0], self.seasonal)
+        return forecast_frame(self.future_dates(horizon), X @ self.coef[:, series], self.sigma[series])
+
+    def projection_table(self, keys, horizon=HORIZON):
+        """Last horizon days vs the next horizon days for every series of one grouping"""
+        rows = [i for i, (label_keys, _) in enumerate(self.labels) if label_keys == keys]
+        projected = self.forecasts(horizon)[rows].sum(axis=1)
+        recent = self.values[rows, -horizon:].sum(axis=1)
+        table = forecast_frame(None, projected, self.sigma[rows], horizon).drop(columns='Date')
+        for i, key in enumerate(keys):
+            table.insert(i, key, [self.labels[r][1][i] for r in rows])
+        table.insert(len(keys), f'Last_{horizon}_Days', recent)
+        table['Change_Pct'] = np.where(recent > 0, (table['Forecast'] / np.where(recent > 0, recent, 1) - 1) * 100,
+                                       np.nan)
+        return table.sort_values('Forecast', ascending=False).reset_index(drop=True)
+
+@profiled()
+def build_forecast_model(daily, date_bounds=None, groupings=FORECAST_GROUPINGS):
+    """Seasonal Net_Sales forecasts for every grouping of a daily rollup"""
+    return ForecastModel(*series_panel(daily, groupings, date_bounds=date_bounds))
+
+@profiled()
+def daily_forecast(daily_series, horizon=HORIZON):
+    """Forecast of a single dense daily series (selections with no precomputed fit)"""
+    dates = pd.DatetimeIndex(daily_series.index)
+    model = ForecastModel([((), ())], dates, daily_series.to_numpy(dtype=float)[None])
+    return model.series_forecast(0, horizon)
+
+def chart_forecast(model, rollups, filter_selections, horizon=HORIZON, daily_sales=None):
+    """Forecast band of the series a chart shows: cached fit when there is one, else fitted on the spot
+
+    Customer-level selections are not in the rollups; their chart's daily_sales is fitted instead.
+    """
+    series = model.series_index(filter_selections)
+    if series is not None:
+        return model.series_forecast(series, horizon)
+    try:
+        return daily_forecast(time_rollups.rollup_series(rollups, 'daily', filter_selections), horizon)
+    except ValueError:
+        if daily_sales is None or daily_sales.empty:
+            return None
+    days = pd.date_range(daily_sales['Date'].min(), model.dates[-1], freq='D')
+    return daily_forecast(daily_sales.set_index('Date')['Net_Sales'].reindex(days, fill_value=0), horizon)
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Fit every series at once and print the projections of one dimension"""
+
+    parser = argparse.ArgumentParser(description="Batched seasonal Net_Sales forecasts")
+    parser.add_argument('--rows', type=int, default=None, help="Generate this many rows (default: 5,000-row dataset)")
+    parser.add_argument('--horizon', type=int, default=HORIZON, help="Days to project")
+    parser.add_argument('--dimension', default='Region', choices=['Sales_Rep', 'Region', 'Product_Category'])
+    args = parser.parse_args()
+
+    df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+    labels, dates, values = series_panel(time_rollups.daily_rollup(df))
+
+    start = time.perf_counter()
+    model = ForecastModel(labels, dates, values)
+    elapsed = time.perf_counter() - start
+
+    print(f"🔮 {len(labels):,} series x {len(dates):,} days fitted in {elapsed * 1000:.0f}ms "
+          f"({'trend + weekday + month' if model.seasonal else 'trend + weekday'})")
+    print(model.projection_table((args.dimension,), args.horizon).round(1).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Server-Side Binned Histograms
+Objective: Order value, margin and discount distributions as a fixed number of bars at any row count
+"""
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+from dashboard_profiling import profiled
+from dashboard_sketches import MonthCells
+
+N_BINS = 40
+SCALES = ['linear', 'log']
+
+# =============================================================================
+# BIN LAYOUT
+# =============================================================================
+
+# Bins are fixed per dataset from engine.value_ranges ([min, smallest positive, max]), so the
+# bars of any selection line up and per-cell counts can simply be added.
+# Log bins start at the smallest positive value; zeros (e.g. no discount) get their own first bin.
+
+def log_start(value_range):
+    """1 when the log layout needs a first bin for values below the smallest positive one"""
+    low, low_positive, _ = value_range
+    return 1 if low < low_positive else 0
+
+def bin_edges(value_range, scale='linear', bins=N_BINS):
+    """bins + 1 edges of a linear or log layout"""
+    low, low_positive, high = value_range
+    if scale == 'linear':
+        return np.linspace(low, high, bins + 1)
+    if log_start(value_range):
+        return np.r_[low, np.geomspace(low_positive, high, bins)]
+    return np.geomspace(low_positive, high, bins + 1)
+
+def bin_codes(values, value_range, scale='linear', bins=N_BINS):
+    """Bin of every value (the maximum falls in the last bin; out-of-range values are clipped)"""
+    low, low_positive, high = value_range
+    values = np.asarray(values, dtype=float)
+    if scale == 'linear':
+        width = (high - low) / bins
+        codes = np.floor((values - low) / width) if width > 0 else np.zeros(len(values))
+    else:
+        start = log_start(value_range)
+        span = np.log(high) - np.log(low_positive)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            codes = start + np.floor((np.log(values) - np.log(low_positive)) / span * (bins - start)) \
+                if span > 0 else np.full(len(values), float(start))
+        codes = np.where(values < low_positive, 0, codes)
+    return np.clip(codes, 0, bins - 1).astype(np.int64)
+
+def bin_counts(values, value_range, scale='linear', bins=N_BINS):
+    """Orders per bin"""
+    return np.bincount(bin_codes(values, value_range, scale, bins), minlength=bins)
+
+def histogram_table(counts, value_range, scale='linear'):
+    """One row per bin: Bin_Start, Bin_End, Orders"""
+    edges = bin_edges(value_range, scale, len(counts))
+    return pd.DataFrame({'Bin_Start': edges[:-1], 'Bin_End': edges[1:], 'Orders': np.asarray(counts, dtype='int64')})
+
+@profiled()
+def aggregate_histogram(df, measure, scale, value_range, bins=N_BINS):
+    """Histogram of the filtered rows, binned on the server"""
+    return histogram_table(bin_counts(df[measure].to_numpy(dtype=float), value_range, scale, bins), value_range, scale)
+
+# =============================================================================
+# PER-CELL BIN COUNTS
+# =============================================================================
+
+class BinnedHistograms(MonthCells):
+    @profiled('build_binned_histograms')
+    def __init__(self, df, value_ranges=None, bins=N_BINS):
+        """Counts per (month, region, category, segment) cell, for every measure and scale"""
+        super().__init__(df)
+        self.value_ranges = value_ranges or engine.value_ranges(df)
+        self.bins = bins
+
+        n_cells = len(self.cells)
+        self.counts = {}
+        for measure in engine.HISTOGRAM_MEASURES:
+            values = df[measure].to_numpy(dtype=float)
+            for scale in SCALES:
+                flat = self.cell_codes * bins + bin_codes(values, self.value_ranges[measure], scale, bins)
+                self.counts[measure, scale] = np.bincount(flat, minlength=n_cells * bins).reshape(n_cells, bins)
+
+    @profiled('binned_histogram')
+    def histogram(self, filter_selections, filtered_df, measure, scale='linear'):
+        """Cell counts summed for whole months, plus the edge rows of filtered_df binned directly"""
+        cell_mask, edge = self.split(filter_selections, filtered_df)
+        value_range = self.value_ranges[measure]
+        counts = self.counts[measure, scale][cell_mask].sum(axis=0) + \
+            bin_counts(edge[measure].to_numpy(dtype=float), value_range, scale, self.bins)
+        return histogram_table(counts, value_range, scale)
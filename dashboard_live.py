@@ -0,0 +1,316 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Live Order Feed
+Objective: Tail an append-only order file and fold each micro-batch into the live KPIs in O(batch)
+
+Usage:
+    python dashboard_live.py generate --output data/live_orders.jsonl --rate 20 --interval 1
+    python dashboard_live.py generate --output data/live_orders.csv --rate 200 --interval 0.5
+    python dashboard_live.py watch --path data/live_orders.jsonl
+"""
+import argparse
+import io
+import os
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+import pyarrow.json as pa_json
+
+import dashboard_engine as engine
+import dashboard_rollups as time_rollups
+from dashboard_streaming import COMPACT_EVERY, StreamingAggregator, empty_aggregates, folded_kpis
+
+# Newest orders kept for the live table
+RECENT_ORDERS = 20
+
+# Minutes of per-minute history kept for the live chart
+LIVE_MINUTES = 60
+
+# =============================================================================
+# ORDER FILE (JSONL OR CSV)
+# =============================================================================
+
+def file_format(path):
+    """'csv' for .csv files, JSON lines otherwise"""
+    return 'csv' if str(path).lower().endswith('.csv') else 'jsonl'
+
+def append_orders(path, orders):
+    """Append orders in one write (readers only consume complete lines)"""
+    if file_format(path) == 'csv':
+        header = not os.path.exists(path) or os.path.getsize(path) == 0
+        text = orders.to_csv(index=False, header=header, date_format='%Y-%m-%dT%H:%M:%S')
+    else:
+        text = orders.to_json(orient='records', lines=True, date_format='iso')
+        text = text if text.endswith('\n') else text + '\n'
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+class OrderFileTail:
+    def __init__(self, path):
+        """Reads only the bytes appended since the last call"""
+        self.path = path
+        self.format = file_format(path)
+        self.offset = 0
+        self.header = None
+
+    def read_new(self):
+        """New complete lines as a DataFrame (None when nothing new); a shrunk file raises"""
+        if not os.path.exists(self.path):
+            return None
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            raise EOFError(f"'{self.path}' was truncated or replaced")
+        if size == self.offset:
+            return None
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+
+        # A writer may be mid-line: stop at the last newline and pick the rest up next time
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return None
+        self.offset += end
+        chunk = chunk[:end]
+
+        if self.format == 'csv':
+            if self.header is None:
+                first_line, _, chunk = chunk.partition(b'\n')
+                self.header = first_line.decode('utf-8').strip().split(',')
+                if not chunk:
+                    return None
+            orders = pd.read_csv(io.BytesIO(chunk), names=self.header, header=None)
+        else:
+            # Arrow's JSON reader is several times faster than pandas.read_json on micro-batches
+            orders = pa_json.read_json(io.BytesIO(chunk)).to_pandas()
+
+        for column in ['Date', 'Order_Time']:
+            if column in orders:
+                orders[column] = pd.to_datetime(orders[column])
+        return orders
+
+# =============================================================================
+# LIVE VIEW (ONE PER SLICER SELECTION)
+# =============================================================================
+
+class LiveView:
+    def __init__(self, path, filter_selections, recent=RECENT_ORDERS):
+        """Running aggregates of the feed for one slicer selection (the date range does not apply)"""
+        self.path = path
+        self.filters = {**filter_selections, 'date_range': ()}
+        self.recent_size = recent
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Empty state, reading the feed from its first line"""
+        self.tail = OrderFileTail(self.path)
+        self.aggregator = StreamingAggregator(self.filters, row_limit=0)
+        self.unfolded = []
+        self.totals = pd.Series(0.0, index=['Net_Sales', 'Profit', 'Profit_Margin', 'Orders'])
+        self.daily = pd.DataFrame(columns=['Net_Sales', 'Profit', 'Orders'], dtype=float)
+        self.window_daily = pd.DataFrame(columns=['sum', 'count'], dtype=float)
+        self.customers = set()
+        self.minutes = pd.DataFrame(columns=['Orders', 'Net_Sales'], dtype=float)
+        self.recent = deque(maxlen=self.recent_size)
+        self.polls = 0
+        self.last_batch = 0
+        self.last_update = None
+
+    def poll(self):
+        """Fold whatever was appended since the last poll; returns the number of new orders"""
+        with self._lock:
+            try:
+                batch = self.tail.read_new()
+            except EOFError:
+                # The feed restarted: start over from its beginning
+                self._reset()
+                batch = self.tail.read_new()
+            self.polls += 1
+            if batch is None or batch.empty:
+                self.last_batch = 0
+                return 0
+
+            # The full table set is folded lazily in aggregates(); a poll only keeps the running KPIs
+            self.unfolded.append(batch)
+            selected = batch[self.aggregator.selection_mask(batch)]
+            self._fold_running(batch, selected)
+            self._fold_minutes(selected)
+            for record in selected.tail(self.recent_size).to_dict('records'):
+                self.recent.appendleft(record)
+
+            self.last_batch = len(selected)
+            self.last_update = pd.Timestamp.now()
+            return len(batch)
+
+    def _fold_running(self, batch, selected):
+        """KPI totals, distinct customers and daily table kept current in O(batch) (the feed spans few days)"""
+        day_totals = batch.groupby('Date')['Net_Sales'].agg(['sum', 'count'])
+        self.window_daily = day_totals if self.window_daily.empty else self.window_daily.add(day_totals, fill_value=0)
+        if selected.empty:
+            return
+        selected = selected.assign(Orders=1)
+        self.totals += selected[self.totals.index].sum()
+        self.customers.update(selected['Customer_ID'].unique())
+        partial = selected.groupby('Date')[['Net_Sales', 'Profit', 'Orders']].sum()
+        self.daily = partial if self.daily.empty else self.daily.add(partial, fill_value=0)
+
+    def _fold_minutes(self, selected):
+        """Per-minute orders and sales, keeping only the last LIVE_MINUTES minutes"""
+        if selected.empty:
+            return
+        times = selected['Order_Time'] if 'Order_Time' in selected else pd.Series(pd.Timestamp.now(), selected.index)
+        partial = selected.assign(Orders=1).groupby(times.dt.floor('min'))[['Orders', 'Net_Sales']].sum()
+        minutes = partial if self.minutes.empty else self.minutes.add(partial, fill_value=0)
+        self.minutes = minutes.sort_index().iloc[-LIVE_MINUTES:]
+
+    def snapshot(self):
+        """KPIs, daily sales, per-minute series and newest orders as of the last poll (O(days + minutes))"""
+        with self._lock:
+            orders = int(self.totals['Orders'])
+            if orders:
+                kpis = folded_kpis(self.totals, self.daily.index, self.window_daily, len(self.customers))
+            else:
+                kpis = empty_aggregates(pd.DataFrame())['kpis']
+            daily_sales = self.daily.sort_index().rename_axis('Date').reset_index()
+            daily_sales['Orders'] = daily_sales['Orders'].astype('int64')
+            return {
+                'orders': orders,
+                'kpis': kpis,
+                'daily_sales': daily_sales,
+                'minutes': self.minutes.rename_axis('Minute').reset_index(),
+                'recent': pd.DataFrame(list(self.recent)),
+                'last_batch': self.last_batch,
+                'last_update': self.last_update
+            }
+
+    def aggregates(self):
+        """Every dashboard table of the feed (categories, reps, top customers, quantiles)
+
+        Folds the batches polled since the last call, then merges the whole folded state, so call it
+        only when those tables are shown, not per refresh.
+        """
+        with self._lock:
+            if self.unfolded:
+                self.aggregator.add(pd.concat(self.unfolded, ignore_index=True))
+                self.unfolded = []
+            return self.aggregator.result()
+
+# =============================================================================
+# COMPLETED DAYS (WHOLE FEED)
+# =============================================================================
+
+class LiveDays:
+    def __init__(self, path):
+        """Daily rollup of every order in the feed, handed on once a day is complete (e.g. to anomalies)"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Empty rollup, reading the feed from its first line"""
+        self.tail = OrderFileTail(self.path)
+        self.parts = []
+
+    def poll(self):
+        """Fold whatever was appended since the last poll into the daily rollup (O(batch))"""
+        with self._lock:
+            try:
+                batch = self.tail.read_new()
+            except EOFError:
+                self._reset()
+                batch = self.tail.read_new()
+            if batch is None or batch.empty:
+                return 0
+            self.parts.append(time_rollups.daily_rollup(batch))
+            if len(self.parts) > COMPACT_EVERY:
+                self.parts = [self._merged()]
+            return len(batch)
+
+    def _merged(self):
+        """Queued batch rollups merged into one (a single group-by)"""
+        keys = ['Date'] + time_rollups.ROLLUP_DIMENSIONS
+        return pd.concat(self.parts).groupby(keys, observed=True).sum().reset_index()
+
+    def completed_days(self):
+        """Rollup rows of the days before the feed's latest day (no more orders arrive for those)"""
+        with self._lock:
+            if not self.parts:
+                return pd.DataFrame(columns=['Date'] + time_rollups.ROLLUP_DIMENSIONS + time_rollups.ROLLUP_MEASURES)
+            self.parts = [self._merged()]
+            daily = self.parts[0]
+            return daily[daily['Date'] < daily['Date'].max()]
+
+# =============================================================================
+# LOCAL ORDER GENERATOR
+# =============================================================================
+
+def generate_order_batch(n_orders, batch_number, now=None):
+    """n_orders new orders stamped with the current time (same schema as the historical data)"""
+    now = pd.Timestamp.now().floor('s') if now is None else now
+    orders = engine.generate_sales_data(n_orders, seed=batch_number)
+    day = now.normalize()
+    orders['Date'] = day
+    orders['Year'] = day.year
+    orders['Month'] = day.month
+    orders['Month_Name'] = day.strftime('%B')
+    orders['Quarter'] = f"Q{(day.month - 1) // 3 + 1}"
+    orders['Day_of_Week'] = day.strftime('%A')
+    orders['Order_ID'] = [f"LIVE_{batch_number:06d}_{i:04d}" for i in range(n_orders)]
+    orders['Order_Time'] = now
+    return orders
+
+def run_generator(path, rate, interval, batches=None):
+    """Append about rate orders per second, one batch every interval seconds"""
+    batch_number = 0
+    while batches is None or batch_number < batches:
+        n_orders = max(1, int(round(rate * interval)))
+        append_orders(path, generate_order_batch(n_orders, batch_number))
+        batch_number += 1
+        print(f"📝 Batch {batch_number}: {n_orders} orders -> {path}")
+        time.sleep(interval)
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Generate a local live order feed, or watch one fold into the live KPIs"""
+
+    parser = argparse.ArgumentParser(description="Live order feed for the sales dashboard")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate_parser = subparsers.add_parser('generate', help="Append generated orders to a JSONL/CSV file")
+    generate_parser.add_argument('--output', default='data/live_orders.jsonl', help="Order file (.jsonl or .csv)")
+    generate_parser.add_argument('--rate', type=float, default=20, help="Orders per second")
+    generate_parser.add_argument('--interval', type=float, default=1.0, help="Seconds between batches")
+    generate_parser.add_argument('--batches', type=int, default=None, help="Stop after this many batches")
+
+    watch_parser = subparsers.add_parser('watch', help="Tail an order file and print the live KPIs")
+    watch_parser.add_argument('--path', default='data/live_orders.jsonl', help="Order file (.jsonl or .csv)")
+    watch_parser.add_argument('--interval', type=float, default=2.0, help="Seconds between polls")
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        run_generator(args.output, args.rate, args.interval, args.batches)
+        return
+
+    view = LiveView(args.path, {})
+    while True:
+        start = time.perf_counter()
+        new_orders = view.poll()
+        elapsed = time.perf_counter() - start
+        snapshot = view.snapshot()
+        if snapshot['orders']:
+            kpis = snapshot['kpis']
+            print(f"📡 +{new_orders:,} orders folded in {elapsed * 1000:.1f}ms | Orders: {kpis['total_orders']:,} | "
+                  f"Sales: ${kpis['total_sales']:,.0f} | Customers: {kpis['unique_customers']:,}")
+        time.sleep(args.interval)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Multi-Session Load Test Harness
+Objective: Measure rerun latency percentiles, throughput and peak RSS as concurrent sessions grow
+
+Usage:
+    python dashboard_loadtest.py --concurrency 1 2 4 8 --steps 10
+    python dashboard_loadtest.py --mode engine --concurrency 1 4 16
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+
+import dashboard_engine as engine
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard_app.py')
+
+# Sidebar widget labels in dashboard_app.py
+WIDGET_LABELS = {
+    'date_range': "Select Date Range",
+    'regions': "Select Region(s)",
+    'categories': "Select Product Category",
+    'segments': "Select Customer Segment",
+    'sales_rep': "Select Sales Representative"
+}
+
+# =============================================================================
+# FILTER-CHANGE SCENARIOS
+# =============================================================================
+
+def build_session_script(df, steps, seed):
+    """Realistic sequence of filter changes for one simulated user"""
+
+    rng = random.Random(seed)
+    options = engine.get_filter_options(df)
+    min_date, max_date = df['Date'].min().date(), df['Date'].max().date()
+    script = []
+
+    for _ in range(steps):
+        action = rng.choice(['regions', 'categories', 'segments', 'sales_rep', 'date_range', 'reset'])
+
+        if action == 'date_range':
+            days = rng.choice([30, 90, 365])
+            start = min_date + timedelta(days=rng.randint(0, (max_date - min_date).days - days))
+            script.append({'date_range': (start, start + timedelta(days=days))})
+        elif action == 'sales_rep':
+            script.append({'sales_rep': rng.choice(options['sales_rep'])})
+        elif action == 'reset':
+            script.append({
+                'date_range': (min_date, max_date),
+                'regions': ['All'],
+                'categories': ['All'],
+                'segments': ['All'],
+                'sales_rep': 'All'
+            })
+        else:
+            values = options[action][1:]
+            script.append({action: rng.sample(values, rng.randint(1, min(2, len(values))))})
+
+    return script
+
+# =============================================================================
+# SESSION DRIVERS
+# =============================================================================
+
+class AppTestSession:
+    def __init__(self, timeout=120):
+        """One headless browser session of the Streamlit app"""
+        from streamlit.testing.v1 import AppTest
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+    def _widget(self, name):
+        elements = {
+            'date_range': self.app.date_input,
+            'regions': self.app.multiselect,
+            'categories': self.app.multiselect,
+            'segments': self.app.multiselect,
+            'sales_rep': self.app.selectbox
+        }[name]
+        return next(w for w in elements if w.label == WIDGET_LABELS[name])
+
+    def start(self):
+        self.app.run()
+
+    def apply(self, changes):
+        for name, value in changes.items():
+            self._widget(name).set_value(value)
+        self.app.run()
+        if self.app.exception:
+            raise RuntimeError(self.app.exception[0].message)
+
+class EngineSession:
+    def __init__(self, df):
+        """Local stand-in: the same load/filter/KPI/figure work without a Streamlit runtime"""
+        from dashboard_charts import create_dashboard_figures
+        self.df = df
+        self.build_figures = create_dashboard_figures
+        self.filters = dict(engine.DEFAULT_FILTERS)
+
+    def start(self):
+        self.apply({})
+
+    def apply(self, changes):
+        self.filters.update(changes)
+        filtered_df = engine.apply_filters(self.df, self.filters)
+        if len(filtered_df) == 0:
+            return
+        engine.compute_dashboard_aggregates(self.df, filtered_df)
+        for fig in self.build_figures(filtered_df).values():
+            fig.to_json()
+
+# =============================================================================
+# LOAD TEST
+# =============================================================================
+
+def current_rss_mb():
+    """Resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError):
+        # Not Linux: fall back to the lifetime peak (bytes on macOS)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 ** 2
+
+def run_level(concurrency, steps, mode, df, seed=0):
+    """Run `concurrency` sessions in parallel and collect rerun latencies"""
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    peak_rss = [current_rss_mb()]
+    done = threading.Event()
+
+    def sample_rss():
+        while not done.is_set():
+            peak_rss[0] = max(peak_rss[0], current_rss_mb())
+            done.wait(0.05)
+
+    def run_session(session_id):
+        try:
+            session = AppTestSession() if mode == 'apptest' else EngineSession(df)
+            session.start()
+            for changes in build_session_script(df, steps, seed * 1000 + session_id):
+                start = time.perf_counter()
+                session.apply(changes)
+                elapsed = time.perf_counter() - start
+                with lock:
+                    latencies.append(elapsed)
+        except Exception as exc:
+            with lock:
+                errors.append(repr(exc))
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+
+    threads = [threading.Thread(target=run_session, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    done.set()
+    sampler.join()
+
+    result = {
+        'concurrency': concurrency,
+        'mode': mode,
+        'reruns': len(latencies),
+        'errors': errors,
+        'wall_seconds': wall,
+        'throughput_reruns_per_sec': len(latencies) / wall if wall > 0 else 0.0,
+        'peak_rss_mb': peak_rss[0]
+    }
+    for pct in [50, 95, 99]:
+        result[f'p{pct}_ms'] = float(np.percentile(latencies, pct) * 1000) if latencies else None
+
+    return result
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Run the load test at each concurrency level"""
+
+    parser = argparse.ArgumentParser(description="Load test the dashboard with concurrent simulated sessions")
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 2, 4, 8], help="Session counts to test")
+    parser.add_argument('--steps', type=int, default=10, help="Filter changes per session")
+    parser.add_argument('--mode', choices=['apptest', 'engine'], default='apptest',
+                        help="Drive the Streamlit script (AppTest) or the engine-only stand-in")
+    parser.add_argument('--seed', type=int, default=0, help="Scenario seed")
+    parser.add_argument('--output', default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"DASHBOARD LOAD TEST ({args.mode})")
+    print("="*80)
+
+    df = engine.load_sales_data()
+    results = []
+
+    print(f"{'Sessions':>8} {'Reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Reruns/s':>9} {'Peak RSS':>10}")
+    for concurrency in args.concurrency:
+        result = run_level(concurrency, args.steps, args.mode, df, args.seed)
+        results.append(result)
+        print(f"{concurrency:>8} {result['reruns']:>7} {result['p50_ms'] or 0:>9.1f} {result['p95_ms'] or 0:>9.1f} "
+              f"{result['p99_ms'] or 0:>9.1f} {result['throughput_reruns_per_sec']:>9.2f} "
+              f"{result['peak_rss_mb']:>7.0f} MB")
+        for error in result['errors']:
+            print(f"  ⚠️ {error}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✅ Results saved as '{args.output}'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Prefix-Sum Date Arrays
+Objective: O(1) totals for any date range and O(days) moving averages from cumulative daily sums
+"""
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+
+# Measure -> source column (None counts orders)
+PREFIX_MEASURES = {
+    'Net_Sales': 'Net_Sales',
+    'Profit': 'Profit',
+    'Orders': None
+}
+
+# =============================================================================
+# PREFIX SUMS
+# =============================================================================
+
+class PrefixSums:
+    def __init__(self, df, dimensions=()):
+        """Cumulative daily sums per measure, optionally split by dimension values"""
+        start = df['Date'].min().normalize()
+        end = df['Date'].max().normalize()
+        self.dates = pd.date_range(start, end, freq='D')
+        n_days = len(self.dates)
+        day_idx = (df['Date'] - start).dt.days.to_numpy()
+
+        # cumsum[m][i] = total of days [0, i), so a range is cumsum[j] - cumsum[i]
+        self.cumsum = {}
+        for measure, column in PREFIX_MEASURES.items():
+            weights = None if column is None else df[column].to_numpy(dtype=float)
+            daily = np.bincount(day_idx, weights=weights, minlength=n_days)
+            self.cumsum[measure] = np.concatenate([[0.0], np.cumsum(daily)])
+
+        # Per-dimension versions: one cumulative row per dimension value
+        self.dimension_values = {}
+        self.dimension_cumsum = {}
+        for dimension in dimensions:
+            codes, uniques = pd.factorize(df[dimension])
+            self.dimension_values[dimension] = {value: i for i, value in enumerate(uniques)}
+            flat_idx = codes * n_days + day_idx
+            self.dimension_cumsum[dimension] = {}
+            for measure, column in PREFIX_MEASURES.items():
+                weights = None if column is None else df[column].to_numpy(dtype=float)
+                daily = np.bincount(flat_idx, weights=weights, minlength=len(uniques) * n_days)
+                daily = daily.reshape(len(uniques), n_days)
+                self.dimension_cumsum[dimension][measure] = np.concatenate(
+                    [np.zeros((len(uniques), 1)), np.cumsum(daily, axis=1)], axis=1
+                )
+
+    def _bounds(self, start, end):
+        """Prefix indices covering the inclusive day range [start, end]"""
+        i = self.dates.searchsorted(pd.Timestamp(start).normalize(), side='left')
+        j = self.dates.searchsorted(pd.Timestamp(end).normalize(), side='right')
+        return i, max(i, j)
+
+    def range_total(self, measure, start, end, dimension=None, values=None):
+        """Total of a measure over [start, end], optionally for some dimension values"""
+        i, j = self._bounds(start, end)
+
+        if dimension is None:
+            cumsum = self.cumsum[measure]
+            return float(cumsum[j] - cumsum[i])
+
+        rows = self._dimension_rows(dimension, values)
+        cumsum = self.dimension_cumsum[dimension][measure]
+        return float((cumsum[rows, j] - cumsum[rows, i]).sum())
+
+    def _selection(self, filter_selections):
+        """(dimension, values, start, end) of a selection with at most one dimension filter; None otherwise"""
+        filters = {**engine.DEFAULT_FILTERS, **filter_selections}
+
+        active = []
+        for name, column in engine.FILTER_COLUMNS.items():
+            selected = filters[name]
+            if name == 'sales_rep':
+                if selected != 'All':
+                    active.append((column, [selected]))
+            elif 'All' not in selected and len(selected) > 0:
+                active.append((column, selected))
+
+        if len(active) > 1 or (active and active[0][0] not in self.dimension_cumsum):
+            return None
+        if filters['customers'] is not None:
+            return None
+
+        date_range = filters['date_range']
+        if date_range is not None and len(date_range) == 2:
+            start, end = date_range
+        else:
+            start, end = self.dates[0], self.dates[-1]
+
+        column, values = active[0] if active else (None, None)
+        return column, values, start, end
+
+    def _dimension_rows(self, dimension, values):
+        """Cumulative-array rows of the dimension values present in the data"""
+        return [self.dimension_values[dimension][v] for v in values if v in self.dimension_values[dimension]]
+
+    def _selected_cumsum(self, measure, dimension, values, i, j):
+        """Cumulative daily sums over prefix indices [i, j], for all rows or some dimension values"""
+        if dimension is None:
+            return self.cumsum[measure][i:j + 1]
+        rows = self._dimension_rows(dimension, values)
+        return self.dimension_cumsum[dimension][measure][rows, i:j + 1].sum(axis=0)
+
+    def filtered_total(self, measure, filter_selections):
+        """Total for a sidebar selection using at most one dimension filter; None otherwise"""
+        selection = self._selection(filter_selections)
+        if selection is None:
+            return None
+        column, values, start, end = selection
+        return self.range_total(measure, start, end, column, values)
+
+    def filtered_totals(self, filter_selections):
+        """Every prefix measure's total for a selection (None when filtered_total cannot answer it)"""
+        if self._selection(filter_selections) is None:
+            return None
+        return {measure: self.filtered_total(measure, filter_selections) for measure in PREFIX_MEASURES}
+
+    def moving_average(self, measure, window, filter_selections=None):
+        """N-day trailing moving average over a selection's days with orders (None if not answerable)
+
+        Like daily_moving_average, the window restarts at the selection's first day with orders.
+        """
+        selection = self._selection(filter_selections or {})
+        if selection is None:
+            return None
+        column, values, start, end = selection
+        i, j = self._bounds(start, end)
+
+        # Trim to the first and last day with orders (the extent of the aggregated daily table)
+        orders = np.diff(self._selected_cumsum('Orders', column, values, i, j))
+        active_days = np.flatnonzero(orders)
+        if len(active_days) == 0:
+            return pd.Series([], index=pd.DatetimeIndex([]), name=f'{measure}_MA{window}', dtype=float)
+        i, j = i + active_days[0], i + active_days[-1] + 1
+
+        cumsum = self._selected_cumsum(measure, column, values, i, j)
+        values = _trailing_mean(cumsum - cumsum[0], window)
+        return pd.Series(values, index=self.dates[i:j], name=f'{measure}_MA{window}')
+
+def _trailing_mean(cumsum, window):
+    """Trailing mean for each day: one subtraction per day whatever the window"""
+    idx = np.arange(1, len(cumsum))
+    lower = np.maximum(idx - window, 0)
+    return (cumsum[idx] - cumsum[lower]) / (idx - lower)
+
+def daily_moving_average(daily_sales, measure, window):
+    """Moving average for an already aggregated (sparse) daily table, via prefix sums"""
+
+    dates = pd.date_range(daily_sales['Date'].min(), daily_sales['Date'].max(), freq='D')
+    values = daily_sales.set_index('Date')[measure].reindex(dates, fill_value=0).to_numpy(dtype=float)
+    cumsum = np.concatenate([[0.0], np.cumsum(values)])
+
+    return pd.Series(_trailing_mean(cumsum, window), index=dates, name=f'{measure}_MA{window}')
@@ -0,0 +1,241 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Usage-Driven Cache Pre-Warming
+Objective: Log the filter states users open and precompute the most used ones after a deploy or data reload
+
+Usage:
+    python dashboard_prewarm.py top --log usage.jsonl --top 10
+    python dashboard_prewarm.py compact --log usage.jsonl
+
+Usage log (JSONL, DASHBOARD_USAGE_LOG in the app): one line per selection a session opened
+    {"state": {"filters": {...}, "rfm_segments": [], "entitled": []}, "count": 1}
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+
+# States pre-warmed per dataset version (the app's per-selection caches hold 16 entries)
+PREWARM_TOP = 10
+
+# Budgets of one pre-warm run: wall time, and size of the results it has cached
+PREWARM_SECONDS = 60.0
+PREWARM_MB = 256.0
+
+# =============================================================================
+# FILTER STATES
+# =============================================================================
+
+def usage_state(filter_selections, entitled=(), rfm_segments=(), date_bounds=None):
+    """JSON form of a selection: normalized filters, RFM segment names and the entitlement
+
+    Customer-level slicers are stored by segment name (their Customer_IDs change with every
+    rescoring), and a date range covering the whole dataset as [] so it survives data reloads.
+    """
+    filters = dict(engine.normalize_filters({**filter_selections, 'customers': None}))
+    del filters['customers']
+    if date_bounds is not None and filters['date_range'] == dict(engine.normalize_filters(
+            {'date_range': date_bounds}))['date_range']:
+        filters['date_range'] = ()
+    return {
+        'filters': {name: list(value) if isinstance(value, tuple) else value for name, value in filters.items()},
+        'rfm_segments': sorted(s for s in rfm_segments if s != 'All'),
+        'entitled': [[column, list(values)] for column, values in entitled]
+    }
+
+def state_selection(state, date_bounds):
+    """(filter selections, RFM segments, entitlement) of a logged state, on the current dataset's dates"""
+    filters = state['filters']
+    selections = {
+        'date_range': tuple(filters['date_range']) or tuple(date_bounds),
+        'sales_rep': filters['sales_rep']
+    }
+    for name in ['regions', 'categories', 'segments']:
+        selections[name] = list(filters[name]) or ['All']
+    entitled = tuple((column, tuple(values)) for column, values in state['entitled'])
+    return selections, tuple(state['rfm_segments']), entitled
+
+def state_key(state):
+    """Canonical string of a state (equal selections count together)"""
+    return json.dumps(state, sort_keys=True, separators=(',', ':'))
+
+def default_state(entitled=()):
+    """The view a new session opens: every slicer on 'All' over the whole date range"""
+    return usage_state({}, entitled)
+
+def slice_states(filter_options):
+    """One state per single region and single sales rep (seeds before the log has any)"""
+    states = [usage_state({'regions': [region]}) for region in filter_options['regions'] if region != 'All']
+    states += [usage_state({'sales_rep': rep}) for rep in filter_options['sales_rep'] if rep != 'All']
+    return states
+
+# =============================================================================
+# USAGE LOG
+# =============================================================================
+
+class UsageLog:
+    def __init__(self, path):
+        """Append-only JSONL counts of the filter states sessions open (shared by every session)"""
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, state, count=1):
+        """Append one observation of a state"""
+        line = json.dumps({'state': state, 'count': count}, sort_keys=True) + '\n'
+        with self._lock, open(self.path, 'a') as f:
+            f.write(line)
+
+    def counts(self):
+        """State key -> (state, total count); a line still being written is skipped"""
+        totals, states = Counter(), {}
+        if not os.path.exists(self.path):
+            return {}
+        with self._lock, open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                key = state_key(entry['state'])
+                states[key] = entry['state']
+                totals[key] += entry.get('count', 1)
+        return {key: (states[key], count) for key, count in totals.items()}
+
+    def top_states(self, n=PREWARM_TOP):
+        """The n most used states and their counts, most used first"""
+        ranked = sorted(self.counts().values(), key=lambda item: item[1], reverse=True)
+        return ranked[:n]
+
+    def compact(self):
+        """Rewrite the log as one line per state with its total count (atomic replace)"""
+        counts = self.counts()
+        with self._lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w') as f:
+                for state, count in sorted(counts.values(), key=lambda item: item[1], reverse=True):
+                    f.write(json.dumps({'state': state, 'count': count}, sort_keys=True) + '\n')
+            os.replace(temp_path, self.path)
+        return len(counts)
+
+def candidate_states(usage_log, filter_options, entitlements=((),), n=PREWARM_TOP):
+    """States to pre-warm, in order: default views, logged states by use, then region / rep slices
+
+    Defaults come first since every new session opens one; the slices fill in while the log is short.
+    """
+    states = [default_state(entitled) for entitled in entitlements]
+    if usage_log is not None:
+        states += [state for state, _ in usage_log.top_states(n)]
+    if () in entitlements:
+        states += slice_states(filter_options)
+
+    unique = {}
+    for state in states:
+        unique.setdefault(state_key(state), state)
+    return list(unique.values())[:n]
+
+# =============================================================================
+# PRE-WARM RUNNER
+# =============================================================================
+
+def result_bytes(result):
+    """Approximate in-memory size of a cached result (frames, arrays and containers of them)"""
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=True).sum())
+    if isinstance(result, (pd.Series, pd.Index)):
+        return int(result.memory_usage(deep=True))
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, dict):
+        return sum(result_bytes(value) for value in result.values())
+    if isinstance(result, (list, tuple)):
+        return sum(result_bytes(value) for value in result)
+    return sys.getsizeof(result)
+
+def prewarm(states, warm, seconds=PREWARM_SECONDS, memory_mb=PREWARM_MB):
+    """Call warm(state) for states in order until the time or memory budget is spent
+
+    warm fills the caches of one state and returns what it cached (sized with result_bytes).
+    A state that fails is reported and skipped; the run continues with the next one.
+    """
+    start = time.perf_counter()
+    report = {'warmed': 0, 'failed': 0, 'skipped': 0, 'seconds': 0.0, 'memory_mb': 0.0}
+    for i, state in enumerate(states):
+        if time.perf_counter() - start >= seconds or report['memory_mb'] >= memory_mb:
+            report['skipped'] = len(states) - i
+            break
+        try:
+            report['memory_mb'] += result_bytes(warm(state)) / 1024 ** 2
+            report['warmed'] += 1
+        except Exception as exc:
+            print(f"⚠️ Pre-warm of {state_key(state)} failed: {exc}")
+            report['failed'] += 1
+    report['seconds'] = time.perf_counter() - start
+    return report
+
+class Prewarmer:
+    def __init__(self, states, warm, seconds=PREWARM_SECONDS, memory_mb=PREWARM_MB):
+        """A pre-warm run on a background daemon thread (sessions are served meanwhile)"""
+        self.states = states
+        self.report = None
+        self.thread = threading.Thread(target=self._run, args=(warm, seconds, memory_mb),
+                                       name='dashboard-prewarm', daemon=True)
+
+    def _run(self, warm, seconds, memory_mb):
+        """Thread body: one budgeted pass over the states"""
+        self.report = prewarm(self.states, warm, seconds, memory_mb)
+
+    def start(self):
+        """Begin warming in the background and return self"""
+        self.thread.start()
+        return self
+
+    def join(self, timeout=None):
+        """Wait for the run; returns its report (None while still running)"""
+        self.thread.join(timeout)
+        return self.report
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """List the most used filter states of a usage log, or compact it to one line per state"""
+
+    parser = argparse.ArgumentParser(description="Usage-driven cache pre-warming")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    top_parser = subparsers.add_parser('top', help="Print the most used filter states")
+    top_parser.add_argument('--log', default='usage.jsonl', help="Usage log (JSONL)")
+    top_parser.add_argument('--top', type=int, default=PREWARM_TOP, help="States to list")
+
+    compact_parser = subparsers.add_parser('compact', help="Rewrite the log as one line per state")
+    compact_parser.add_argument('--log', default='usage.jsonl', help="Usage log (JSONL)")
+
+    args = parser.parse_args()
+    usage_log = UsageLog(args.log)
+
+    if args.command == 'compact':
+        print(f"🗜️ {usage_log.compact():,} distinct states in '{args.log}'")
+        return
+
+    counts = usage_log.counts()
+    total = sum(count for _, count in counts.values())
+    print(f"🔥 {total:,} selections logged, {len(counts):,} distinct states; top {args.top}:")
+    for state, count in usage_log.top_states(args.top):
+        filters = {name: value for name, value in state['filters'].items() if value not in ([], 'All')}
+        if state['rfm_segments']:
+            filters['rfm_segments'] = state['rfm_segments']
+        if state['entitled']:
+            filters['entitled'] = state['entitled']
+        print(f"   {count:>8,}  {json.dumps(filters) if filters else 'default view'}")
+
+if __name__ == "__main__":
+    main()
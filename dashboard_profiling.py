@@ -0,0 +1,201 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Hot-Path Stage Profiler
+Objective: Time each dashboard stage (load, filter, aggregate, figure, serialize) per rerun
+"""
+import functools
+import json
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+# Profiler for the current rerun; None means instrumentation is off (near-zero cost)
+_ACTIVE_PROFILER = ContextVar('dashboard_active_profiler', default=None)
+
+# tracemalloc is process-wide: profilers share one tracing session, counted across threads
+_TRACING_LOCK = threading.Lock()
+_TRACING_USERS = 0
+_TRACING_OWNED = False
+# Profilers that ever joined: a stage's peak is its own only if nobody joined while it ran
+_TRACING_JOINS = 0
+
+# =============================================================================
+# MEMORY TRACING
+# =============================================================================
+
+def _acquire_tracing():
+    """Join the shared tracemalloc session, starting it for the first user"""
+    global _TRACING_USERS, _TRACING_OWNED, _TRACING_JOINS
+    with _TRACING_LOCK:
+        if _TRACING_USERS == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACING_OWNED = True
+        _TRACING_USERS += 1
+        _TRACING_JOINS += 1
+
+def _release_tracing():
+    """Leave the shared session; the last user stops tracing if a profiler started it"""
+    global _TRACING_USERS, _TRACING_OWNED
+    with _TRACING_LOCK:
+        _TRACING_USERS -= 1
+        if _TRACING_USERS == 0 and _TRACING_OWNED:
+            tracemalloc.stop()
+            _TRACING_OWNED = False
+
+def _reset_peak():
+    """Reset the traced peak if no other profiler is active; returns a token for _peak_since (None: shared)"""
+    with _TRACING_LOCK:
+        if _TRACING_USERS != 1:
+            return None
+        tracemalloc.reset_peak()
+        return _TRACING_JOINS
+
+def _peak_since(token):
+    """Traced peak since _reset_peak, or None if another profiler traced meanwhile (its allocations count)"""
+    with _TRACING_LOCK:
+        if token is None or token != _TRACING_JOINS:
+            return None
+        return tracemalloc.get_traced_memory()[1]
+
+# =============================================================================
+# STAGE PROFILER
+# =============================================================================
+
+class StageProfiler:
+    def __init__(self, track_memory=True, run_id=None):
+        """Collect stage records for one dashboard rerun"""
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.track_memory = track_memory
+        self.records = []
+        self._stack = []
+
+    @contextmanager
+    def activate(self):
+        """Make this profiler the target of `profiled` functions and `stage()` calls"""
+        if self.track_memory:
+            _acquire_tracing()
+        token = _ACTIVE_PROFILER.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_PROFILER.reset(token)
+            if self.track_memory:
+                _release_tracing()
+
+    @contextmanager
+    def stage(self, name, rows_scanned=None, cache=None):
+        """Time a block; the yielded record can be updated (rows, cache) inside it
+
+        peak_memory_mb is the traced peak above the memory in use at stage entry. tracemalloc is
+        process-wide, so it is None when another profiler traced during the stage.
+        """
+        record = {
+            'run_id': self.run_id,
+            'stage': name,
+            'depth': len(self._stack),
+            'rows_scanned': rows_scanned,
+            'cache': cache,
+            'seconds': None,
+            'peak_memory_mb': None
+        }
+        parent = self._stack[-1] if self._stack else None
+        self.records.append(record)
+        self._stack.append(record)
+
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # The reset below hides the parent's peak so far, so hand it to the parent first
+            if parent is not None and '_child_peak' in parent:
+                parent['_child_peak'] = max(parent['_child_peak'], peak)
+            record['_start_memory'] = current
+            record['_child_peak'] = 0
+            record['_peak_token'] = _reset_peak()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self._stack.pop()
+            if tracing:
+                # reset_peak() in nested stages hides their allocations from us, so fold them back in
+                peak = _peak_since(record.pop('_peak_token'))
+                child_peak = record.pop('_child_peak')
+                start_memory = record.pop('_start_memory')
+                if peak is not None:
+                    peak = max(peak, child_peak)
+                    record['peak_memory_mb'] = max(peak - start_memory, 0) / 1024 ** 2
+                if parent is not None and '_child_peak' in parent:
+                    parent['_child_peak'] = max(parent['_child_peak'], peak or 0)
+
+    def mark_cache_miss(self):
+        """Flag the innermost open stage as a cache miss"""
+        if self._stack:
+            self._stack[-1]['cache'] = 'miss'
+
+    def total_seconds(self):
+        """Wall time of the top-level stages"""
+        return sum(r['seconds'] or 0 for r in self.records if r['depth'] == 0)
+
+    def to_rows(self):
+        """Records as plain dicts (for tables and export)"""
+        return [dict(r) for r in self.records]
+
+    def to_jsonl(self):
+        """Records as JSON lines"""
+        return ''.join(json.dumps({'started_at': self.started_at, **r}) + '\n' for r in self.records)
+
+    def export_jsonl(self, path):
+        """Append this rerun's records to a JSON-lines file"""
+        with open(path, 'a') as f:
+            f.write(self.to_jsonl())
+
+# =============================================================================
+# INSTRUMENTATION HELPERS
+# =============================================================================
+
+def get_active_profiler():
+    """Profiler for the current rerun, or None"""
+    return _ACTIVE_PROFILER.get()
+
+@contextmanager
+def stage(name, rows_scanned=None, cache=None):
+    """Record a stage on the active profiler; a no-op when profiling is off"""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.stage(name, rows_scanned, cache) as record:
+        yield record
+
+def mark_cache_miss():
+    """Call from inside a cached function body: it only runs on a miss"""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is not None:
+        profiler.mark_cache_miss()
+
+def _rows_in(args):
+    """Rows across every DataFrame-like positional argument"""
+    rows = [len(arg) for arg in args if hasattr(arg, 'columns')]
+    return sum(rows) if rows else None
+
+def profiled(stage_name=None):
+    """Decorator recording a function as a stage (rows scanned = DataFrame args)"""
+    def decorator(func):
+        name = stage_name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _ACTIVE_PROFILER.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.stage(name, rows_scanned=_rows_in(args)):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,210 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+RFM Customer Scoring
+Objective: Recency / frequency / monetary scores and segments for every customer, refreshed per new order batch
+
+Usage:
+    python dashboard_rfm.py
+    python dashboard_rfm.py --rows 2000000
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+from dashboard_profiling import profiled
+
+# Scores run 1..RFM_BINS (quintiles)
+RFM_BINS = 5
+
+# Segment of an (R, F) score pair, first matching rule wins
+RFM_SEGMENTS = [
+    'Champions',
+    'At Risk',
+    'Loyal Customers',
+    'New Customers',
+    'Potential Loyalists',
+    'Hibernating',
+    'Need Attention'
+]
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+@profiled()
+def customer_summary(df):
+    """Last order date, order count and net sales per customer (mergeable across batches)"""
+    return df.groupby('Customer_ID', observed=True).agg(
+        Last_Order=('Date', 'max'),
+        Frequency=('Order_ID', 'count'),
+        Monetary=('Net_Sales', 'sum')
+    )
+
+def fold_summaries(batches):
+    """Customer summary of a stream of order batches (state grows with customers, not orders)"""
+    parts = [customer_summary(batch) for batch in batches]
+    if not parts:
+        return customer_summary(pd.DataFrame({'Customer_ID': [], 'Date': pd.to_datetime([]), 'Order_ID': [],
+                                              'Net_Sales': []}))
+    return pd.concat(parts).groupby(level=0).agg({'Last_Order': 'max', 'Frequency': 'sum', 'Monetary': 'sum'})
+
+def _day_numbers(dates):
+    """Dates as integer day numbers (recency is binned on the last order day itself)"""
+    return dates.to_numpy(dtype='datetime64[D]').astype(np.int64)
+
+def quantile_edges(values, bins=RFM_BINS):
+    """Inner quantile edges splitting values into bins groups"""
+    return np.quantile(np.asarray(values, dtype=float), np.linspace(0, 1, bins + 1)[1:-1])
+
+def bin_scores(values, edges):
+    """Score 1..len(edges)+1; ties at an edge take the lower score (many one-order customers stay F=1)"""
+    return 1 + np.searchsorted(edges, np.asarray(values, dtype=float), side='left')
+
+def segment_labels(r, f):
+    """Segment names from R and F scores (vectorized rules)"""
+    top = RFM_BINS - 1
+    conditions = [
+        (r >= top) & (f >= top),
+        (r <= 2) & (f >= top),
+        f >= top,
+        (r >= top) & (f == 1),
+        r >= top,
+        r <= 2
+    ]
+    return np.select(conditions, RFM_SEGMENTS[:-1], default=RFM_SEGMENTS[-1])
+
+class RFMScores:
+    @profiled('build_rfm_scores')
+    def __init__(self, summary, bins=RFM_BINS):
+        """Scores of every customer of a customer_summary; bin edges are fixed here and reused by updates"""
+        self.bins = bins
+        self.summary = summary.copy()
+        self.edges = {
+            'R': quantile_edges(_day_numbers(self.summary['Last_Order']), bins),
+            'F': quantile_edges(self.summary['Frequency'], bins),
+            'M': quantile_edges(self.summary['Monetary'], bins)
+        }
+        self.as_of = self.summary['Last_Order'].max()
+        self.scores = self._score(self.summary)
+        self.revision = 0
+        self._customers = {}
+        self._lock = threading.Lock()
+        self._feed_lock = threading.Lock()
+
+    def _score(self, summary):
+        """R, F, M, RFM code and segment of summary rows against the stored edges"""
+        r = bin_scores(_day_numbers(summary['Last_Order']), self.edges['R'])
+        f = bin_scores(summary['Frequency'], self.edges['F'])
+        m = bin_scores(summary['Monetary'], self.edges['M'])
+        return pd.DataFrame({
+            'R': r, 'F': f, 'M': m,
+            'RFM_Score': r * 100 + f * 10 + m,
+            'Segment': segment_labels(r, f)
+        }, index=summary.index)
+
+    def update(self, new_orders):
+        """Fold new orders into the summaries and rescore only the customers they touch
+
+        Returns the touched Customer_IDs. Edges stay as built; a new dataset version rebuilds them.
+        """
+        if new_orders is None or new_orders.empty:
+            return pd.Index([])
+        partial = customer_summary(new_orders)
+        with self._lock:
+            touched = partial.index
+            # Hash lookups of the touched customers only (no scan of the whole customer index)
+            positions = self.summary.index.get_indexer(touched)
+            known = positions >= 0
+            rows = positions[known]
+
+            merged = partial.copy()
+            before = self.summary.iloc[rows]
+            merged.loc[known, 'Last_Order'] = np.maximum(before['Last_Order'].to_numpy(),
+                                                         partial.loc[known, 'Last_Order'].to_numpy())
+            merged.loc[known, 'Frequency'] += before['Frequency'].to_numpy()
+            merged.loc[known, 'Monetary'] += before['Monetary'].to_numpy()
+            scored = self._score(merged)
+
+            # Existing customers are updated in place; only brand-new ones grow the tables
+            self.summary.iloc[rows] = merged[known].to_numpy()
+            self.scores.iloc[rows] = scored[known].to_numpy()
+            if not known.all():
+                self.summary = pd.concat([self.summary, merged[~known]])
+                self.scores = pd.concat([self.scores, scored[~known]])
+
+            self.as_of = max(self.as_of, new_orders['Date'].max())
+            self.revision += 1
+            self._customers = {}
+        return touched
+
+    def refresh(self, tail):
+        """Fold whatever a dashboard_live.OrderFileTail has appended (one reader at a time)
+
+        A truncated feed raises EOFError; its orders cannot be taken back, so rebuild the scores.
+        """
+        with self._feed_lock:
+            return self.update(tail.read_new())
+
+    def customers(self, segments):
+        """Sorted Customer_ID tuple of some segments (memoized until the next update)"""
+        key = tuple(sorted(segments))
+        with self._lock:
+            if key not in self._customers:
+                selected = self.scores.index[self.scores['Segment'].isin(key)]
+                self._customers[key] = tuple(sorted(selected))
+            return self._customers[key]
+
+    def table(self):
+        """Per-customer Recency_Days, Frequency, Monetary, scores and segment"""
+        with self._lock:
+            table = self.summary.join(self.scores)
+        table.insert(0, 'Recency_Days', (self.as_of - table.pop('Last_Order')).dt.days)
+        return table
+
+def build_rfm_scores(df, bins=RFM_BINS):
+    """RFM scores of every customer in an orders frame"""
+    return RFMScores(customer_summary(df), bins)
+
+def segment_metrics(scores, customer_months):
+    """Customers, net sales and sales share per segment for the filtered orders' customers"""
+    sales = customer_months.groupby('Customer_ID')['Net_Sales'].sum()
+    segments = scores.scores['Segment'].reindex(sales.index).fillna('Unscored')
+    table = sales.groupby(segments.to_numpy()).agg(['size', 'sum'])
+    table.columns = ['Customers', 'Net_Sales']
+    table['Share'] = table['Net_Sales'] / table['Net_Sales'].sum() * 100
+    order = [s for s in RFM_SEGMENTS + ['Unscored'] if s in table.index]
+    return table.loc[order].rename_axis('Segment').reset_index()
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Score a dataset, then time an incremental refresh with one new day of orders"""
+
+    parser = argparse.ArgumentParser(description="RFM customer scoring")
+    parser.add_argument('--rows', type=int, default=None, help="Generate this many rows (default: 5,000-row dataset)")
+    args = parser.parse_args()
+
+    df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+    last_day = df['Date'].max()
+    history, new_orders = df[df['Date'] < last_day], df[df['Date'] == last_day]
+
+    start = time.perf_counter()
+    scores = build_rfm_scores(history)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    touched = scores.update(new_orders)
+    refreshed = time.perf_counter() - start
+
+    print(f"🧮 {len(scores.scores):,} customers scored in {built * 1000:.0f}ms; "
+          f"{len(new_orders):,} new orders rescored {len(touched):,} customers in {refreshed * 1000:.1f}ms")
+    print(scores.scores['Segment'].value_counts().reindex(RFM_SEGMENTS, fill_value=0).to_string())
+
+if __name__ == "__main__":
+    main()
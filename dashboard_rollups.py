@@ -0,0 +1,157 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Multi-Grain Time Rollups
+Objective: Daily/weekly/monthly/quarterly/yearly rollups with vectorized YoY, MoM and period-to-date comparisons
+"""
+import pandas as pd
+
+import dashboard_engine as engine
+
+# Grain -> pandas frequency of each period's start date
+ROLLUP_GRAINS = {
+    'daily': 'D',
+    'weekly': 'W-MON',
+    'monthly': 'MS',
+    'quarterly': 'QS',
+    'yearly': 'YS'
+}
+
+# Period code used to label each grain (to_period)
+GRAIN_PERIODS = {'daily': 'D', 'weekly': 'W-SUN', 'monthly': 'M', 'quarterly': 'Q', 'yearly': 'Y'}
+
+# Slicer dimensions kept in every rollup so sidebar filters still apply
+ROLLUP_DIMENSIONS = list(engine.FILTER_COLUMNS.values())
+
+ROLLUP_MEASURES = ['Net_Sales', 'Profit', 'Gross_Sales', 'Orders']
+
+COMPARISON_MODES = {
+    'pop': 'Previous period',
+    'yoy': 'Year over year',
+    'ytd': 'Year to date vs prior year',
+    'qtd': 'Quarter to date vs prior year',
+    'mtd': 'Month to date vs prior year',
+    'rolling': 'Trailing average of prior periods'
+}
+
+# Periods averaged by the 'rolling' comparison at each grain (about a week, a month, a quarter...)
+ROLLING_WINDOWS = {'daily': 7, 'weekly': 4, 'monthly': 3, 'quarterly': 4, 'yearly': 3}
+
+# Period-to-date mode -> reset period, and the grains fine enough to accumulate within it
+PERIOD_TO_DATE = {
+    'ytd': ('Y', ['daily', 'weekly', 'monthly', 'quarterly']),
+    'qtd': ('Q', ['daily', 'weekly', 'monthly']),
+    'mtd': ('M', ['daily', 'weekly'])
+}
+
+# =============================================================================
+# ROLLUP CONSTRUCTION
+# =============================================================================
+
+def build_time_rollups(df):
+    """Build one rollup table per grain; coarser grains are summed from the daily table"""
+
+    return rollups_from_daily(daily_rollup(df), (df['Date'].min(), df['Date'].max()))
+
+def daily_rollup(df):
+    """Daily totals per slicer-dimension combination (also foldable batch by batch)"""
+
+    return df.groupby(['Date'] + ROLLUP_DIMENSIONS, observed=True).agg(
+        Net_Sales=('Net_Sales', 'sum'),
+        Profit=('Profit', 'sum'),
+        Gross_Sales=('Gross_Sales', 'sum'),
+        Orders=('Order_ID', 'count')
+    ).reset_index()
+
+def rollups_from_daily(daily, date_bounds):
+    """Derive the weekly..yearly tables from the daily rollup"""
+
+    rollups = {'daily': daily}
+    for grain in ['weekly', 'monthly', 'quarterly', 'yearly']:
+        period_start = daily['Date'].dt.to_period(GRAIN_PERIODS[grain]).dt.start_time
+        rollups[grain] = daily.assign(Date=period_start).groupby(
+            ['Date'] + ROLLUP_DIMENSIONS, observed=True
+        )[ROLLUP_MEASURES].sum().reset_index()
+
+    rollups['date_bounds'] = date_bounds
+    return rollups
+
+def rollup_series(rollups, grain, filter_selections, measure='Net_Sales'):
+    """Dense per-period series for the filtered slice, across the full history"""
+
+    if filter_selections.get('customers') is not None:
+        raise ValueError("Time comparisons are not available for a customer-level selection")
+
+    # Comparisons need periods before the selected window, so dates only trim the output later
+    dim_filters = {**filter_selections, 'date_range': ()}
+    table = engine.apply_filters(rollups[grain], dim_filters)
+
+    start, end = rollups['date_bounds']
+    freq = ROLLUP_GRAINS[grain]
+    index = pd.date_range(
+        pd.Timestamp(start).to_period(GRAIN_PERIODS[grain]).start_time,
+        end,
+        freq=freq
+    )
+
+    return table.groupby('Date')[measure].sum().reindex(index, fill_value=0)
+
+# =============================================================================
+# COMPARISONS
+# =============================================================================
+
+def _shift_years(series, grain):
+    """Value of the same period one year earlier, aligned by date (NaN when missing)"""
+    if grain == 'weekly':
+        # Week starts do not land on the same date a year apart; compare week 52 back
+        return series.shift(52).to_numpy()
+    return series.reindex(series.index - pd.DateOffset(years=1)).to_numpy()
+
+def compare_periods(series, grain, mode='pop', window=None):
+    """Current vs comparison values per period, computed by aligned shifts on the rollup
+
+    'rolling' compares each period with the mean of the window periods before it (the current
+    period excluded); window defaults to the grain's ROLLING_WINDOWS entry.
+    """
+
+    if mode == 'pop':
+        current = series
+        comparison = series.shift(1).to_numpy()
+    elif mode == 'yoy':
+        current = series
+        comparison = _shift_years(series, grain)
+    elif mode in PERIOD_TO_DATE:
+        reset_period, grains = PERIOD_TO_DATE[mode]
+        if grain not in grains:
+            raise ValueError(f"{COMPARISON_MODES[mode]} needs a grain finer than the period ({', '.join(grains)})")
+        current = series.groupby(series.index.to_period(reset_period)).cumsum()
+        comparison = _shift_years(current, grain)
+    elif mode == 'rolling':
+        current = series
+        window = window or ROLLING_WINDOWS[grain]
+        comparison = series.shift(1).rolling(window, min_periods=1).mean().to_numpy()
+    else:
+        raise ValueError(f"Unknown comparison mode: {mode}")
+
+    result = pd.DataFrame({
+        'Period': series.index,
+        'Current': current.to_numpy(),
+        'Comparison': comparison
+    })
+    result['Change'] = result['Current'] - result['Comparison']
+    result['Change_Pct'] = (result['Change'] / result['Comparison'].where(result['Comparison'] != 0)) * 100
+
+    return result
+
+def period_comparison(rollups, grain, mode, filter_selections, measure='Net_Sales', window=None):
+    """Comparison table for the sidebar selection, trimmed to the selected date range"""
+
+    series = rollup_series(rollups, grain, filter_selections, measure)
+    result = compare_periods(series, grain, mode, window)
+
+    date_range = filter_selections.get('date_range')
+    if date_range is not None and len(date_range) == 2:
+        start_date, end_date = pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1])
+        period_start = start_date.to_period(GRAIN_PERIODS[grain]).start_time
+        result = result[(result['Period'] >= period_start) & (result['Period'] <= end_date)]
+
+    return result.reset_index(drop=True)
@@ -0,0 +1,135 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+What-If Scenarios
+Objective: Net sales, profit and margin under many discount-cap and cost-change scenarios in one broadcast
+
+Usage:
+    python dashboard_scenarios.py
+    python dashboard_scenarios.py --rows 5000000 --scenarios 50
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+from dashboard_profiling import profiled
+
+# A scenario is one or more rule rows sharing a name; each rule applies to one category and region
+# ('All' for every one). Max_Discount_Pct caps order discounts (blank: unchanged), Cost_Change_Pct
+# scales costs. Rules of a scenario combine: the lowest cap and the summed cost changes apply.
+SCENARIO_COLUMNS = ['Scenario', 'Product_Category', 'Region', 'Max_Discount_Pct', 'Cost_Change_Pct']
+
+DEFAULT_SCENARIOS = pd.DataFrame([
+    ('Cap Electronics discounts at 5%', 'Electronics', 'All', 5.0, 0.0),
+    ('No discounts', 'All', 'All', 0.0, 0.0),
+    ('Costs +3% in North', 'All', 'North', None, 3.0),
+    ('Costs +3% everywhere', 'All', 'All', None, 3.0),
+    ('Cap 5% and costs +3%', 'All', 'All', 5.0, 3.0)
+], columns=SCENARIO_COLUMNS)
+
+BASELINE = 'Baseline'
+
+# =============================================================================
+# SCENARIO EVALUATION
+# =============================================================================
+
+def scenario_rules(scenarios, cells):
+    """Per-rule arrays: (scenario names, rule -> scenario codes, scope[rule, cell], caps, cost changes)"""
+    rules = scenarios.dropna(subset=['Scenario'])
+    rules = rules[rules['Scenario'].astype(str).str.strip() != '']
+    codes, names = pd.factorize(rules['Scenario'].astype(str))
+
+    # Rule scopes compare integer codes, not strings, across the rule x cell grid
+    # (-1: a value with no cells in the selection, -2: 'All')
+    scope = np.ones((len(rules), len(cells)), dtype=bool)
+    for column in ['Product_Category', 'Region']:
+        cell_codes, values = pd.factorize(cells[column].astype(str))
+        selected = rules[column].fillna('All').astype(str)
+        rule_codes = np.where(selected == 'All', -2, pd.Index(values).get_indexer(selected))
+        scope &= (rule_codes[:, None] == -2) | (rule_codes[:, None] == cell_codes[None, :])
+
+    caps = pd.to_numeric(rules['Max_Discount_Pct'], errors='coerce').to_numpy(dtype=float) / 100
+    cost_changes = pd.to_numeric(rules['Cost_Change_Pct'], errors='coerce').fillna(0).to_numpy(dtype=float) / 100
+    return list(names), codes, scope, np.where(np.isnan(caps), np.inf, caps), cost_changes
+
+@profiled()
+def evaluate_scenarios(cells, scenarios):
+    """Net_Sales, Profit and Margin of the baseline and every scenario, as one scenario x cell broadcast
+
+    cells are the selection's totals per category, region and discount (engine.aggregate_scenario_cells).
+    Profit here is net sales - cost for the baseline and every scenario (the dataset's Profit column is
+    gross - cost, which no discount cap could move): a lower discount adds the recovered amount to net
+    sales and so to profit once; a cost change moves profit only.
+    """
+    names, codes, scope, caps, cost_changes = scenario_rules(scenarios, cells)
+    n_scenarios = len(names) + 1
+
+    # Row 0 is the baseline; each scenario's rules are reduced into its row (rules grouped by scenario)
+    cap = np.full((n_scenarios, len(cells)), np.inf)
+    cost_change = np.zeros((n_scenarios, len(cells)))
+    if len(codes):
+        order = np.argsort(codes, kind='stable')
+        starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+        cap[1:] = np.minimum.reduceat(np.where(scope, caps[:, None], np.inf)[order], starts, axis=0)
+        cost_change[1:] = np.add.reduceat(np.where(scope, cost_changes[:, None], 0.0)[order], starts, axis=0)
+
+    discount = cells['Discount'].to_numpy(dtype=float)
+    gross = cells['Gross_Sales'].to_numpy(dtype=float)
+    recovered = gross * (discount - np.minimum(discount, cap))
+    extra_cost = cells['Cost'].to_numpy(dtype=float) * cost_change
+
+    net_sales = cells['Net_Sales'].sum() + recovered.sum(axis=1)
+    profit = net_sales - cells['Cost'].sum() - extra_cost.sum(axis=1)
+    table = pd.DataFrame({
+        'Scenario': [BASELINE] + names,
+        'Net_Sales': net_sales,
+        'Profit': profit,
+        'Margin': np.where(net_sales != 0, profit / np.where(net_sales != 0, net_sales, 1) * 100, np.nan)
+    })
+    table['Net_Sales_Change'] = table['Net_Sales'] - net_sales[0]
+    table['Profit_Change'] = table['Profit'] - profit[0]
+    return table
+
+def random_scenarios(n, seed=42):
+    """n single-rule scenarios over random categories, regions, caps and cost changes (benchmarks)"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Scenario': [f'Scenario {i + 1}' for i in range(n)],
+        'Product_Category': rng.choice(['All'] + engine.CATEGORIES, n),
+        'Region': rng.choice(['All'] + engine.REGIONS, n),
+        'Max_Discount_Pct': np.where(rng.random(n) < 0.5, rng.integers(0, 11, n).astype(float), np.nan),
+        'Cost_Change_Pct': rng.integers(-5, 6, n).astype(float)
+    })
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Evaluate one and many scenarios on a dataset's cells and compare the timings"""
+
+    parser = argparse.ArgumentParser(description="Batched what-if scenarios")
+    parser.add_argument('--rows', type=int, default=None, help="Generate this many rows (default: 5,000-row dataset)")
+    parser.add_argument('--scenarios', type=int, default=50, help="Random scenarios to evaluate in one call")
+    args = parser.parse_args()
+
+    df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+
+    start = time.perf_counter()
+    cells = engine.aggregate_scenario_cells(df)
+    aggregated = time.perf_counter() - start
+
+    timings = {}
+    for label, scenarios in [('1', random_scenarios(1)), (str(args.scenarios), random_scenarios(args.scenarios))]:
+        start = time.perf_counter()
+        evaluate_scenarios(cells, scenarios)
+        timings[label] = time.perf_counter() - start
+
+    print(f"🧪 {len(df):,} orders -> {len(cells):,} cells in {aggregated * 1000:.0f}ms; scenarios evaluated in "
+          + ", ".join(f"{elapsed * 1000:.1f}ms ({label})" for label, elapsed in timings.items()))
+    print(evaluate_scenarios(cells, DEFAULT_SCENARIOS).round(1).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
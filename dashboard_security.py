@@ -0,0 +1,207 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Row-Level Security
+Objective: Limit each user to the rows of their role (own Sales_Rep, own Region), compiled once per entitlement
+
+Usage:
+    python dashboard_security.py
+    python dashboard_security.py --rows 2000000 --roles roles.json
+
+Roles file (JSON, DASHBOARD_ROLES in the app): user -> role and the values it may see
+    {
+        "alice": {"role": "rep", "values": ["Alice Johnson"]},
+        "dana": {"role": "director", "values": ["North", "East"]},
+        "ceo": {"role": "admin"}
+    }
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+from dashboard_profiling import profiled
+
+# Role -> column its values restrict (None: every row)
+ROLES = {
+    'admin': None,
+    'director': 'Region',
+    'rep': 'Sales_Rep'
+}
+
+# An entitlement is a tuple of (column, allowed values) pairs; this one allows every row
+UNRESTRICTED = ()
+
+# =============================================================================
+# ROLES AND ENTITLEMENTS
+# =============================================================================
+
+def entitlement(role, values=()):
+    """Hashable entitlement of a role (users with the same one share compiled rows and cached results)"""
+    if role not in ROLES:
+        raise ValueError(f"Unknown role '{role}' (expected one of: {', '.join(ROLES)})")
+    column = ROLES[role]
+    if column is None:
+        return UNRESTRICTED
+    values = tuple(sorted(set(values)))
+    if not values:
+        raise ValueError(f"Role '{role}' needs at least one {column} value")
+    if column == 'Sales_Rep' and len(values) != 1:
+        # The Sales Rep slicer holds a single rep
+        raise ValueError(f"Role 'rep' sees exactly one Sales_Rep, got {len(values)}")
+    return ((column, values),)
+
+def load_roles(path):
+    """User -> entitlement from a roles JSON file"""
+    with open(path) as f:
+        users = json.load(f)
+    return {user: entitlement(spec['role'], spec.get('values', ())) for user, spec in users.items()}
+
+def restrict_filters(filter_selections, entitled):
+    """Sidebar selection narrowed to an entitlement (never wider than it, whatever was asked for)"""
+    filters = {**engine.DEFAULT_FILTERS, **filter_selections}
+    for column, values in entitled:
+        if column == 'Sales_Rep':
+            filters['sales_rep'] = values[0]
+        else:
+            name = next(n for n, c in engine.FILTER_COLUMNS.items() if c == column)
+            selected = filters[name]
+            kept = [v for v in selected if v in values] if 'All' not in selected and len(selected) > 0 else []
+            filters[name] = kept or list(values)
+    return filters
+
+def restrict_options(filter_options, entitled):
+    """Slicer options a user may pick from ('All' then means everything they are entitled to)"""
+    options = dict(filter_options)
+    for column, values in entitled:
+        name = next(n for n, c in engine.FILTER_COLUMNS.items() if c == column)
+        options[name] = list(values) if column == 'Sales_Rep' else ['All'] + list(values)
+    return options
+
+def permitted_labels(dimensions, values, entitled):
+    """Mask over (dimension, value) series labels a user may see: all, or only their entitled series
+
+    Precomputed series (anomalies, forecasts) are company-wide per value; only the entitled
+    column's own values are inside a restricted user's rows.
+    """
+    dimensions, values = np.asarray(dimensions, dtype=object), np.asarray(values, dtype=object)
+    if not entitled:
+        return np.ones(len(dimensions), dtype=bool)
+    mask = np.zeros(len(dimensions), dtype=bool)
+    for column, allowed in entitled:
+        mask |= (dimensions == column) & pd.Index(values).isin(allowed)
+    return mask
+
+@profiled()
+def permitted_rows(df, entitled):
+    """Positions of the rows an entitlement allows (compile once, then take or intersect)"""
+    mask = np.ones(len(df), dtype=bool)
+    for column, values in entitled:
+        codes, uniques = pd.factorize(df[column])
+        # One membership test per distinct value, then an integer lookup per row
+        mask &= pd.Index(uniques).isin(values)[codes] & (codes >= 0)
+    return np.flatnonzero(mask)
+
+# =============================================================================
+# SECURED BACKEND
+# =============================================================================
+
+class SecuredBackend:
+    def __init__(self, backend, entitled, scoped=False):
+        """Any execution backend with every request narrowed to an entitlement
+
+        Wrapping the backend (not the sidebar) also covers requests built without the slicers,
+        such as the unfiltered KPI window of the cross-filter cube. scoped: the backend's data
+        already holds only the permitted rows (entitled_backend).
+        """
+        self.backend = backend
+        self.entitled = entitled
+        self.scoped = scoped
+        self.name = backend.name
+
+    @property
+    def value_ranges(self):
+        return self.backend.value_ranges
+
+    def __getattr__(self, name):
+        """Backend methods take the filter selection first; each call gets the narrowed selection"""
+        method = getattr(self.backend, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        def restricted(filter_selections, *args, **kwargs):
+            return method(restrict_filters(filter_selections, self.entitled), *args, **kwargs)
+        return restricted
+
+    def kpi_metrics(self, filter_selections):
+        """KPIs with the growth baseline also taken from the permitted rows
+
+        Backends compare with the unfiltered previous period, which for a shared backend is every
+        user's rows; the previous period is re-read through the entitlement instead.
+        """
+        filters = restrict_filters(filter_selections, self.entitled)
+        metrics = self.backend.kpi_metrics(filters)
+        if self.scoped:
+            return metrics
+
+        daily = self.backend.daily_sales(filters)
+        metrics['sales_growth'] = 0
+        if len(daily) > 0:
+            min_date, max_date = daily['Date'].min(), daily['Date'].max()
+            period_days = (max_date - min_date).days
+            if period_days > 30:
+                window = (min_date - pd.Timedelta(days=period_days), min_date - pd.Timedelta(days=1))
+                prev = self.backend.daily_sales(restrict_filters({'date_range': window}, self.entitled))
+                prev_sales = prev['Net_Sales'].sum() if len(prev) > 0 else 1
+                if prev_sales > 0:
+                    metrics['sales_growth'] = ((metrics['total_sales'] - prev_sales) / prev_sales) * 100
+        return metrics
+
+def entitled_backend(df, entitled, **options):
+    """Pandas backend over only an entitlement's rows (later filters scan the permitted rows only)"""
+    if not entitled:
+        return engine.get_backend(df, 'pandas', **options)
+    rows = df.take(permitted_rows(df, entitled))
+    return SecuredBackend(engine.get_backend(rows, 'pandas', **options), entitled, scoped=True)
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Compile every rep and director entitlement and time a filter on their rows vs the full frame"""
+
+    parser = argparse.ArgumentParser(description="Row-level security entitlements")
+    parser.add_argument('--rows', type=int, default=None, help="Generate this many rows (default: 5,000-row dataset)")
+    parser.add_argument('--roles', default=None, help="Roles JSON file (default: one user per rep and region)")
+    args = parser.parse_args()
+
+    df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+    if args.roles:
+        roles = load_roles(args.roles)
+    else:
+        roles = {**{rep: entitlement('rep', [rep]) for rep in engine.SALES_REPS},
+                 **{region: entitlement('director', [region]) for region in engine.REGIONS}}
+
+    selection = {'categories': ['Electronics']}
+    start = time.perf_counter()
+    engine.apply_filters(df, selection)
+    full = time.perf_counter() - start
+
+    print(f"🔒 {len(roles):,} users, {len(set(roles.values())):,} distinct entitlements; "
+          f"full-frame filter {full * 1000:.1f}ms")
+    for entitled in sorted(set(roles.values())):
+        start = time.perf_counter()
+        backend = entitled_backend(df, entitled)
+        compiled = time.perf_counter() - start
+        start = time.perf_counter()
+        rows = backend.count_rows(selection)
+        filtered = time.perf_counter() - start
+        label = ', '.join(f"{column}={'/'.join(values)}" for column, values in entitled) or 'all rows'
+        print(f"   {label:<32} {backend.count_rows({}):>10,} rows compiled in {compiled * 1000:6.1f}ms, "
+              f"filter {filtered * 1000:5.1f}ms -> {rows:,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Mergeable Quantile Sketches
+Objective: Median/P90/P99 of order value and margin for any filter from merged per-cell t-digests
+"""
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+from dashboard_profiling import profiled
+
+# Centroid budget per merged digest (k1 scale: about COMPRESSION / 2 centroids, densest in the tails)
+COMPRESSION = 100
+
+# Stored cells are smaller digests; merging many of them restores the resolution
+CELL_COMPRESSION = 40
+
+# Sketch cells: calendar month x region x category x segment
+# (a single sales rep is a small slice, so its quantiles come from raw rows)
+CELL_DIMENSIONS = ['Region', 'Product_Category', 'Customer_Segment']
+
+# =============================================================================
+# T-DIGEST
+# =============================================================================
+
+def _k_scale(q, compression):
+    """t-digest k1 scale function: small centroids near q=0 and q=1"""
+    return compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+def _group_starts(groups):
+    """Start offset of each run of equal group codes in a sorted array"""
+    return np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if len(groups) else np.array([], dtype=np.int64)
+
+def compress(groups, means, weights, compression=COMPRESSION):
+    """Merge centroids into one t-digest per group code, vectorized across all groups
+
+    Returns (groups, means, weights) of the merged centroids, sorted by group then mean.
+    """
+    order = np.lexsort((means, groups))
+    groups, means, weights = groups[order], means[order], weights[order]
+    if len(groups) == 0:
+        return groups, means, weights
+
+    # Quantile of each centroid's centre within its own group
+    starts = _group_starts(groups)
+    sizes = np.diff(np.r_[starts, len(groups)])
+    cum = np.cumsum(weights)
+    before = np.repeat(np.r_[0.0, cum[starts[1:] - 1]], sizes)
+    total = np.repeat(np.add.reduceat(weights, starts), sizes)
+    q_centre = (cum - before - weights / 2) / total
+
+    # Centroids whose centres fall in the same unit of k merge into one
+    bucket = np.floor(_k_scale(q_centre, compression)).astype(np.int64)
+    boundaries = np.flatnonzero(np.r_[True, (groups[1:] != groups[:-1]) | (bucket[1:] != bucket[:-1])])
+
+    merged_weights = np.add.reduceat(weights, boundaries)
+    merged_means = np.add.reduceat(means * weights, boundaries) / merged_weights
+    return groups[boundaries], merged_means, merged_weights
+
+def digest_quantiles(means, weights, minimum, maximum, quantiles=engine.QUANTILES):
+    """Quantiles of one digest, interpolating between centroid centres (exact min/max at the ends)"""
+    if len(means) == 0:
+        return np.full(len(quantiles), np.nan)
+    total = weights.sum()
+    centres = np.cumsum(weights) - weights / 2
+    positions = np.r_[0.0, centres, total]
+    values = np.r_[minimum, means, maximum]
+    # Rank q * (n - 1) as in numpy's linear quantile, so an uncompressed digest is exact
+    targets = np.asarray(quantiles) * max(total - 1, 0) + min(total, 1) / 2
+    return np.interp(targets, positions, values)
+
+def grouped_quantiles(groups, means, weights, minimum, maximum, quantiles=engine.QUANTILES, compression=COMPRESSION):
+    """Quantiles per group code after merging each group's centroids into one digest
+
+    minimum/maximum map a group code to its exact extremes.
+    """
+    groups, means, weights = compress(groups, means, weights, compression)
+    starts = _group_starts(groups)
+    ends = np.r_[starts[1:], len(groups)]
+    return {
+        groups[start]: digest_quantiles(
+            means[start:end], weights[start:end], minimum[groups[start]], maximum[groups[start]], quantiles
+        )
+        for start, end in zip(starts, ends)
+    }
+
+def quantile_table(results, group_values, group_by=None, quantiles=engine.QUANTILES):
+    """{measure: {group code: quantiles}} -> one row per group value (or a single overall row)"""
+    missing = np.full(len(quantiles), np.nan)
+    table = pd.DataFrame({
+        engine.quantile_column(measure, q): [by_group.get(code, missing)[i] for code in range(len(group_values))]
+        for measure, by_group in results.items()
+        for i, q in enumerate(quantiles)
+    })
+    if group_by is not None:
+        table.insert(0, group_by, group_values)
+    return table
+
+class DigestAccumulator:
+    def __init__(self, group_by=None, compression=COMPRESSION):
+        """Running t-digests per group value, fed batch by batch (state is O(groups x compression))"""
+        self.group_by = group_by
+        self.compression = compression
+        self.group_values = []
+        self.lookup = {}
+        self.centroids = {m: (np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)) for m in engine.QUANTILE_MEASURES}
+        self.minimum = {m: np.zeros(0) for m in engine.QUANTILE_MEASURES}
+        self.maximum = {m: np.zeros(0) for m in engine.QUANTILE_MEASURES}
+
+    def _codes(self, df):
+        """Stable group code of every row (new group values are appended)"""
+        if self.group_by is None:
+            if not self.group_values:
+                self.group_values.append('All')
+            return np.zeros(len(df), dtype=np.int64)
+        for value in pd.unique(df[self.group_by]):
+            if value not in self.lookup:
+                self.lookup[value] = len(self.group_values)
+                self.group_values.append(value)
+        return df[self.group_by].map(self.lookup).to_numpy(dtype=np.int64)
+
+    def add(self, df):
+        """Merge a batch of rows into the digests in O(batch + centroids)"""
+        if df.empty:
+            return self
+        codes = self._codes(df)
+        for measure in engine.QUANTILE_MEASURES:
+            values = df[measure].to_numpy(dtype=float)
+            groups, means, weights = self.centroids[measure]
+            self.centroids[measure] = compress(
+                np.r_[groups, codes], np.r_[means, values], np.r_[weights, np.ones(len(values))], self.compression
+            )
+
+            # Exact extremes per group code (arrays grow with new group values)
+            grow = len(self.group_values) - len(self.minimum[measure])
+            minimum = np.r_[self.minimum[measure], np.full(grow, np.inf)]
+            maximum = np.r_[self.maximum[measure], np.full(grow, -np.inf)]
+            np.minimum.at(minimum, codes, values)
+            np.maximum.at(maximum, codes, values)
+            self.minimum[measure], self.maximum[measure] = minimum, maximum
+        return self
+
+    def table(self):
+        """Quantile table in the shape of engine.aggregate_quantile_metrics"""
+        results = {
+            measure: grouped_quantiles(*self.centroids[measure], self.minimum[measure], self.maximum[measure],
+                                       compression=self.compression)
+            for measure in engine.QUANTILE_MEASURES
+        }
+        table = quantile_table(results, self.group_values or ['All'], self.group_by)
+        if self.group_by is None:
+            return table
+        return table.sort_values(self.group_by).reset_index(drop=True)
+
+# =============================================================================
+# PER-CELL SKETCH STORE
+# =============================================================================
+
+def cell_digests(cell_codes, values, n_cells, compression=CELL_COMPRESSION):
+    """One small digest per cell code: centroids sorted by cell, plus each cell's exact min and max"""
+    cells, means, weights = compress(cell_codes, values, np.ones(len(values)), compression)
+    bounds = pd.Series(values).groupby(cell_codes).agg(['min', 'max']).reindex(range(n_cells))
+    return {
+        'cells': cells,
+        'means': means,
+        'weights': weights,
+        'min': bounds['min'].to_numpy(),
+        'max': bounds['max'].to_numpy()
+    }
+
+def merged_quantiles(digest, cell_mask, cell_groups, extra_groups=None, extra_values=None,
+                     compression=COMPRESSION):
+    """Quantiles per group code from the selected cells' digests plus optional raw values"""
+    if extra_values is None:
+        extra_groups, extra_values = np.zeros(0, dtype=np.int64), np.zeros(0)
+    selected_cells = np.flatnonzero(cell_mask)
+    selected = cell_mask[digest['cells']]
+
+    extremes = pd.DataFrame({
+        'group': np.r_[cell_groups[selected_cells], extra_groups],
+        'min': np.r_[digest['min'][selected_cells], extra_values],
+        'max': np.r_[digest['max'][selected_cells], extra_values]
+    }).groupby('group').agg({'min': 'min', 'max': 'max'})
+
+    return grouped_quantiles(
+        np.r_[cell_groups[digest['cells'][selected]], extra_groups],
+        np.r_[digest['means'][selected], extra_values],
+        np.r_[digest['weights'][selected], np.ones(len(extra_values))],
+        extremes['min'], extremes['max'],
+        compression=compression
+    )
+
+class MonthCells:
+    def __init__(self, df):
+        """(month, region, category, segment) cell code of every row; self.cells holds one row per cell"""
+        keys = pd.DataFrame({'Month': df['Date'].dt.to_period('M'), **{c: df[c] for c in CELL_DIMENSIONS}})
+        self.cell_codes = keys.groupby(list(keys.columns), sort=False).ngroup().to_numpy()
+        _, first_rows = np.unique(self.cell_codes, return_index=True)
+        self.cells = keys.iloc[first_rows].reset_index(drop=True)
+
+    def whole_months(self, filter_selections):
+        """Months entirely inside the selected dates (these come from the cell summaries)"""
+        filters = dict(engine.normalize_filters(filter_selections))
+        if filters['sales_rep'] != 'All' or filters['customers'] is not None:
+            return []
+        months = self.cells['Month'].drop_duplicates().sort_values()
+        if not filters['date_range']:
+            return list(months)
+        start, end = (pd.Timestamp(d) for d in filters['date_range'])
+        return [m for m in months if m.start_time >= start and m.end_time.normalize() <= end]
+
+    def cell_mask(self, filter_selections, months):
+        """Cells of the given months matching the slicers"""
+        filters = dict(engine.normalize_filters(filter_selections))
+        mask = self.cells['Month'].isin(months).to_numpy().copy()
+        for name in ['regions', 'categories', 'segments']:
+            if filters[name]:
+                mask &= self.cells[engine.FILTER_COLUMNS[name]].isin(filters[name]).to_numpy()
+        return mask
+
+    def split(self, filter_selections, filtered_df):
+        """(cell mask, edge rows): whole months come from cells, only the rest of filtered_df is read
+
+        The edge is at most two partial months, or the whole slice of one sales rep or customer set.
+        """
+        months = self.whole_months(filter_selections)
+        cell_mask = self.cell_mask(filter_selections, months)
+        if not months:
+            return cell_mask, filtered_df
+        first, last = months[0].start_time, months[-1].end_time.normalize()
+        return cell_mask, filtered_df[(filtered_df['Date'] < first) | (filtered_df['Date'] > last)]
+
+class QuantileSketches(MonthCells):
+    @profiled('build_quantile_sketches')
+    def __init__(self, df, compression=COMPRESSION, cell_compression=CELL_COMPRESSION):
+        """One t-digest per (month, region, category, segment) cell and measure"""
+        super().__init__(df)
+        self.compression = compression
+        self.digests = {
+            measure: cell_digests(self.cell_codes, df[measure].to_numpy(dtype=float), len(self.cells), cell_compression)
+            for measure in engine.QUANTILE_MEASURES
+        }
+
+    @profiled('sketch_quantiles')
+    def quantile_metrics(self, filter_selections, filtered_df, group_by=None):
+        """Quantiles of a selection: merged cell digests for whole months, raw values for the edge
+
+        group_by must be a cell dimension.
+        """
+        cell_mask, edge = self.split(filter_selections, filtered_df)
+
+        # Cells and edge rows share one code per group value
+        if group_by is None:
+            group_values = ['All']
+            cell_groups = np.zeros(len(self.cells), dtype=np.int64)
+            edge_groups = np.zeros(len(edge), dtype=np.int64)
+        else:
+            group_values = sorted(set(self.cells.loc[cell_mask, group_by]) | set(edge[group_by]))
+            lookup = {value: i for i, value in enumerate(group_values)}
+            cell_groups = self.cells[group_by].map(lookup).fillna(-1).to_numpy(dtype=np.int64)
+            edge_groups = edge[group_by].map(lookup).to_numpy(dtype=np.int64)
+
+        results = {
+            measure: merged_quantiles(self.digests[measure], cell_mask, cell_groups,
+                                      edge_groups, edge[measure].to_numpy(dtype=float), self.compression)
+            for measure in engine.QUANTILE_MEASURES
+        }
+        return quantile_table(results, group_values, group_by)
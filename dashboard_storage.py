@@ -0,0 +1,184 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Partitioned Parquet Storage
+Objective: Persist orders as Year/Month Hive partitions and read only the partitions a date range needs
+
+Usage:
+    python dashboard_storage.py write --output data/sales
+    python dashboard_storage.py write --rows 5000000 --output data/sales_5m
+    python dashboard_storage.py scan --path data/sales --start 2024-08-01 --end 2024-08-31
+"""
+import argparse
+import glob
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+import dashboard_engine as engine
+
+PARTITION_COLUMNS = ['Year', 'Month']
+HIVE_PARTITIONING = ds.partitioning(pa.schema([('Year', pa.int64()), ('Month', pa.int64())]), flavor='hive')
+INFO_FILE = '_dataset_info.json'
+
+# =============================================================================
+# DATASET INFO
+# =============================================================================
+
+def read_dataset_info(root):
+    """Dataset info saved next to the partitions (sidebar needs no data scan)"""
+    with open(os.path.join(root, INFO_FILE)) as f:
+        return json.load(f)
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+def write_partitioned_dataset(df, root, row_group_size=64_000, compression='zstd'):
+    """Write one Parquet file per Year/Month, sorted by Date, with row-group statistics"""
+
+    os.makedirs(root, exist_ok=True)
+    for old_file in glob.glob(os.path.join(root, 'Year=*', 'Month=*', '*.parquet')):
+        os.remove(old_file)
+
+    df = df.sort_values('Date', kind='stable')
+    for (year, month), partition in df.groupby(PARTITION_COLUMNS, sort=True):
+        directory = os.path.join(root, f'Year={year}', f'Month={month}')
+        os.makedirs(directory, exist_ok=True)
+
+        # Partition values live in the path, not the file
+        table = pa.Table.from_pandas(partition.drop(columns=PARTITION_COLUMNS), preserve_index=False)
+        pq.write_table(
+            table,
+            os.path.join(directory, 'part-0.parquet'),
+            row_group_size=row_group_size,
+            compression=compression,
+            write_statistics=True
+        )
+
+    with open(os.path.join(root, INFO_FILE), 'w') as f:
+        json.dump(engine.dataset_info(df), f, indent=2)
+
+# =============================================================================
+# READER (PARTITION PRUNING)
+# =============================================================================
+
+def partitions_for_range(start, end):
+    """(Year, Month) pairs overlapping the inclusive date range"""
+    months = pd.period_range(pd.Timestamp(start).to_period('M'), pd.Timestamp(end).to_period('M'), freq='M')
+    return [(period.year, period.month) for period in months]
+
+def partition_files(root, date_range=None):
+    """Parquet files to open: every partition, or only those overlapping the date range"""
+
+    if date_range is None or len(date_range) != 2:
+        return sorted(glob.glob(os.path.join(root, 'Year=*', 'Month=*', '*.parquet')))
+
+    files = []
+    for year, month in partitions_for_range(*date_range):
+        files += sorted(glob.glob(os.path.join(root, f'Year={year}', f'Month={month}', '*.parquet')))
+    return files
+
+def date_filter(date_range):
+    """Arrow filter for an inclusive date range (None when no range is selected)"""
+
+    if date_range is None or len(date_range) != 2:
+        return None
+    start, end = (pd.Timestamp(d) for d in date_range)
+    return (ds.field('Date') >= pa.scalar(start, type=pa.timestamp('ns'))) & \
+           (ds.field('Date') <= pa.scalar(end, type=pa.timestamp('ns')))
+
+def open_dataset(root, date_range=None):
+    """Arrow dataset over only the partitions a date range needs (None when there are none)"""
+
+    files = partition_files(root, date_range)
+    if not files:
+        return None
+    return ds.dataset(files, format='parquet', partitioning=HIVE_PARTITIONING, partition_base_dir=root)
+
+def read_partitioned_dataset(root, date_range=None, columns=None):
+    """Load the dataset (or a date range of it) as a DataFrame, opening only the needed partitions"""
+
+    dataset = open_dataset(root, date_range)
+    info = read_dataset_info(root)
+    if dataset is None:
+        return pd.DataFrame(columns=columns or info['columns'])
+
+    # Row-group min/max statistics on the sorted Date column skip groups outside the range
+    df = dataset.to_table(columns=columns, filter=date_filter(date_range)).to_pandas()
+    order = [c for c in (columns or info['columns']) if c in df.columns]
+    return df[order].reset_index(drop=True)
+
+def iter_batches(root, date_range=None, columns=None, batch_size=65_536):
+    """Stream the dataset (or a date range of it) as DataFrames of at most batch_size rows"""
+
+    dataset = open_dataset(root, date_range)
+    if dataset is None:
+        return
+
+    # No read-ahead: only one batch is decoded in memory at a time
+    batches = dataset.to_batches(
+        columns=columns,
+        filter=date_filter(date_range),
+        batch_size=batch_size,
+        batch_readahead=0,
+        fragment_readahead=0
+    )
+    for batch in batches:
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+def scan_stats(root, date_range):
+    """Bytes opened for a date range vs the full dataset"""
+
+    all_files = partition_files(root)
+    selected = partition_files(root, date_range)
+    bytes_total = sum(os.path.getsize(f) for f in all_files)
+    bytes_selected = sum(os.path.getsize(f) for f in selected)
+
+    return {
+        'partitions_total': len(all_files),
+        'partitions_selected': len(selected),
+        'bytes_total': bytes_total,
+        'bytes_selected': bytes_selected,
+        'fraction': bytes_selected / bytes_total if bytes_total else 0.0
+    }
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Write a partitioned dataset or report how much of it a date range reads"""
+
+    parser = argparse.ArgumentParser(description="Partitioned Parquet storage for the sales dataset")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    write_parser = subparsers.add_parser('write', help="Write the dataset as Year/Month partitions")
+    write_parser.add_argument('--output', default='data/sales', help="Dataset root directory")
+    write_parser.add_argument('--rows', type=int, default=None,
+                              help="Generate this many rows (default: the reference 5,000-row dataset)")
+    write_parser.add_argument('--row-group-size', type=int, default=64_000, help="Rows per Parquet row group")
+
+    scan_parser = subparsers.add_parser('scan', help="Show partitions and bytes a date range would read")
+    scan_parser.add_argument('--path', default='data/sales', help="Dataset root directory")
+    scan_parser.add_argument('--start', required=True, help="Start date (YYYY-MM-DD)")
+    scan_parser.add_argument('--end', required=True, help="End date (YYYY-MM-DD)")
+
+    args = parser.parse_args()
+
+    if args.command == 'write':
+        df = engine.load_sales_data() if args.rows is None else engine.generate_sales_data(args.rows)
+        write_partitioned_dataset(df, args.output, row_group_size=args.row_group_size)
+        print(f"✅ Wrote {len(df):,} rows to '{args.output}' "
+              f"({len(partition_files(args.output))} Year/Month partitions)")
+    else:
+        stats = scan_stats(args.path, (args.start, args.end))
+        print(f"Partitions: {stats['partitions_selected']} of {stats['partitions_total']}")
+        print(f"Bytes: {stats['bytes_selected']:,} of {stats['bytes_total']:,} ({stats['fraction']:.1%})")
+
+if __name__ == "__main__":
+    main()
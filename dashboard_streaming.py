@@ -0,0 +1,478 @@
+"""
+DATA ANALYTICS INTERNSHIP - TASK 5: INTERACTIVE DASHBOARD DESIGN
+Out-of-Core Streaming Aggregation
+Objective: Fold record batches streamed from disk into the dashboard aggregates with memory bounded by the batch size
+
+Usage:
+    python dashboard_streaming.py --path data/sales
+    python dashboard_streaming.py --path data/sales_5m --batch-size 100000 --start 2024-01-01 --end 2024-06-30
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+import dashboard_engine as engine
+import dashboard_histograms as histograms
+import dashboard_profiling as profiling
+import dashboard_rollups as time_rollups
+import dashboard_sketches as sketches
+import dashboard_storage as storage
+
+DEFAULT_BATCH_SIZE = 65_536
+
+# Batches of partial aggregates queued before they are merged (bounds memory to a few batches)
+COMPACT_EVERY = 8
+
+# Row-level views (scatter, raw table, CSV) keep at most this many filtered rows
+ROW_LIMIT = 50_000
+
+# Group key -> measures summed per batch (means are folded as sum and count)
+GROUPINGS = {
+    'Date': ['Net_Sales', 'Profit', 'Orders'],
+    'Product_Category': ['Net_Sales', 'Profit', 'Orders', 'Profit_Margin'],
+    'Region': ['Net_Sales', 'Profit', 'Orders'],
+    'Sales_Rep': ['Net_Sales', 'Profit', 'Orders', 'Target_Achievement'],
+    'Customer_Segment': ['Net_Sales', 'Profit', 'Orders', 'Customer_Lifetime_Value'],
+    'Product_Name': ['Net_Sales'],
+    'Customer_ID': ['Net_Sales']
+}
+
+# Dimensions that report distinct customers
+DISTINCT_CUSTOMER_DIMENSIONS = ['Region', 'Sales_Rep', 'Customer_Segment']
+
+# Quantile groupings folded in the main pass as t-digests (None = overall)
+QUANTILE_GROUPINGS = [None, 'Region', 'Product_Category']
+
+# =============================================================================
+# STREAMING AGGREGATOR
+# =============================================================================
+
+class StreamingAggregator:
+    def __init__(self, filter_selections, row_limit=ROW_LIMIT, value_ranges=None):
+        """Fold batches for one sidebar selection; state grows with key cardinality, not rows
+
+        value_ranges: histogram bin ranges; histograms are folded only when given.
+        """
+        self.filters = dict(engine.normalize_filters(filter_selections))
+        self.value_ranges = value_ranges
+        self.histograms = {
+            (m, scale): np.zeros(histograms.N_BINS, dtype=np.int64)
+            for m in (engine.HISTOGRAM_MEASURES if value_ranges else []) for scale in histograms.SCALES
+        }
+        self.row_limit = row_limit
+        self.partials = {}
+        self.pending = {}
+        self.rows = []
+        self.rows_kept = 0
+        self.rows_selected = 0
+        self.batches = 0
+        self.quantiles = {group_by: sketches.DigestAccumulator(group_by) for group_by in QUANTILE_GROUPINGS}
+
+    def _fold(self, name, partial):
+        """Queue a batch's partial aggregate; queues are merged every COMPACT_EVERY batches"""
+        self.pending.setdefault(name, []).append(partial)
+        if len(self.pending[name]) >= COMPACT_EVERY:
+            self._compact(name)
+
+    def _compact(self, name):
+        """Merge queued partials into the running total (one hash group-by instead of index alignment)"""
+        parts = self.pending.pop(name, [])
+        if name in self.partials:
+            parts.insert(0, self.partials[name])
+        if parts:
+            combined = pd.concat(parts)
+            self.partials[name] = combined.groupby(level=list(range(combined.index.nlevels))).sum()
+
+    def selection_mask(self, batch):
+        """Rows of the batch matching the dimension slicers (dates are filtered by the scan)"""
+        mask = np.ones(len(batch), dtype=bool)
+        start_end = self.filters['date_range']
+        if start_end:
+            mask &= (batch['Date'] >= pd.Timestamp(start_end[0])).to_numpy()
+        for name in ['regions', 'categories', 'segments']:
+            values = self.filters[name]
+            if values:
+                mask &= batch[engine.FILTER_COLUMNS[name]].isin(values).to_numpy()
+        if self.filters['sales_rep'] != 'All':
+            mask &= (batch['Sales_Rep'] == self.filters['sales_rep']).to_numpy()
+        if self.filters['customers'] is not None:
+            mask &= batch['Customer_ID'].isin(self.filters['customers']).to_numpy()
+        return mask
+
+    def add(self, batch):
+        """Fold one batch in O(batch) time"""
+        self.batches += 1
+
+        # Unfiltered daily sales of the whole scan window, for the KPI previous period
+        self._fold('window_daily', batch.groupby('Date')['Net_Sales'].agg(['sum', 'count']))
+
+        selected = batch[self.selection_mask(batch)]
+        if selected.empty:
+            return
+        self.rows_selected += len(selected)
+        selected = selected.assign(Orders=1)
+
+        self._fold('overall', selected[['Net_Sales', 'Profit', 'Profit_Margin', 'Orders']].sum())
+        for key, measures in GROUPINGS.items():
+            self._fold(key, selected.groupby(key)[measures].sum())
+        for dimension in DISTINCT_CUSTOMER_DIMENSIONS:
+            self._fold(f'customers:{dimension}', selected.groupby([dimension, 'Customer_ID']).size())
+        for accumulator in self.quantiles.values():
+            accumulator.add(selected)
+        for (measure, scale), counts in self.histograms.items():
+            counts += histograms.bin_counts(selected[measure].to_numpy(dtype=float), self.value_ranges[measure], scale)
+
+        if self.rows_kept < self.row_limit:
+            keep = selected.drop(columns='Orders').head(self.row_limit - self.rows_kept)
+            self.rows.append(keep)
+            self.rows_kept += len(keep)
+
+    def _grouped(self, key, renamed):
+        """Folded table for a group key with means resolved and engine column names"""
+        table = self.partials[key].sort_index()
+        table['Orders'] = table['Orders'].astype('int64')
+        for column, mean_name in [('Profit_Margin', 'Avg_Profit_Margin'),
+                                  ('Target_Achievement', 'Avg_Target_Achievement'),
+                                  ('Customer_Lifetime_Value', 'Avg_CLV')]:
+            if column in table:
+                table[mean_name] = table.pop(column) / table['Orders']
+        if f'customers:{key}' in self.partials:
+            table['Customers'] = self.partials[f'customers:{key}'].groupby(level=0).size()
+        return table.reset_index().rename(columns={key: renamed})
+
+    def _kpis(self):
+        """Same definitions as engine.create_kpi_metrics, from the folded totals"""
+        return folded_kpis(self.partials['overall'], self.partials['Date'].index,
+                           self.partials['window_daily'], len(self.partials['Customer_ID']))
+
+    def result(self):
+        """Dashboard aggregates in the same shapes as engine.compute_dashboard_aggregates"""
+        for name in list(self.pending):
+            self._compact(name)
+        rows = pd.concat(self.rows, ignore_index=True) if self.rows else pd.DataFrame()
+        if self.rows_selected == 0:
+            return empty_aggregates(rows, self.histograms)
+
+        category = self._grouped('Product_Category', 'Category')
+        rep = self._grouped('Sales_Rep', 'Sales_Rep')
+        segment = self._grouped('Customer_Segment', 'Segment')
+        regional = self._grouped('Region', 'Region')
+
+        return {
+            'row_count': self.rows_selected,
+            'rows': rows,
+            'kpis': self._kpis(),
+            'daily_sales': self._grouped('Date', 'Date'),
+            'category_metrics': category[['Category', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin']]
+                .sort_values('Net_Sales', ascending=True),
+            'regional_metrics': regional[['Region', 'Net_Sales', 'Profit', 'Orders', 'Customers']],
+            'sales_rep_metrics': rep[['Sales_Rep', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_Target_Achievement']]
+                .sort_values('Net_Sales', ascending=False),
+            'segment_metrics': segment[['Segment', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_CLV']],
+            'top_products': self.partials['Product_Name']['Net_Sales'].sort_values(ascending=False).reset_index(),
+            'top_customers': self.partials['Customer_ID']['Net_Sales'].sort_values(ascending=False).reset_index(),
+            'quantiles': {group_by: accumulator.table() for group_by, accumulator in self.quantiles.items()},
+            'histograms': self.histograms
+        }
+
+def folded_kpis(overall, dates, window_daily, unique_customers):
+    """KPI cards from folded totals: overall sums, the selection's dates and unfiltered daily sum/count"""
+    total_orders = int(overall['Orders'])
+
+    sales_growth = 0
+    min_date, max_date = dates.min(), dates.max()
+    period_days = (max_date - min_date).days
+    if period_days > 30:
+        prev_start = min_date - timedelta(days=period_days)
+        prev = window_daily[(window_daily.index >= prev_start) & (window_daily.index < min_date)]
+        prev_sales = prev['sum'].sum() if prev['count'].sum() > 0 else 1
+        sales_growth = ((overall['Net_Sales'] - prev_sales) / prev_sales) * 100 if prev_sales > 0 else 0
+
+    return {
+        'total_sales': overall['Net_Sales'],
+        'total_profit': overall['Profit'],
+        'avg_profit_margin': overall['Profit_Margin'] / total_orders,
+        'total_orders': total_orders,
+        'avg_order_value': overall['Net_Sales'] / total_orders,
+        'unique_customers': unique_customers,
+        'sales_growth': sales_growth
+    }
+
+def empty_aggregates(rows, histogram_counts=None):
+    """Aggregates of a selection with no matching rows (what the pandas path returns)"""
+    return {
+        'row_count': 0,
+        'rows': rows,
+        'kpis': {
+            'total_sales': 0.0, 'total_profit': 0.0, 'avg_profit_margin': np.nan, 'total_orders': 0,
+            'avg_order_value': np.nan, 'unique_customers': 0, 'sales_growth': 0
+        },
+        'daily_sales': pd.DataFrame(columns=['Date', 'Net_Sales', 'Profit', 'Orders']),
+        'category_metrics': pd.DataFrame(columns=['Category', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin']),
+        'regional_metrics': pd.DataFrame(columns=['Region', 'Net_Sales', 'Profit', 'Orders', 'Customers']),
+        'sales_rep_metrics': pd.DataFrame(
+            columns=['Sales_Rep', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_Target_Achievement']
+        ),
+        'segment_metrics': pd.DataFrame(columns=['Segment', 'Net_Sales', 'Profit', 'Orders', 'Customers', 'Avg_CLV']),
+        'top_products': pd.DataFrame(columns=['Product_Name', 'Net_Sales']),
+        'top_customers': pd.DataFrame(columns=['Customer_ID', 'Net_Sales']),
+        'quantiles': {group_by: sketches.DigestAccumulator(group_by).table() for group_by in QUANTILE_GROUPINGS},
+        'histograms': histogram_counts or {}
+    }
+
+def stream_aggregates(root, filter_selections, batch_size=DEFAULT_BATCH_SIZE, row_limit=ROW_LIMIT,
+                      value_ranges=None):
+    """One pass over the partitions a selection needs (plus the KPI previous period)"""
+
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range']
+    scan_range = engine.kpi_data_window(date_range) if date_range else None
+
+    aggregator = StreamingAggregator(filter_selections, row_limit, value_ranges)
+    with profiling.stage('stream_aggregates') as record:
+        for batch in storage.iter_batches(root, scan_range, batch_size=batch_size):
+            aggregator.add(batch)
+        if record is not None:
+            record['rows_scanned'] = aggregator.rows_selected
+    return aggregator.result()
+
+def stream_drilldown(root, filter_selections, category, product=None,
+                     batch_size=DEFAULT_BATCH_SIZE, row_limit=ROW_LIMIT):
+    """Lazy pass for one drill-down level: a category's products, or one product's orders"""
+
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range'] or None
+    aggregator = StreamingAggregator(filter_selections, row_limit)
+    orders = []
+    kept = 0
+
+    with profiling.stage('stream_drilldown'):
+        for batch in storage.iter_batches(root, date_range, batch_size=batch_size):
+            mask = aggregator.selection_mask(batch) & (batch['Product_Category'] == category).to_numpy()
+            if product is None:
+                selected = batch[mask].assign(Orders=1)
+                aggregator._fold('Product_Name', selected.groupby('Product_Name')[
+                    ['Net_Sales', 'Profit', 'Orders', 'Profit_Margin']
+                ].sum())
+            elif kept < row_limit:
+                selected = batch[mask & (batch['Product_Name'] == product).to_numpy()].head(row_limit - kept)
+                orders.append(selected)
+                kept += len(selected)
+
+    if product is not None:
+        rows = pd.concat(orders, ignore_index=True) if orders else pd.DataFrame(columns=engine.ROW_COLUMNS)
+        return engine.product_orders(rows, category, product)
+
+    aggregator._compact('Product_Name')
+    if 'Product_Name' not in aggregator.partials:
+        return pd.DataFrame(columns=['Product_Name', 'Net_Sales', 'Profit', 'Orders', 'Avg_Profit_Margin'])
+    table = aggregator._grouped('Product_Name', 'Product_Name')
+    return table.sort_values('Net_Sales', ascending=False)
+
+def stream_quantiles(root, filter_selections, group_by, batch_size=DEFAULT_BATCH_SIZE):
+    """Separate digest pass for a quantile grouping the main pass does not fold"""
+
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range'] or None
+    aggregator = StreamingAggregator(filter_selections)
+    accumulator = sketches.DigestAccumulator(group_by)
+    with profiling.stage('stream_quantiles'):
+        for batch in storage.iter_batches(root, date_range, batch_size=batch_size):
+            accumulator.add(batch[aggregator.selection_mask(batch)])
+    return accumulator.table()
+
+def stream_customer_months(root, filter_selections, batch_size=DEFAULT_BATCH_SIZE):
+    """Customer x month sales folded batch by batch (state grows with active customer-months)"""
+
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range'] or None
+    aggregator = StreamingAggregator(filter_selections)
+    columns = ['Date', 'Customer_ID', 'Net_Sales'] + list(engine.FILTER_COLUMNS.values())
+    with profiling.stage('stream_customer_months'):
+        for batch in storage.iter_batches(root, date_range, columns=columns, batch_size=batch_size):
+            partial = engine.aggregate_customer_months(batch[aggregator.selection_mask(batch)])
+            aggregator._fold('customer_months', partial.set_index(['Customer_ID', 'Month_Index'])['Net_Sales'])
+    aggregator._compact('customer_months')
+    if 'customer_months' not in aggregator.partials:
+        return pd.DataFrame({'Customer_ID': [], 'Month_Index': np.zeros(0, dtype=np.int64), 'Net_Sales': []})
+    return aggregator.partials['customer_months'].reset_index()
+
+def stream_customer_products(root, filter_selections, batch_size=DEFAULT_BATCH_SIZE):
+    """Customer x product order counts folded batch by batch (state grows with distinct pairs)"""
+
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range'] or None
+    aggregator = StreamingAggregator(filter_selections)
+    columns = ['Date', 'Customer_ID', 'Product_Name'] + list(engine.FILTER_COLUMNS.values())
+    with profiling.stage('stream_customer_products'):
+        for batch in storage.iter_batches(root, date_range, columns=columns, batch_size=batch_size):
+            partial = engine.aggregate_customer_products(batch[aggregator.selection_mask(batch)])
+            aggregator._fold('customer_products', partial.set_index(['Customer_ID', 'Product_Name'])['Orders'])
+    aggregator._compact('customer_products')
+    if 'customer_products' not in aggregator.partials:
+        return pd.DataFrame({'Customer_ID': [], 'Product_Name': [], 'Orders': np.zeros(0, dtype=np.int64)})
+    return aggregator.partials['customer_products'].reset_index()
+
+def stream_scenario_cells(root, filter_selections, batch_size=DEFAULT_BATCH_SIZE):
+    """Scenario totals per category, region and discount folded batch by batch"""
+
+    date_range = dict(engine.normalize_filters(filter_selections))['date_range'] or None
+    aggregator = StreamingAggregator(filter_selections)
+    keys = ['Product_Category', 'Region', 'Discount']
+    columns = list(dict.fromkeys(['Date', 'Customer_ID'] + keys + engine.SCENARIO_MEASURES +
+                                 list(engine.FILTER_COLUMNS.values())))
+    with profiling.stage('stream_scenario_cells'):
+        for batch in storage.iter_batches(root, date_range, columns=columns, batch_size=batch_size):
+            partial = engine.aggregate_scenario_cells(batch[aggregator.selection_mask(batch)])
+            aggregator._fold('scenario_cells', partial.set_index(keys))
+    aggregator._compact('scenario_cells')
+    if 'scenario_cells' not in aggregator.partials:
+        return pd.DataFrame(columns=keys + engine.SCENARIO_MEASURES)
+    return aggregator.partials['scenario_cells'].reset_index()
+
+def stream_value_ranges(root, batch_size=DEFAULT_BATCH_SIZE):
+    """Histogram bin ranges from a pass over the histogram columns (datasets written without them)"""
+
+    parts = [
+        pd.DataFrame(engine.value_ranges(batch)).T
+        for batch in storage.iter_batches(root, columns=engine.HISTOGRAM_MEASURES, batch_size=batch_size)
+    ]
+    combined = pd.concat(parts)
+    low = combined[0].groupby(level=0).min()
+    high = combined[2].groupby(level=0).max()
+    low_positive = combined[1].where(combined[1] > 0).groupby(level=0).min().fillna(high)
+    return {m: [low[m], low_positive[m], high[m]] for m in engine.HISTOGRAM_MEASURES}
+
+def stream_time_rollups(root, batch_size=DEFAULT_BATCH_SIZE):
+    """Multi-grain time rollups built batch by batch (state bounded by days x dimension values)"""
+
+    keys = ['Date'] + time_rollups.ROLLUP_DIMENSIONS
+    parts = []
+    for batch in storage.iter_batches(root, batch_size=batch_size):
+        parts.append(time_rollups.daily_rollup(batch))
+        # Merge every COMPACT_EVERY batches with one hash group-by (no per-batch index alignment)
+        if len(parts) > COMPACT_EVERY:
+            parts = [pd.concat(parts).groupby(keys, observed=True, sort=False).sum().reset_index()]
+
+    daily = pd.concat(parts).groupby(keys, observed=True).sum().reset_index()
+    info = storage.read_dataset_info(root)
+    return time_rollups.rollups_from_daily(daily, (pd.Timestamp(info['min_date']), pd.Timestamp(info['max_date'])))
+
+# =============================================================================
+# STREAMING BACKEND
+# =============================================================================
+
+class StreamingBackend:
+    name = 'streaming'
+
+    def __init__(self, source, batch_size=DEFAULT_BATCH_SIZE, row_limit=ROW_LIMIT):
+        """Out-of-core execution over a partitioned dataset root (see dashboard_storage.py)"""
+        if not isinstance(source, str):
+            raise ValueError("The streaming backend reads a partitioned dataset path, not an in-memory frame")
+        self.root = source
+        self.batch_size = batch_size
+        self.row_limit = row_limit
+        self._last = None
+        # Histogram bins: saved with the dataset, or one projected pass for datasets written without them
+        self.value_ranges = storage.read_dataset_info(source).get('value_ranges') \
+            or stream_value_ranges(source, batch_size)
+
+    def aggregates(self, filter_selections):
+        """All aggregates for a selection, reused while the selection is unchanged"""
+        key = engine.normalize_filters(filter_selections)
+        last = self._last
+        if last is None or last[0] != key:
+            last = (key, stream_aggregates(
+                self.root, filter_selections, self.batch_size, self.row_limit, self.value_ranges
+            ))
+            self._last = last
+        return last[1]
+
+    def count_rows(self, filter_selections):
+        return self.aggregates(filter_selections)['row_count']
+
+    def fetch_rows(self, filter_selections, columns=None):
+        """First row_limit matching rows (the full history may not fit in memory)"""
+        rows = self.aggregates(filter_selections)['rows']
+        return rows if columns is None else rows[columns]
+
+    def kpi_metrics(self, filter_selections):
+        return self.aggregates(filter_selections)['kpis']
+
+    def daily_sales(self, filter_selections):
+        return self.aggregates(filter_selections)['daily_sales']
+
+    def category_metrics(self, filter_selections):
+        return self.aggregates(filter_selections)['category_metrics']
+
+    def regional_metrics(self, filter_selections):
+        return self.aggregates(filter_selections)['regional_metrics']
+
+    def sales_rep_metrics(self, filter_selections, top_n=10):
+        return self.aggregates(filter_selections)['sales_rep_metrics'].head(top_n)
+
+    def segment_metrics(self, filter_selections):
+        return self.aggregates(filter_selections)['segment_metrics']
+
+    def top_products(self, filter_selections, top_n=10):
+        return self.aggregates(filter_selections)['top_products'].head(top_n)
+
+    def top_customers(self, filter_selections, top_n=10):
+        return self.aggregates(filter_selections)['top_customers'].head(top_n)
+
+    def customer_months(self, filter_selections):
+        return stream_customer_months(self.root, filter_selections, self.batch_size)
+
+    def customer_products(self, filter_selections):
+        return stream_customer_products(self.root, filter_selections, self.batch_size)
+
+    def scenario_cells(self, filter_selections):
+        return stream_scenario_cells(self.root, filter_selections, self.batch_size)
+
+    def product_metrics(self, filter_selections, category):
+        return stream_drilldown(self.root, filter_selections, category, batch_size=self.batch_size)
+
+    def product_orders(self, filter_selections, category, product):
+        return stream_drilldown(self.root, filter_selections, category, product, self.batch_size, self.row_limit)
+
+    def quantile_metrics(self, filter_selections, group_by=None):
+        quantiles = self.aggregates(filter_selections)['quantiles']
+        if group_by in quantiles:
+            return quantiles[group_by]
+        return stream_quantiles(self.root, filter_selections, group_by, self.batch_size)
+
+    def histogram(self, filter_selections, measure, scale='linear'):
+        counts = self.aggregates(filter_selections)['histograms'][measure, scale]
+        return histograms.histogram_table(counts, self.value_ranges[measure], scale)
+
+# =============================================================================
+# COMMAND LINE INTERFACE
+# =============================================================================
+
+def main():
+    """Stream a partitioned dataset through the dashboard aggregates and report peak memory"""
+
+    parser = argparse.ArgumentParser(description="Out-of-core dashboard aggregation over a partitioned dataset")
+    parser.add_argument('--path', default='data/sales', help="Dataset root written by dashboard_storage.py")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Rows per streamed batch")
+    parser.add_argument('--start', default=None, help="Start date (YYYY-MM-DD)")
+    parser.add_argument('--end', default=None, help="End date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    filter_selections = {'date_range': (args.start, args.end) if args.start and args.end else ()}
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    aggregates = stream_aggregates(args.path, filter_selections, args.batch_size)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"Rows aggregated: {aggregates['row_count']:,}")
+    if aggregates['row_count']:
+        kpis = aggregates['kpis']
+        print(f"Total Sales: ${kpis['total_sales']:,.0f} | Profit: ${kpis['total_profit']:,.0f} | "
+              f"Orders: {kpis['total_orders']:,} | Customers: {kpis['unique_customers']:,}")
+    print(f"Time: {elapsed:.2f}s | Peak memory: {peak / 1024 ** 2:,.1f} MB (batch size {args.batch_size:,})")
+
+if __name__ == "__main__":
+    main()